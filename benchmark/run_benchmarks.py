@@ -0,0 +1,438 @@
+"""Benchmarks for mock install, dispatch, verify and reset.
+
+Run on their own, outside the unit and keyword tests:
+
+    python benchmark/run_benchmarks.py --output results.json
+    python benchmark/run_benchmarks.py --quick --compare results.json
+
+Results are written as JSON together with the Python and Robot Framework
+versions, so runs on different versions can be compared with ``--compare``.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+from time import perf_counter_ns
+
+import robot
+
+from MockLibrary import MockLibrary
+from MockLibrary.order import CallOrder
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESOURCES = os.path.join(ROOT, 'test', 'keyword', 'resources')
+sys.path.insert(0, RESOURCES)
+
+from DynamicLibrary import DynamicLibrary  # pylint: disable=import-error,wrong-import-position,wrong-import-order
+
+# Durations measured by the Benchmark keywords of the generated Robot suites
+_ROBOT_TIMINGS = []
+
+
+def _library_class(keyword_count):
+    """Create a library class with ``keyword_count`` keywords."""
+    namespace = {
+        f'keyword_{index}': lambda self, *args: 'original' for index in range(keyword_count)
+    }
+    return type(f'Library{keyword_count}', (), namespace)
+
+
+def _measure(function, repeat, number):
+    """Run ``function`` ``number`` times per round and return nanoseconds per run."""
+    rounds = []
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        for _ in range(number):
+            function()
+        rounds.append((perf_counter_ns() - start) / number)
+    return rounds
+
+
+def _mock_library(lib, **kwargs):
+    """Create a MockLibrary wrapping ``lib`` without a running Robot Framework."""
+    mock_lib = MockLibrary('Library', **kwargs)
+    mock_lib._library_instance = lib  # pylint: disable=protected-access
+    return mock_lib
+
+
+def _result(name, params, rounds, operations=1):
+    per_operation = [duration / operations for duration in rounds]
+    return {
+        'name': name,
+        'params': params,
+        'rounds': len(per_operation),
+        'min_ns': round(min(per_operation)),
+        'median_ns': round(statistics.median(per_operation)),
+    }
+
+
+def bench_mock_keyword(sizes, repeat):
+    """Mock and reset 1/100/1000 keywords of one library."""
+    results = []
+    for size in sizes:
+        lib = _library_class(size)()
+        names = [f'Keyword {index}' for index in range(size)]
+        mock_lib = _mock_library(lib)
+
+        def mock_all(mock_lib=mock_lib, names=names):
+            for name in names:
+                mock_lib.mock_keyword(name, return_value='mocked')
+            mock_lib.reset_mocks()
+
+        results.append(_result(
+            'mock_keyword', {'keywords': size}, _measure(mock_all, repeat, 1), size
+        ))
+
+        def mock_table(mock_lib=mock_lib, names=names):
+            mock_lib.mock_keywords({name: {'return_value': 'mocked'} for name in names})
+            mock_lib.reset_mocks()
+
+        results.append(_result(
+            'mock_keywords', {'keywords': size}, _measure(mock_table, repeat, 1), size
+        ))
+    return results
+
+
+def bench_mock_state(sizes, repeat):
+    """Mock 1/100/1000 keywords from a JSON mock table file and from a snapshot of it."""
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            lib = _library_class(size)()
+            mock_lib = _mock_library(lib)
+            table = os.path.join(directory, f'mocks-{size}.json')
+            snapshot = os.path.join(directory, f'mocks-{size}.snapshot')
+            rows = [{'args': [str(row)], 'return_value': row} for row in range(10)]
+            with open(table, 'w', encoding='utf-8') as file:
+                json.dump({
+                    f'Keyword {index}': {'responses': rows, 'retention': 'count'}
+                    for index in range(size)
+                }, file)
+            mock_lib.mock_keywords(table)
+            mock_lib.save_mock_state(snapshot)
+            mock_lib.reset_mocks()
+
+            for name, function, path in (
+                ('mock_keywords_file', mock_lib.mock_keywords, table),
+                ('load_mock_state', mock_lib.load_mock_state, snapshot),
+            ):
+                def load_and_reset(function=function, path=path, mock_lib=mock_lib):
+                    function(path)
+                    mock_lib.reset_mocks()
+
+                results.append(_result(
+                    name, {'keywords': size}, _measure(load_and_reset, repeat, 1), size
+                ))
+    return results
+
+
+def bench_reset_mocks(sizes, repeat):
+    """Reset 1/100/1000 mocked keywords, excluding the cost of mocking them."""
+    results = []
+    for size in sizes:
+        lib = _library_class(size)()
+        names = [f'Keyword {index}' for index in range(size)]
+        mock_lib = _mock_library(lib)
+        rounds = []
+        for _ in range(repeat):
+            for name in names:
+                mock_lib.mock_keyword(name, return_value='mocked')
+            start = perf_counter_ns()
+            mock_lib.reset_mocks()
+            rounds.append(perf_counter_ns() - start)
+        results.append(_result('reset_mocks', {'keywords': size}, rounds, size))
+    return results
+
+
+def bench_library_dispatch(repeat, number):
+    """Call a library keyword unmocked, mocked, spied and with faults, and verify its calls."""
+    lib = _library_class(1)()
+    mock_lib = _mock_library(lib)
+    results = [_result(
+        'library_dispatch', {'mocked': False},
+        _measure(lambda: lib.keyword_0(), repeat, number)  # pylint: disable=unnecessary-lambda,no-member
+    )]
+    for retention in ('mock', 'count'):
+        mock_lib.mock_keyword('Keyword 0', return_value='mocked', retention=retention)
+        results.append(_result(
+            'library_dispatch', {'mocked': True, 'retention': retention},
+            _measure(lambda: lib.keyword_0(), repeat, number)  # pylint: disable=unnecessary-lambda,no-member
+        ))
+        results.append(_result(
+            'verify_keyword_called', {'retention': retention},
+            _measure(lambda: mock_lib.verify_keyword_called('Keyword 0'), repeat, number)
+        ))
+        mock_lib.reset_mocks()
+    mock_lib.spy_keyword('Keyword 0')
+    results.append(_result(
+        'library_dispatch', {'spied': True},
+        _measure(lambda: lib.keyword_0(), repeat, number)  # pylint: disable=unnecessary-lambda,no-member
+    ))
+    mock_lib.reset_mocks()
+    # Faults that never wait or fail measure the cost of drawing them
+    mock_lib.mock_keyword(
+        'Keyword 0', return_value='mocked', retention='count',
+        latency='uniform:0,0', failure_rate=0.0, seed=1
+    )
+    results.append(_result(
+        'library_dispatch', {'faults': True},
+        _measure(lambda: lib.keyword_0(), repeat, number)  # pylint: disable=unnecessary-lambda,no-member
+    ))
+    mock_lib.reset_mocks()
+    return results
+
+
+def bench_response_table(sizes, repeat, number):
+    """Call a keyword mocked with a response table of 1/100/1000 rows."""
+    lib = _library_class(1)()
+    mock_lib = _mock_library(lib)
+    results = []
+    for size in sizes:
+        responses = [{'args': [index], 'return_value': index} for index in range(size)]
+        mock_lib.mock_keyword_with_arguments('Keyword 0', responses, retention='count')
+        results.append(_result(
+            'response_table', {'rows': size},
+            _measure(lambda size=size: lib.keyword_0(size - 1), repeat, number)  # pylint: disable=no-member
+        ))
+        mock_lib.reset_mocks()
+    return results
+
+
+def bench_call_order(sizes, repeat, number):
+    """Verify the order of three keywords in journals of 1/100/1000 calls."""
+    results = []
+    for size in sizes:
+        order = CallOrder()
+        begin, query, end = (order.recorder('Library', name) for name in ('Begin', 'Query', 'End'))
+        for _ in range(size):
+            begin()
+            query()
+        end()
+        order.recorder('Library', 'Commit')
+        results.append(_result(
+            'verify_call_order', {'calls': 2 * size + 1}, _measure(
+                lambda order=order: order.verify_order(['Begin', 'Query', 'End']), repeat, number
+            )
+        ))
+        results.append(_result(
+            'verify_not_called_between', {'calls': 2 * size + 1}, _measure(
+                lambda order=order: order.verify_not_called_between('Commit', 'Begin', 'End'),
+                repeat, number
+            )
+        ))
+    return results
+
+
+class _DynamicLibrary:
+    """Dynamic library with ``keyword_count`` keywords."""
+
+    def __init__(self, keyword_count):
+        self._names = [f'keyword_{index}' for index in range(keyword_count)]
+
+    def get_keyword_names(self):
+        """Return the keyword names."""
+        return self._names
+
+    def run_keyword(self, name, args):
+        """Run a keyword."""
+        return name, args
+
+
+def bench_dynamic_dispatch(sizes, repeat, number):
+    """Call an unmocked dynamic keyword with 1/100/1000 other keywords mocked."""
+    results = []
+    for size in sizes:
+        lib = _DynamicLibrary(size + 1)
+        mock_lib = _mock_library(lib)
+        mock_lib.mock_keywords({
+            f'keyword_{index}': {'return_value': 'mocked', 'retention': 'count'}
+            for index in range(size)
+        })
+        results.append(_result(
+            'dynamic_dispatch', {'mocked_keywords': size}, _measure(
+                lambda lib=lib, name=f'keyword_{size}': lib.run_keyword(name, ()), repeat, number
+            )
+        ))
+        mock_lib.reset_mocks()
+    return results
+
+
+def bench_custom_resolver(repeat, number):
+    """Mock and reset a dynamic library keyword through a custom resolver."""
+    resolver = os.path.join(RESOURCES, 'dynamic_library_resolver.py')
+    mock_lib = MockLibrary('DynamicLibrary', custom_resolver_path=resolver)
+
+    def mock_and_reset():
+        # The resolver wraps run_keyword, so every round needs a fresh instance
+        mock_lib._library_instance = DynamicLibrary()  # pylint: disable=protected-access
+        mock_lib.mock_keyword('dynamic_greeting', return_value='mocked')
+        mock_lib.reset_mocks()
+
+    return [_result('custom_resolver', {}, _measure(mock_and_reset, repeat, number))]
+
+
+def bench_library_import(counts, repeat):
+    """Create 1/10/100 MockLibrary instances sharing one custom resolver."""
+    resolver = os.path.join(RESOURCES, 'dynamic_library_resolver.py')
+    results = []
+    for count in counts:
+        def create_all(count=count):
+            for index in range(count):
+                MockLibrary(f'Library{index}', custom_resolver_path=resolver)
+
+        results.append(_result(
+            'library_import', {'instances': count}, _measure(create_all, repeat, 1), count
+        ))
+    return results
+
+
+class Benchmark:
+    """Keywords timing the loops of the generated Robot suites."""
+
+    def __init__(self):
+        self._start = None
+
+    def start_timer(self):
+        """Start timing."""
+        self._start = perf_counter_ns()
+
+    def stop_timer(self, name, calls):
+        """Store the time since ``Start Timer`` under ``name``."""
+        _ROBOT_TIMINGS.append((name, perf_counter_ns() - self._start, int(calls)))
+
+
+def _resource_suite(directory, instances, calls):
+    """Write a suite calling a resource keyword with ``instances`` MockResource mocks active."""
+    with open(os.path.join(directory, 'bench.resource'), 'w', encoding='utf-8') as file:
+        file.write('*** Keywords ***\nTarget\n    RETURN    original\n')
+        for index in range(instances):
+            file.write(f'Filler {index}\n    RETURN    original\n')
+
+    lines = ['*** Settings ***', 'Resource    bench.resource', f'Library    {__name__}.Benchmark']
+    lines += [
+        f'Library    MockResource    bench.resource    AS    Mock{index}'
+        for index in range(max(instances, 1))
+    ]
+    lines += ['', '*** Test Cases ***']
+    for name in ('unmocked', 'mocked'):
+        lines.append(name.title())
+        lines += [
+            f'    Mock{index}.Mock Keyword    Filler {index}    return_value=mocked'
+            for index in range(instances)
+        ]
+        if name == 'mocked':
+            lines.append('    Mock0.Mock Keyword    Target    return_value=mocked')
+        lines += [
+            '    Start Timer',
+            f'    FOR    ${{_}}    IN RANGE    {calls}',
+            '        Target',
+            '    END',
+            f'    Stop Timer    {name}    {calls}',
+            '',
+        ]
+    suite = os.path.join(directory, f'dispatch_{instances}.robot')
+    with open(suite, 'w', encoding='utf-8') as file:
+        file.write('\n'.join(lines))
+    return suite
+
+
+def bench_resource_dispatch(instance_counts, calls, repeat):
+    """Run mocked and unmocked resource keywords with 0..N MockResource mocks active."""
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for instances in instance_counts:
+            suite = _resource_suite(directory, instances, calls)
+            rounds = {'unmocked': [], 'mocked': []}
+            for _ in range(repeat):
+                del _ROBOT_TIMINGS[:]
+                robot.run(
+                    suite, output=None, log=None, report=None,
+                    stdout=io.StringIO(), stderr=io.StringIO(), pythonpath=[directory]
+                )
+                for name, duration, count in _ROBOT_TIMINGS:
+                    rounds[name].append(duration / count)
+            for name, durations in rounds.items():
+                if durations:
+                    results.append(_result(
+                        'resource_dispatch',
+                        {'mocked': name == 'mocked', 'active_instances': instances},
+                        durations
+                    ))
+    return results
+
+
+def run_benchmarks(quick=False):
+    """Run all benchmarks and return the results with their environment."""
+    repeat = 3 if quick else 7
+    sizes = (1, 100) if quick else (1, 100, 1000)
+    number = 1000 if quick else 10000
+    results = []
+    results.extend(bench_mock_keyword(sizes, repeat))
+    results.extend(bench_mock_state(sizes, repeat))
+    results.extend(bench_reset_mocks(sizes, repeat))
+    results.extend(bench_library_dispatch(repeat, number))
+    results.extend(bench_response_table(sizes, repeat, number))
+    results.extend(bench_call_order(sizes, repeat, number))
+    results.extend(bench_dynamic_dispatch(sizes, repeat, number))
+    results.extend(bench_custom_resolver(repeat, number // 10))
+    results.extend(bench_library_import((1, 10) if quick else (1, 10, 100), repeat))
+    results.extend(bench_resource_dispatch(
+        (0, 10) if quick else (0, 10, 100), 200 if quick else 2000, repeat
+    ))
+    return {
+        'environment': {
+            'python': platform.python_version(),
+            'robotframework': robot.version.get_version(),
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+
+
+def compare(baseline, current):
+    """Return lines comparing the median times of two benchmark runs."""
+    def key(result):
+        return result['name'], json.dumps(result['params'], sort_keys=True)
+
+    previous = {key(result): result for result in baseline['results']}
+    lines = [
+        f"{'benchmark':60} {'baseline':>12} {'current':>12} {'ratio':>7}",
+    ]
+    for result in current['results']:
+        old = previous.get(key(result))
+        if old is None:
+            continue
+        ratio = result['median_ns'] / old['median_ns'] if old['median_ns'] else float('inf')
+        name = f"{result['name']} {json.dumps(result['params'], sort_keys=True)}"
+        lines.append(
+            f"{name:60} {old['median_ns']:>10}ns {result['median_ns']:>10}ns {ratio:>7.2f}"
+        )
+    return lines
+
+
+def main(argv=None):
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--quick', action='store_true', help='fewer and smaller rounds')
+    parser.add_argument('--compare', help='results of an earlier run to compare with')
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.quick)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            print('\n'.join(compare(json.load(file), results)), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,12 +1,41 @@
 """Mock library for Robot Framework keyword mocking in unit tests."""
 # pylint: disable=invalid-name
-import importlib.util
+import hashlib
 import inspect
 import os
-from typing import Any, Callable
-from unittest.mock import Mock
+import sys
+from functools import partial
+from typing import Any, Callable, Dict, List, Union
+from weakref import WeakKeyDictionary
 from robot.api.deco import keyword
 from robot.libraries.BuiltIn import BuiltIn
+from .dynamic import (
+    DynamicKeyword, get_keyword_names, is_dynamic, original_run_keyword, remove_dynamic_mock,
+    set_dynamic_mock
+)
+from .engine import ENGINE, library_key
+from .faults import FaultyMock, fault_plan
+from .fixtures import PAYLOAD_CACHE
+from .journal import get_journal
+from .memo import MemoCache, get_memo_info
+from .mock_table import create_mocks, load_mock_table, load_responses, resolve_keywords
+from .naming import normalize_keyword_name
+from .order import CALL_ORDER, get_call_order
+from .recorder import AwaitableMock, CountingMock, create_mock
+from .replay import RecordingCall, ReplayingCall, get_cache
+from .responses import ResponseTable
+from .scopes import MockScopes, library_listeners
+from .snapshot import (
+    check_locations, compiled_spec, load_snapshot, mock_spec, save_snapshot, snapshot_keywords
+)
+from .spy import KeywordSpy, get_spy_calls
+from .stats import create_statistics, get_statistics
+
+# Keyword indexes per library class (or module), shared by all MockLibrary instances
+_KEYWORD_INDEXES = WeakKeyDictionary()
+
+# Resolver classes by absolute path of their file, with the file's mtime
+_RESOLVER_CLASSES = {}
 
 
 def _get_library_instance(library_name_or_alias):
@@ -30,25 +59,102 @@ def _get_library_instance(library_name_or_alias):
     return lib
 
 
+def _build_keyword_index(owner):
+    """Map normalized keyword names of a library class or module to attribute names.
+
+    Only the class dictionaries are walked, so properties are never evaluated.
+    Custom names given with the ``@keyword`` decorator take precedence over
+    plain attribute names.
+    """
+    index = {}
+    custom_names = {}
+    for namespace in reversed(getattr(owner, '__mro__', (owner,))):
+        if namespace is object:
+            continue
+        for name, member in vars(namespace).items():
+            if isinstance(member, (staticmethod, classmethod)):
+                member = member.__func__
+            if not callable(member) or isinstance(member, type):
+                continue
+            robot_name = getattr(member, 'robot_name', None)
+            if robot_name:
+                custom_names[normalize_keyword_name(robot_name)] = name
+            elif not name.startswith('_'):
+                index[normalize_keyword_name(name)] = name
+    index.update(custom_names)
+    return index
+
+
+def _get_keyword_index(lib):
+    """Return the keyword index shared by all instances of the library's class."""
+    owner = lib if inspect.ismodule(lib) else type(lib)
+    index = _KEYWORD_INDEXES.get(owner)
+    if index is None:
+        index = _KEYWORD_INDEXES[owner] = _build_keyword_index(owner)
+    return index
+
+
 def _resolve_original_method(lib, method_name, keyword_name):
     # Try direct attribute lookup first
     try:
         return getattr(lib, method_name), method_name
     except AttributeError:
-        # If not found, search for methods with @keyword decorator custom names
-        for name, method in inspect.getmembers(
-                lib, inspect.ismethod
-        ):
-            if (hasattr(method, 'robot_name') and
-                    method.robot_name.lower() == keyword_name):
-                return getattr(lib, name), name
+        # If not found, look the keyword up in the index, which also
+        # contains methods with @keyword decorator custom names
+        name = _get_keyword_index(lib).get(normalize_keyword_name(keyword_name))
+        if name:
+            return getattr(lib, name), name
 
     return None, method_name
 
 
+def _set_method(lib, method_name, method):
+    # Patch only the wrapped instance, other instances of its class keep
+    # their original methods
+    try:
+        setattr(lib, method_name, method)
+    except AttributeError:
+        # Instances without a __dict__ can only be patched on their class
+        setattr(type(lib), method_name, method)
+
+
+def _uncover_method(lib, method_name, original_method):
+    try:
+        # Uncover the method of the class again
+        delattr(lib, method_name)
+    except AttributeError:
+        setattr(type(lib), method_name, getattr(original_method, '__func__', original_method))
+
+
+def _restore_class_attribute(owner, method_name, attribute):
+    if attribute is None:
+        # Inherited, uncover the method of the base class again
+        delattr(owner, method_name)
+    else:
+        setattr(owner, method_name, attribute)
+
+
+def _is_global(lib):
+    # Robot Framework creates libraries of other scopes again for every test or suite
+    if inspect.ismodule(lib):
+        return True
+    return str(getattr(lib, 'ROBOT_LIBRARY_SCOPE', 'TEST')).upper() == 'GLOBAL'
+
+
+def _library_target(lib):
+    # Snapshots are only loaded into libraries of the class they were saved for
+    if inspect.ismodule(lib):
+        return lib.__name__
+    return f"{type(lib).__module__}.{type(lib).__qualname__}"
+
+
 def _load_custom_resolver(resolver_path: str):
     """Load a custom resolver from a Python file and instantiate it.
 
+    Resolver files are imported once per process and only imported again
+    when they have been modified since. Every file gets its own module name,
+    so several resolvers can be loaded side by side.
+
     Args:
         resolver_path: Relative path to a Python file containing a resolver class
 
@@ -62,18 +168,35 @@ def _load_custom_resolver(resolver_path: str):
     abs_path = os.path.abspath(resolver_path)
     if not os.path.isfile(abs_path):
         raise FileNotFoundError(f"Custom resolver file not found: {abs_path}")
-    spec = importlib.util.spec_from_file_location("custom_resolver", abs_path)
+    mtime = os.stat(abs_path).st_mtime_ns
+    cached = _RESOLVER_CLASSES.get(abs_path)
+    if cached is None or cached[0] != mtime:
+        cached = _RESOLVER_CLASSES[abs_path] = (mtime, _import_resolver_class(abs_path))
+    return cached[1]()
+
+
+def _import_resolver_class(abs_path):
+    import importlib.util  # pylint: disable=import-outside-toplevel
+    digest = hashlib.blake2b(abs_path.encode('utf-8'), digest_size=8).hexdigest()
+    module_name = f"custom_resolver_{digest}"
+    spec = importlib.util.spec_from_file_location(module_name, abs_path)
     module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+    # Registered like any imported module, so pickle and dataclasses can find it
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
     for _, obj in inspect.getmembers(module, inspect.isclass):
         if hasattr(obj, 'resolve_original_method'):
-            return obj()
+            return obj
     raise AttributeError(
         f"No class with 'resolve_original_method' found in {abs_path}"
     )
 
 
-class MockLibrary():
+class MockLibrary():  # pylint: disable=too-many-instance-attributes
     """Mock keywords from any Robot Framework library for unit testing.
     
     Example:
@@ -87,44 +210,551 @@ class MockLibrary():
 
     ROBOT_LIBRARY_SCOPE = 'GLOBAL'
 
-    def __init__(self, library_name_or_alias: str, custom_resolver_path: str = None):
+    def __init__(  # pylint: disable=too-many-arguments
+        self, library_name_or_alias: str, custom_resolver_path: str = None,
+        retention: str = 'mock', history: int = 10, fixture_cache_size: int = None,
+        *, scope_mocks: bool = True, journal: str = None,
+        statistics: Union[bool, str] = False, record_order: bool = False
+    ):
         """Initialize MockLibrary with a target library to mock.
         
         Args:
-            library_name_or_alias: Name or alias of the library to mock
+            library_name_or_alias: Name or alias of the library to mock. The
+                library is looked up when the first keyword is mocked, so it
+                may also be imported after MockLibrary.
             custom_resolver_path: Optional relative path to a Python file
                 containing a custom resolver class with a
                 resolve_original_method(lib, method_name, keyword_name) method
+            retention: Default call history kept by mocks: ``mock`` (a full
+                unittest.mock.Mock), ``count``, ``last`` or ``full``
+            history: Default number of calls kept with ``last`` retention
+            fixture_cache_size: Size limit in bytes of the LRU cache of
+                ``return_value_file`` payloads shared by all mocks
+            scope_mocks: Restore keywords mocked in a test when the test ends
+                and keywords mocked in a suite when the suite ends. Mocks
+                created in Suite Setup stay active for all tests of the suite.
+            journal: Directory to write a journal of all mocked keyword calls
+                into, one file per process. Journals of parallel runs can be
+                merged with ``python -m MockLibrary.journal``.
+            statistics: Time every call of a mocked keyword, see ``Get Mock
+                Statistics``. A file name also writes the statistics of every
+                suite to that JSON file in the output directory.
+            record_order: Record the order of the calls of mocked keywords,
+                see ``Verify Call Order``
         """
+        if fixture_cache_size is not None:
+            PAYLOAD_CACHE.resize(fixture_cache_size)
+        self._retention = retention
+        self._history = history
+        self._record_order = record_order
         self._original_methods = {}
+        self._instance_attributes = set()
+        # Keywords of libraries that are not GLOBAL, patched on the library class
+        self._class_attributes = {}
+        # Engine key of every installed mock, by keyword name
+        self._keys = {}
+        # Restore functions of keywords another instance had mocked first
+        self._shared_restorers = {}
+        # Keywords run through the dispatch table of a dynamic library
+        self._dynamic_keywords = set()
+        self._keyword_names = None
+        self._method_names = {}
         self._mocks = {}
-        self._library_instance = _get_library_instance(library_name_or_alias)
+        # Keyword name, options and delay of the mocks created from values
+        self._specs = {}
+        # Return values shared by mocks with share_return_value, by factory
+        self._factory_results = {}
+        self._scopes = MockScopes(self._mocks, self._restore_mock)
+        self._journal = get_journal(journal) if journal else None
+        self._statistics = create_statistics(library_name_or_alias, statistics)
+        self.ROBOT_LIBRARY_LISTENER = library_listeners(
+            self._scopes if scope_mocks else None, self._journal, self._statistics
+        )
+        self._library_name = library_name_or_alias
+        # Bound on first use, so the library may be imported after MockLibrary.
+        # Only GLOBAL libraries are bound, others are looked up on every use.
+        self._bound_library = None
         self._custom_resolver = (
             _load_custom_resolver(custom_resolver_path)
             if custom_resolver_path else None
         )
 
+    @property
+    def _library_instance(self):
+        lib = self._bound_library
+        if lib is None:
+            lib = _get_library_instance(self._library_name)
+            if _is_global(lib):
+                self._bound_library = lib
+        return lib
+
+    @_library_instance.setter
+    def _library_instance(self, lib):
+        self._bound_library = lib
+        self._keyword_names = None
+
     @keyword
-    def mock_keyword(
+    def mock_keyword(  # pylint: disable=too-many-arguments,too-many-locals
         self, keyword_name: str,
-        return_value: Any = None, side_effect: Callable = None
+        return_value: Any = None, side_effect: Callable = None, *,
+        retention: str = None, history: int = None,
+        return_value_file: str = None, file_format: str = None,
+        sequence: Any = None, exhaustion: str = 'raise', return_value_factory: Any = None,
+        share_return_value: bool = False, delay: float = None, latency: Any = None,
+        failure_rate: float = None, fail_first: int = None, failure: Any = None, seed: int = None
     ):
         """Mock a keyword from the wrapped library.
+
+        ``async def`` keywords are replaced with a mock returning an
+        awaitable, which Robot Framework runs on its event loop. Their side
+        effect may also be a coroutine function.
         
         Args:
             keyword_name: Name of the keyword to mock (case-insensitive)
             return_value: Value to return when the keyword is called
             side_effect: Callable to execute instead of returning a value
-        
+            retention: Call history to keep: ``mock``, ``count``, ``last``
+                or ``full`` (defaults to the library import argument)
+            history: Number of calls kept with ``last`` retention
+            return_value_file: File whose payload is returned instead of
+                ``return_value``. It is loaded on the first call and cached
+                in an LRU cache shared by all mocks.
+            file_format: Format of ``return_value_file`` or a ``sequence``
+                file: ``jsonl``, ``csv`` or ``bytes`` (defaults to the file
+                extension)
+            sequence: Generator factory, or JSON Lines or CSV file, whose
+                values are returned one per call. The file is read one line
+                per call, so memory use does not grow with its length.
+            exhaustion: What an exhausted ``sequence`` does: ``raise``
+                (default), ``repeat_last`` or ``cycle``
+            return_value_factory: Callable, or ``module:function``
+                reference to one, building the return value when the
+                keyword is called the first time. The result is returned
+                for every call of this mock.
+            share_return_value: Share the result of ``return_value_factory``
+                with all mocks using the same factory until ``Reset Mocks``,
+                so it is built once however many tests mock the keyword
+            delay: Seconds an ``async def`` keyword waits before returning,
+                with ``asyncio.sleep``, so concurrent async keywords keep
+                running meanwhile
+            latency: Seconds every call waits before returning or failing,
+                or a distribution they are drawn from:
+                ``uniform:LOW,HIGH``, ``normal:MEAN,STDEV`` or
+                ``exponential:MEAN``. Calls sleep, ``async def`` keywords
+                with ``asyncio.sleep``.
+            failure_rate: Probability, from 0 to 1, that a call fails
+            fail_first: Number of first calls that fail, for example to
+                test ``Wait Until Keyword Succeeds``
+            failure: Exception, exception class or message of the injected
+                failures (defaults to ``InjectedFailure``)
+            seed: Seed of the random latencies and failures, so they are
+                the same in every run (random by default, reported in the
+                failure messages)
+
+        Raises:
+            ValueError: If ``delay`` is given for a keyword that is not
+                async, or a fault option is invalid
+
         Example:
             | MockDB.Mock Keyword | query | return_value=test_data |
+            | MockDB.Mock Keyword | query | return_value=test_data | retention=last | history=100 |
+            | MockDB.Mock Keyword | query | return_value_file=${CURDIR}/rows.jsonl |
+            | MockDB.Mock Keyword | query | sequence=${CURDIR}/pages.jsonl | exhaustion=cycle |
+            | MockHttp.Mock Keyword | fetch | return_value=${page} | delay=${0.5} |
+            | MockDB.Mock Keyword | get_users | return_value_factory=fixtures:build_users |
+            | MockDB.Mock Keyword | connect | fail_first=2 | latency=uniform:0.1,0.5 | seed=42 |
+        """
+        faults = {
+            'latency': latency, 'failure_rate': failure_rate, 'fail_first': fail_first,
+            'failure': failure, 'seed': seed,
+        }
+        plan = fault_plan(faults)
+        name, method_name = self._resolve_keyword(keyword_name, side_effect)
+
+        # Create Mock object with specified behavior
+        mock = create_mock(
+            return_value, side_effect,
+            retention=retention or self._retention, history=history or self._history,
+            return_value_file=return_value_file, file_format=file_format,
+            sequence=sequence, exhaustion=exhaustion, return_value_factory=return_value_factory,
+            shared_results=self._factory_results if share_return_value else None
+        )
+        spec = mock_spec(
+            return_value=return_value, side_effect=side_effect, retention=retention,
+            history=history, return_value_file=return_value_file, file_format=file_format,
+            sequence=sequence, exhaustion=exhaustion, return_value_factory=return_value_factory,
+            share_return_value=share_return_value, **faults
+        )
+        self._install_mock(
+            name, method_name, self._dispatch(keyword_name, method_name, mock, delay, plan),
+            (keyword_name, spec, delay)
+        )
+        return mock
+
+    @keyword
+    def mock_keyword_with_arguments(
+        self, keyword_name: str, responses: Union[List[Dict[str, Any]], Dict[Any, Any], str],
+        default: Any = None, *, retention: str = None, history: int = None
+    ):
+        """Mock a keyword from the wrapped library with a return value per argument.
+
+        The rows of the response table are indexed by their arguments, so
+        every call is answered with a dictionary lookup however many rows
+        the table has. An argument given as ``*`` matches any value. Rows
+        without wildcards are preferred, then rows with fewer wildcards,
+        then earlier rows.
+
+        Args:
+            keyword_name: Name of the keyword to mock
+            responses: List of rows with ``args`` (list of positional
+                arguments), ``kwargs`` (dictionary of named arguments) and
+                ``return_value``, a dictionary mapping the only argument of
+                a call to its return value, or path to a JSON or YAML file
+                containing either
+            default: Value returned for calls no row matches
+            retention: Call history to keep: ``mock``, ``count``, ``last``
+                or ``full`` (defaults to the library import argument)
+            history: Number of calls kept with ``last`` retention
+
+        Returns:
+            The Mock object that replaced the keyword
+
+        Raises:
+            ValueError: If the response table is malformed
+
+        Example:
+            | &{users}= | Create Dictionary | 1=alice | 2=bob |
+            | MockDB.Mock Keyword With Arguments | Get User | ${users} | default=nobody |
+            | MockDB.Mock Keyword With Arguments | query | ${CURDIR}/responses.json |
         """
+        table = ResponseTable(load_responses(responses), default)
+        name, method_name = self._resolve_keyword(keyword_name, table)
+        spec = mock_spec(side_effect=table, retention=retention, history=history)
+        return self._mock_with_side_effect(
+            keyword_name, name, method_name, table, retention=retention, history=history,
+            spec=(keyword_name, spec, None)
+        )
+
+    @keyword
+    def cache_keyword(
+        self, keyword_name: str, max_size: int = 128, ttl: float = None, *,
+        retention: str = None, history: int = None
+    ):
+        """Memoize a keyword from the wrapped library instead of replacing it.
+
+        The original keyword only runs for arguments without a memoized
+        result. Results are kept in an LRU cache of the keyword, which
+        ``Reset Mocks`` and the end of the test or suite that cached it
+        clear.
+
+        Args:
+            keyword_name: Name of the keyword to memoize
+            max_size: Maximum number of memoized argument combinations
+            ttl: Seconds a result is returned for (optional, by default
+                until it is evicted)
+            retention: Call history to keep: ``mock``, ``count``, ``last``
+                or ``full`` (defaults to the library import argument)
+            history: Number of calls kept with ``last`` retention
+
+        Returns:
+            The Mock object that replaced the keyword
+
+        Raises:
+            ValueError: If ``max_size`` is not positive
+
+        Example:
+            | MockAuth.Cache Keyword | Generate Token | ttl=${300} |
+        """
+        name, method_name = self._resolve_keyword(keyword_name, None)
+        memo = MemoCache(self._original_methods[method_name], max_size, ttl)
+        return self._mock_with_side_effect(
+            keyword_name, name, method_name, memo, retention=retention, history=history
+        )
+
+    @keyword
+    def get_keyword_cache_info(self, keyword_name: str) -> Dict[str, Any]:
+        """Return the hits, misses and size of the cache of a memoized keyword.
+
+        Args:
+            keyword_name: Name of a keyword memoized with ``Cache Keyword``
+
+        Returns:
+            Dictionary with ``hits``, ``misses``, ``size``, ``max_size`` and ``ttl``
+
+        Raises:
+            AssertionError: If the keyword is not memoized
+
+        Example:
+            | ${info}= | MockAuth.Get Keyword Cache Info | Generate Token |
+            | Should Be Equal As Integers | ${info}[hits] | 2 |
+        """
+        return get_memo_info(self._mocks.get(normalize_keyword_name(keyword_name)), keyword_name)
+
+    @keyword
+    def spy_keyword(
+        self, keyword_name: str, spy_history: int = 10, *,
+        retention: str = 'count', history: int = None
+    ):
+        """Record the calls of a keyword from the wrapped library while it keeps running.
+
+        The original keyword runs for every call. The arguments of the last
+        ``spy_history`` calls are kept by reference, without copying them,
+        together with the time the original took, see ``Get Spy Calls``.
+        The keyword can be verified like a mocked keyword.
+
+        Args:
+            keyword_name: Name of the keyword to spy on
+            spy_history: Number of calls the spy keeps
+            retention: Call history kept by the mock wrapping the spy:
+                ``count`` (the default, the spy keeps the arguments), ``mock``,
+                ``last`` or ``full``
+            history: Number of calls kept by the mock with ``last``
+                retention (defaults to the library import argument)
+
+        Returns:
+            The mock passing the calls to the original keyword
+
+        Raises:
+            ValueError: If ``spy_history`` is not positive
+
+        Example:
+            | MockDB.Spy Keyword | Execute Query |
+            | Execute Query | SELECT 1 |
+            | MockDB.Verify Keyword Called | Execute Query | times=1 |
+        """
+        name, method_name = self._resolve_keyword(keyword_name, None)
+        spy = KeywordSpy(self._original_methods[method_name], spy_history)
+        return self._mock_with_side_effect(
+            keyword_name, name, method_name, spy, retention=retention, history=history
+        )
+
+    @keyword
+    def get_spy_calls(self, keyword_name: str) -> List[Dict[str, Any]]:
+        """Return the calls recorded by a spied keyword, oldest first.
+
+        Args:
+            keyword_name: Name of a keyword spied with ``Spy Keyword``
+
+        Returns:
+            List of dictionaries with ``args``, ``kwargs`` and ``duration_ns``
+
+        Raises:
+            AssertionError: If the keyword is not spied
+
+        Example:
+            | ${calls}= | MockDB.Get Spy Calls | Execute Query |
+            | Should Be Equal | ${calls}[0][args][0] | SELECT 1 |
+        """
+        return get_spy_calls(self._mocks.get(normalize_keyword_name(keyword_name)), keyword_name)
+
+    @keyword
+    def mock_keywords(self, mocks: Union[Dict[str, Any], str]):
+        """Mock many keywords from the wrapped library in one pass.
+
+        All keyword names are resolved and all mocks are created before any
+        keyword is patched, so a malformed table or an unknown keyword leaves
+        the library untouched.
+
+        Args:
+            mocks: Dictionary, or path to a JSON or YAML file containing one,
+                mapping keyword names to dictionaries of ``Mock Keyword``
+                options such as ``return_value`` and ``side_effect``
+
+        Returns:
+            Dictionary mapping the given keyword names to their mocks
+
+        Raises:
+            ValueError: If the mock table is malformed
+            AttributeError: If any of the keywords is not found
+
+        Example:
+            | MockDB.Mock Keywords | ${CURDIR}/mocks.json |
+            | MockDB.Mock Keywords | ${mock_table} |
+        """
+        table = load_mock_table(mocks)
+        return self._install_table(table, self._resolve_table(table))
+
+    @keyword
+    def save_mock_state(self, path: str) -> str:
+        """Save the active mocks into a snapshot file for ``Load Mock State``.
+
+        The snapshot keeps the options the mocks were created with and the
+        method each keyword resolved to, so loading it needs no mock table
+        and no keyword search. Only mocks created with ``Mock Keyword``,
+        ``Mock Keyword With Arguments`` or ``Mock Keywords`` can be saved,
+        with side effects that can be pickled.
+
+        Args:
+            path: Snapshot file to write
+
+        Returns:
+            Absolute path of the snapshot file
+
+        Raises:
+            ValueError: If a mock cannot be saved
+
+        Example:
+            | MockDB.Mock Keywords | ${CURDIR}/mocks.json |
+            | MockDB.Save Mock State | ${OUTPUT DIR}/db-mocks.snapshot |
+        """
+        keywords = snapshot_keywords(self._mocks, self._specs, self._method_names.get)
+        return save_snapshot(path, 'library', _library_target(self._library_instance), keywords)
+
+    @keyword
+    def load_mock_state(self, path: str) -> Dict[str, Any]:
+        """Mock the keywords saved with ``Save Mock State`` in one pass.
+
+        Every keyword is looked up in the keyword index of the library and
+        must still resolve to the method it was saved with, otherwise the
+        snapshot is stale and no keyword is mocked. Snapshots are unpickled,
+        so only load snapshots you trust.
+
+        Args:
+            path: Snapshot file to read
+
+        Returns:
+            Dictionary mapping the saved keyword names to their mocks
+
+        Raises:
+            FileNotFoundError: If the snapshot file does not exist
+            ValueError: If the snapshot was saved for another library or is stale
+            AttributeError: If any of the keywords is not found
+
+        Example:
+            | MockDB.Load Mock State | ${OUTPUT DIR}/db-mocks.snapshot |
+        """
+        keywords = load_snapshot(path, 'library', _library_target(self._library_instance))
+        table = {keyword_name: entry['spec'] for keyword_name, entry in keywords.items()}
+        resolved = self._resolve_table(table)
+        check_locations(
+            keywords,
+            {keyword_name: method_name for keyword_name, (_, method_name) in resolved.items()},
+            path
+        )
+        return self._install_table(
+            table, resolved,
+            {keyword_name: entry['delay'] for keyword_name, entry in keywords.items()}
+        )
+
+    def _resolve_table(self, table):
+        return resolve_keywords(
+            table,
+            lambda keyword_name: self._resolve_keyword(
+                keyword_name, table[keyword_name].get('side_effect')
+            ),
+            self._library_instance
+        )
+
+    def _install_table(self, table, resolved, delays=None):
+        created = create_mocks(table, self._retention, self._history, self._factory_results)
+        for keyword_name, mock in created.items():
+            name, method_name = resolved[keyword_name]
+            delay = delays.get(keyword_name) if delays else None
+            plan = fault_plan(table[keyword_name])
+            # Compiled before dispatching, timed mocks wrap their side effect
+            spec = compiled_spec(table[keyword_name], mock)
+            self._install_mock(
+                name, method_name, self._dispatch(keyword_name, method_name, mock, delay, plan),
+                (keyword_name, spec, delay)
+            )
+        return created
+
+    @keyword
+    def record_keyword(  # pylint: disable=too-many-arguments
+        self, keyword_name: str, cache: str, *,
+        max_size: int = None, max_age: float = None,
+        retention: str = None, history: int = None
+    ):
+        """Call the real keyword and record its results into an on-disk cache.
+
+        Results are stored by keyword and canonicalized arguments, and
+        written in bulk when many are pending and when the process exits.
+        Results that cannot be pickled are returned but not recorded.
+
+        Args:
+            keyword_name: Name of the keyword to record
+            cache: Directory of the cache, created if needed
+            max_size: Maximum total size of the recorded results in bytes,
+                the oldest results are evicted first
+            max_age: Maximum age of recorded results in seconds
+            retention: Call history to keep: ``mock``, ``count``, ``last``
+                or ``full`` (defaults to the library import argument)
+            history: Number of calls kept with ``last`` retention
+
+        Returns:
+            The Mock object that replaced the keyword
+
+        Example:
+            | MockDB.Record Keyword | query | ${CURDIR}/replay | max_age=${86400} |
+        """
+        name, method_name = self._resolve_keyword(keyword_name, None)
+        replay_cache = get_cache(cache)
+        replay_cache.set_limits(max_size, max_age)
+        recording = RecordingCall(
+            self._original_methods[method_name], replay_cache, self._library_name, keyword_name
+        )
+        return self._mock_with_side_effect(
+            keyword_name, name, method_name, recording, retention=retention, history=history
+        )
+
+    @keyword
+    def replay_keyword(  # pylint: disable=too-many-arguments
+        self, keyword_name: str, cache: str, *,
+        on_miss: str = 'fail', max_age: float = None,
+        retention: str = None, history: int = None
+    ):
+        """Return results recorded with ``Record Keyword`` instead of calling the real keyword.
+
+        Args:
+            keyword_name: Name of the keyword to replay
+            cache: Directory of the cache the results were recorded into
+            on_miss: What a call without a recorded result does: ``fail``
+                (default) or ``call`` the real keyword
+            max_age: Results older than this many seconds are not replayed
+            retention: Call history to keep: ``mock``, ``count``, ``last``
+                or ``full`` (defaults to the library import argument)
+            history: Number of calls kept with ``last`` retention
+
+        Returns:
+            The Mock object that replaced the keyword
+
+        Raises:
+            ValueError: If the miss policy is not supported
+
+        Example:
+            | MockDB.Replay Keyword | query | ${CURDIR}/replay |
+            | MockDB.Replay Keyword | query | ${CURDIR}/replay | on_miss=call |
+        """
+        name, method_name = self._resolve_keyword(keyword_name, None)
+        replaying = ReplayingCall(
+            self._original_methods[method_name], get_cache(cache), self._library_name,
+            keyword_name, on_miss=on_miss, max_age=max_age
+        )
+        return self._mock_with_side_effect(
+            keyword_name, name, method_name, replaying, retention=retention, history=history
+        )
+
+    def _mock_with_side_effect(  # pylint: disable=too-many-arguments
+        self, keyword_name, name, method_name, side_effect, *, retention, history, spec=None
+    ):
+        mock = create_mock(
+            side_effect=side_effect,
+            retention=retention or self._retention, history=history or self._history
+        )
+        self._install_mock(
+            name, method_name, self._dispatch(keyword_name, method_name, mock), spec
+        )
+        return mock
+
+    def _resolve_keyword(self, keyword_name, side_effect):
         lib = self._library_instance
-        # Convert keyword name to method name format (lowercase with underscores)
-        method_name = keyword_name.lower().replace(' ', '_')
+        name = normalize_keyword_name(keyword_name)
+        method_name = self._method_names.get(name)
 
-        # Only store original method once per keyword
-        if method_name not in self._original_methods:
+        # Only resolve the original method once per keyword
+        if method_name is None:
+            # Convert keyword name to method name format (lowercase with underscores)
+            method_name = keyword_name.lower().replace(' ', '_')
             if self._custom_resolver:
                 original_method, method_name = (
                     self._custom_resolver.resolve_original_method(
@@ -132,53 +762,182 @@ class MockLibrary():
                     )
                 )
             else:
-                original_method, method_name = _resolve_original_method(
+                original_method, method_name = self._resolve_library_keyword(
                     lib, method_name, keyword_name
                 )
 
             # Raise error if keyword doesn't exist
             if not original_method:
                 raise AttributeError(f"Keyword '{keyword_name}' not found in {lib}")
-            self._original_methods[method_name] = original_method
+            # Another name of the same keyword may have replaced it already
+            if method_name not in self._original_methods:
+                if not (
+                    _is_global(lib) or method_name in self._dynamic_keywords
+                    or method_name in getattr(lib, '__dict__', ())
+                ):
+                    # Instances of the running test or suite are created from the class
+                    self._class_attributes[method_name] = vars(type(lib)).get(method_name)
+                key = library_key(self._patch_target(lib, method_name), method_name)
+                # Another MockLibrary instance may have mocked the keyword already,
+                # it knows whether the original belongs to the library itself
+                if key in ENGINE:
+                    original_method = ENGINE.original(key, original_method)
+                    self._shared_restorers[method_name] = ENGINE.restorer(key)
+                elif method_name in getattr(lib, '__dict__', ()):
+                    self._instance_attributes.add(method_name)
+                self._original_methods[method_name] = original_method
+            self._method_names[name] = method_name
 
-        # Create Mock object with specified behavior
-        mock = Mock(return_value=return_value, side_effect=side_effect)
-        self._mocks[method_name] = mock
-
-        # Replace the method on the class or instance
-        try:
-            # Try to set on the class for bound methods
-            owner_class = self._original_methods[method_name].__self__.__class__
-            setattr(owner_class, method_name, mock)
-        except AttributeError:
-            # Fall back to setting on the instance
-            setattr(lib, method_name, mock)
+        return name, method_name
 
-        return mock
+    def _resolve_library_keyword(self, lib, method_name, keyword_name):
+        # Dynamic and hybrid libraries list their keywords, looked up once
+        if self._keyword_names is None:
+            self._keyword_names = get_keyword_names(lib) or {}
+        name = self._keyword_names.get(normalize_keyword_name(keyword_name))
+        if name is not None:
+            if is_dynamic(lib):
+                self._dynamic_keywords.add(name)
+                return DynamicKeyword(original_run_keyword(lib), name), name
+            original_method = getattr(lib, name, None)
+            if original_method is not None:
+                return original_method, name
+        return _resolve_original_method(lib, method_name, keyword_name)
+
+    def _dispatch(  # pylint: disable=too-many-arguments
+        self, keyword_name, method_name, mock, delay=None, plan=None
+    ):
+        # Build the callable installed in place of the keyword
+        is_coroutine = inspect.iscoroutinefunction(self._original_methods[method_name])
+        if delay and not is_coroutine:
+            raise ValueError(
+                f"Keyword '{keyword_name}' is not an async keyword, delay is only supported "
+                f"for async keywords"
+            )
+        dispatch = mock if plan is None else FaultyMock(mock, plan, is_coroutine)
+        if self._journal is not None:
+            dispatch = self._journal.wrap(self._library_name, keyword_name, dispatch)
+        dispatch = CountingMock(
+            dispatch,
+            CALL_ORDER.recorder(self._library_name, keyword_name) if self._record_order else None
+        )
+        if self._statistics is not None:
+            dispatch = self._statistics.timed(keyword_name, mock, dispatch)
+        if is_coroutine:
+            # Robot Framework runs the returned coroutine on its event loop
+            dispatch = AwaitableMock(dispatch, delay)
+        return dispatch
+
+    def _install_mock(self, name, method_name, mock, spec=None):
+        self._scopes.record(name, self._mocks.get(name))
+        if spec is not None:
+            # What the mock was created from, for Save Mock State
+            self._specs[mock] = spec
+        lib = self._patch_target(self._library_instance, method_name)
+        previous = self._mocks.get(name)
+        if previous is not None:
+            ENGINE.unregister(self._keys[name], previous)
+        key = self._keys[name] = library_key(lib, method_name)
+        self._mocks[name] = mock
+        ENGINE.register(
+            key, mock, self._installer(lib, method_name), self._restorer(lib, method_name),
+            self._original_methods[method_name]
+        )
+
+    def _restore_mock(self, name, mock):
+        method_name = self._method_names.get(name)
+        if method_name is None:
+            return
+        # The mock in place is discarded, the scope that created it has ended
+        self._specs.pop(self._mocks.get(name), None)
+        if mock is not None:
+            self._install_mock(name, method_name, mock)
+        elif name in self._mocks:
+            ENGINE.unregister(self._keys.pop(name), self._mocks.pop(name))
+
+    def _patch_target(self, lib, method_name):
+        # The class, for keywords of libraries created again for every test or suite
+        return type(lib) if method_name in self._class_attributes else lib
+
+    def _installer(self, lib, method_name):
+        # Bound to the library and keyword, so the engine can reinstall the
+        # mocks of this instance after another instance's mock is removed
+        if method_name in self._dynamic_keywords:
+            return partial(set_dynamic_mock, lib, method_name)
+        return partial(_set_method, lib, method_name)
+
+    def _restorer(self, lib, method_name):
+        # Bound to the original, so it can be restored after this instance is reset
+        if method_name in self._dynamic_keywords:
+            return partial(remove_dynamic_mock, lib, method_name)
+        if method_name in self._shared_restorers:
+            return self._shared_restorers[method_name]
+        if method_name in self._class_attributes:
+            return partial(
+                _restore_class_attribute, lib, method_name, self._class_attributes[method_name]
+            )
+        original_method = self._original_methods[method_name]
+        if method_name in self._instance_attributes:
+            return partial(_set_method, lib, method_name, original_method)
+        return partial(_uncover_method, lib, method_name, original_method)
 
     @keyword
     def reset_mocks(self):
         """Reset all mocks to their original implementations.
         
         Restores all mocked keywords to their original behavior and clears
-        all tracking data.
+        all tracking data. A library imported with ``record_order`` also
+        clears the call order, which is shared by all libraries.
         
         Example:
             | MockDB.Reset Mocks |
         """
         # Restore each mocked method to its original implementation
-        for method_name, original_method in self._original_methods.items():
-            try:
-                # Restore on the class for bound methods
-                owner_class = original_method.__self__.__class__
-                setattr(owner_class, method_name, original_method)
-            except AttributeError:
-                # Restore on the instance
-                setattr(self._library_instance, method_name, original_method)
+        for name, mock in self._mocks.items():
+            ENGINE.unregister(self._keys[name], mock)
 
         # Clear all tracking dictionaries
+        self._scopes.clear()
         self._mocks.clear()
+        self._specs.clear()
+        if self._record_order:
+            # The call order is shared, resetting clears it for every library
+            CALL_ORDER.clear()
+        self._factory_results.clear()
+        self._method_names.clear()
         self._original_methods.clear()
+        self._instance_attributes.clear()
+        self._class_attributes.clear()
+        self._keys.clear()
+        self._shared_restorers.clear()
+        self._dynamic_keywords.clear()
+
+    @keyword
+    def get_mock_statistics(self, keyword_name: str = None) -> Dict[str, Any]:
+        """Return call latency statistics of the mocked keywords.
+
+        Every call is timed with ``perf_counter_ns``. ``latency`` is the time
+        of the whole call, ``side_effect`` the time spent in a callable side
+        effect and ``dispatch`` the rest, the overhead of mocking. Each of
+        them has the ``count``, ``mean_ns``, ``p50_ns``, ``p99_ns`` and
+        ``max_ns`` of the calls made in the running suite.
+
+        Args:
+            keyword_name: Name of a mocked keyword (optional, if None the
+                statistics of all called keywords are returned)
+
+        Returns:
+            Statistics of one keyword, or a dictionary of them by keyword name
+
+        Raises:
+            RuntimeError: If the library was imported without ``statistics``
+            AssertionError: If ``keyword_name`` has not been called
+
+        Example:
+            | ${stats}= | MockDB.Get Mock Statistics | query |
+            | Should Be True | ${stats}[dispatch][p99_ns] < 100000 |
+        """
+        return get_statistics(self._statistics, keyword_name)
 
     @keyword
     def verify_keyword_called(self, keyword_name: str, times: int = None):
@@ -194,13 +953,57 @@ class MockLibrary():
         Example:
             | MockDB.Verify Keyword Called | execute_sql | times=1 |
         """
-        # Convert keyword name to method name format
-        method_name = keyword_name.lower().replace(' ', '_')
         # Check if the keyword was mocked
-        if method_name not in self._mocks:
+        mock = self._mocks.get(normalize_keyword_name(keyword_name))
+        if mock is None:
             raise AssertionError(f"Keyword '{keyword_name}' was not mocked")
 
         # Verify call count if specified
-        mock = self._mocks[method_name]
         if times is not None and mock.call_count != times:
             raise AssertionError(f"Expected {times} calls, got {mock.call_count}")
+
+    @keyword
+    def verify_call_order(self, *keyword_names: str):
+        """Verify that mocked keywords were called in the given order.
+
+        The calls of all MockLibrary and MockResource mocks imported with
+        ``record_order`` share one journal, cleared when a suite or test
+        starts and by ``Reset Mocks``, so keywords of
+        different libraries and resource files can be checked together.
+        Other calls may come in between. Keywords can be qualified with
+        the name of their library or resource file.
+
+        Args:
+            keyword_names: Names of the keywords, in the expected order
+
+        Raises:
+            AssertionError: If the keywords were not called in this order
+            RuntimeError: If the library does not record the call order
+
+        Example:
+            | MockDB.Verify Call Order | Connect | Query | Disconnect |
+            | MockDB.Verify Call Order | DatabaseLibrary.Connect | db.Log Result |
+        """
+        get_call_order(self._record_order).verify_order(keyword_names)
+
+    @keyword
+    def verify_not_called_between(self, keyword_name: str, start: str, end: str):
+        """Verify that a mocked keyword was not called between two others.
+
+        Every call of ``start`` opens a window that the next call of ``end``
+        closes, and ``keyword_name`` must not be called in any of them.
+
+        Args:
+            keyword_name: Name of the keyword that must not be called
+            start: Name of the keyword opening a window
+            end: Name of the keyword closing a window
+
+        Raises:
+            AssertionError: If the keyword was called in a window, or
+                ``start`` was never followed by ``end``
+            RuntimeError: If the library does not record the call order
+
+        Example:
+            | MockDB.Verify Not Called Between | Commit | Begin | Rollback |
+        """
+        get_call_order(self._record_order).verify_not_called_between(keyword_name, start, end)
@@ -0,0 +1,117 @@
+"""Mocking keywords of libraries using the dynamic or hybrid library API.
+
+Keywords of dynamic libraries have no methods of their own, Robot Framework
+runs them all through the library's ``run_keyword``. A library with mocked
+dynamic keywords gets one ``RunKeywordDispatcher`` in place of its
+``run_keyword``, shared by all MockLibrary instances wrapping it, which
+looks the called keyword up in its dispatch table and calls the original
+``run_keyword`` for keywords that are not mocked.
+"""
+import inspect
+from functools import update_wrapper
+from typing import Any, Callable, Dict, Optional
+
+from .naming import normalize_keyword_name
+
+
+def get_keyword_names(lib: Any) -> Optional[Dict[str, str]]:
+    """Map normalized keyword names of a dynamic or hybrid library to its names.
+
+    Returns:
+        The names returned by ``get_keyword_names``, or None if the library
+        uses the static API
+    """
+    get_names = getattr(lib, 'get_keyword_names', None) or getattr(lib, 'getKeywordNames', None)
+    if not callable(get_names):
+        return None
+    return {normalize_keyword_name(name): name for name in get_names()}
+
+
+def is_dynamic(lib: Any) -> bool:
+    """Whether the library runs its keywords through ``run_keyword``."""
+    return callable(getattr(lib, 'run_keyword', None))
+
+
+class DynamicKeyword:
+    """Original implementation of a dynamic keyword, callable like a method.
+
+    Calls the original ``run_keyword`` the way Robot Framework does, passing
+    named arguments separately only if ``run_keyword`` accepts them.
+    """
+
+    __slots__ = ('run_keyword', 'name', '_named_args')
+
+    def __init__(self, run_keyword: Callable, name: str):
+        self.run_keyword = run_keyword
+        self.name = name
+        parameters = inspect.signature(run_keyword).parameters.values()
+        self._named_args = sum(
+            parameter.kind in (parameter.POSITIONAL_ONLY, parameter.POSITIONAL_OR_KEYWORD)
+            for parameter in parameters
+        ) == 3
+
+    def __call__(self, *args, **kwargs):
+        if self._named_args:
+            return self.run_keyword(self.name, list(args), kwargs)
+        return self.run_keyword(self.name, list(args), **kwargs)
+
+    def __repr__(self):
+        return f"DynamicKeyword({self.name!r})"
+
+
+class RunKeywordDispatcher:
+    """``run_keyword`` of a dynamic library, dispatching mocked keywords to their mocks.
+
+    Mocks are called with the positional and named arguments of the
+    keyword. Its signature is the one of the original ``run_keyword``, so
+    Robot Framework passes named arguments the same way as before.
+    """
+
+    def __init__(self, lib: Any):
+        """Install the dispatcher in place of the ``run_keyword`` of ``lib``."""
+        update_wrapper(self, lib.run_keyword)
+        self.original = lib.run_keyword
+        self.table = {}
+        self._lib = lib
+        # Only an instance attribute is put back, class methods are uncovered
+        self._shadowed = 'run_keyword' in vars(lib)
+        lib.run_keyword = self
+
+    def __call__(self, name, *args, **kwargs):
+        mock = self.table.get(name)
+        if mock is None:
+            return self.original(name, *args, **kwargs)
+        positional = args[0] if args else ()
+        named = args[1] if len(args) > 1 else kwargs
+        return mock(*positional, **named)
+
+    def uninstall(self):
+        """Put the original ``run_keyword`` back, unless it has been wrapped since."""
+        if vars(self._lib).get('run_keyword') is self:
+            if self._shadowed:
+                self._lib.run_keyword = self.original
+            else:
+                del self._lib.run_keyword
+
+
+def original_run_keyword(lib: Any) -> Callable:
+    """Return the ``run_keyword`` of ``lib`` without its dispatcher."""
+    run_keyword = lib.run_keyword
+    return run_keyword.original if isinstance(run_keyword, RunKeywordDispatcher) else run_keyword
+
+
+def set_dynamic_mock(lib: Any, name: str, mock: Callable):
+    """Dispatch calls of the dynamic keyword ``name`` of ``lib`` to ``mock``."""
+    dispatcher = lib.run_keyword
+    if not isinstance(dispatcher, RunKeywordDispatcher):
+        dispatcher = RunKeywordDispatcher(lib)
+    dispatcher.table[name] = mock
+
+
+def remove_dynamic_mock(lib: Any, name: str):
+    """Stop dispatching calls of ``name``, uninstalling the dispatcher with the last mock."""
+    dispatcher = lib.run_keyword
+    if isinstance(dispatcher, RunKeywordDispatcher):
+        dispatcher.table.pop(name, None)
+        if not dispatcher.table:
+            dispatcher.uninstall()
@@ -0,0 +1,111 @@
+"""Process-wide table of the active mocks of all MockLibrary and MockResource instances.
+
+Every mocked keyword has one entry, keyed by its fully qualified key:
+``(id of the library instance or class, method name)`` for library keywords and
+``(resource path, normalized keyword name)`` for resource keywords. The
+front ends only create mocks and register them here; the engine decides
+which mock is active and puts it in place through the installer given with
+the registration. Library keywords are patched on their library instance,
+or on its class for libraries created again for every test or suite, so
+calls from Python code are mocked too, and resource keywords are served
+by the ``Namespace.get_runner`` interceptor of MockResource.
+
+When several instances mock the same keyword, the latest registration
+wins, and unregistering it activates the previous one again. The original
+keyword is restored only when the last mock of a keyword is unregistered,
+with the original seen by its first registration, whichever instance
+unregisters last.
+"""
+import threading
+from typing import Any, Callable, Hashable
+
+
+class _Entry:  # pylint: disable=too-few-public-methods
+    """Registrations of one keyword and how to put its original back."""
+
+    __slots__ = ('original', 'restore', 'registrations')
+
+    def __init__(self, original, restore):
+        self.original = original
+        self.restore = restore
+        self.registrations = []
+
+
+class MockEngine:
+    """Dispatch table of the active mocks of all keywords of the process."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        # Active mock by key, looked up once per keyword run
+        self.table = {}
+        self._entries = {}
+
+    def __contains__(self, key):
+        return key in self.table
+
+    def __len__(self):
+        return len(self.table)
+
+    def original(self, key: Hashable, default: Any = None) -> Any:
+        """Return the original of ``key`` seen by its first registration, or ``default``."""
+        entry = self._entries.get(key)
+        return default if entry is None or entry.original is None else entry.original
+
+    def restorer(self, key: Hashable) -> Callable[[], None]:
+        """Return the restore function given with the first registration of ``key``, or None."""
+        entry = self._entries.get(key)
+        return None if entry is None else entry.restore
+
+    def register(
+        self, key: Hashable, mock: Callable, install: Callable[[Callable], None],
+        restore: Callable[[], None], original: Any = None
+    ):
+        """Make ``mock`` the active mock of ``key``.
+
+        Args:
+            key: Fully qualified key of the keyword
+            mock: Callable run in place of the keyword
+            install: Puts a mock of this registration in place
+            restore: Puts the original keyword back. Only the one given with
+                the first registration of ``key`` is used.
+            original: Original implementation of the keyword, kept for
+                registrations made while it is mocked
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry(original, restore)
+            entry.registrations.append((mock, install))
+            self.table[key] = mock
+            install(mock)
+
+    def unregister(self, key: Hashable, mock: Callable):
+        """Remove ``mock`` from ``key``, falling back to earlier registrations."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            registrations = entry.registrations
+            for index, (registered, _) in enumerate(registrations):
+                if registered is mock:
+                    del registrations[index]
+                    break
+            else:
+                return
+            if not registrations:
+                del self._entries[key]
+                del self.table[key]
+                entry.restore()
+            elif self.table[key] is mock:
+                previous, install = registrations[-1]
+                self.table[key] = previous
+                install(previous)
+
+
+def library_key(lib: Any, method_name: str) -> tuple:
+    """Return the key of the keyword ``method_name`` of the library instance or class ``lib``."""
+    return id(lib), method_name
+
+
+# The engine of this process, shared by all MockLibrary and MockResource instances
+ENGINE = MockEngine()
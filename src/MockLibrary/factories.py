@@ -0,0 +1,99 @@
+"""Return values built by a factory on the first call of a mocked keyword."""
+import importlib
+import threading
+from typing import Any, Callable, Dict, Union
+
+_NO_RESULT = object()
+
+# Marks the keys of the locks kept with shared results, next to the results by factory
+_BUILDING = object()
+
+
+def check_factory(factory: Union[Callable[[], Any], str]):
+    """Verify ``factory`` is a callable or a ``module:function`` reference.
+
+    The referenced module is not imported until the factory runs.
+
+    Raises:
+        ValueError: If ``factory`` is neither
+    """
+    if callable(factory):
+        return
+    module, _, function = factory.partition(':') if isinstance(factory, str) else ('', '', '')
+    if not module.strip() or not function.strip():
+        raise ValueError(
+            f"Return value factory must be a callable or a 'module:function' reference, "
+            f"got {factory!r}"
+        )
+
+
+def resolve_factory(factory: Union[Callable[[], Any], str]) -> Callable[[], Any]:
+    """Return the callable a ``module:function`` reference points to, importing its module.
+
+    The function may be an attribute path, like ``module:Class.method``.
+
+    Raises:
+        ImportError: If the module cannot be imported
+        AttributeError: If the module has no such function
+    """
+    if callable(factory):
+        return factory
+    module_name, _, path = factory.partition(':')
+    target = importlib.import_module(module_name.strip())
+    for name in path.strip().split('.'):
+        target = getattr(target, name)
+    return target
+
+
+class LazyReturnValue:
+    """Side effect returning the result of a factory, built on the first call.
+
+    The factory runs without arguments when the mocked keyword is called
+    the first time, and its result is returned for every call, so a mock
+    that is never called never builds its return value. With ``shared``,
+    results are kept in that dictionary by factory instead, so all mocks
+    using the same factory share one result for as long as the dictionary
+    is kept. First calls are serialized per mock, and per factory when
+    results are shared, so unrelated factories run concurrently and a
+    factory may call other lazily mocked keywords.
+    """
+
+    __slots__ = ('factory', '_shared', '_result', '_lock')
+
+    def __init__(self, factory: Union[Callable[[], Any], str], shared: Dict[Any, Any] = None):
+        """Initialize the lazy return value.
+
+        Args:
+            factory: Callable, or ``module:function`` reference to one
+            shared: Results shared by mocks, by factory (optional)
+
+        Raises:
+            ValueError: If ``factory`` is neither a callable nor a reference
+        """
+        check_factory(factory)
+        self.factory = factory
+        self._shared = shared
+        self._result = _NO_RESULT
+        self._lock = threading.RLock()
+
+    def __call__(self, *args, **kwargs):
+        result = self._result
+        if result is _NO_RESULT:
+            with self._lock:
+                result = self._result
+                if result is _NO_RESULT:
+                    result = self._result = self._build()
+        return result
+
+    def _build(self):
+        if self._shared is None:
+            return resolve_factory(self.factory)()
+        # setdefault is atomic, so all mocks sharing the factory get the same lock
+        with self._shared.setdefault((_BUILDING, self.factory), threading.RLock()):
+            result = self._shared.get(self.factory, _NO_RESULT)
+            if result is _NO_RESULT:
+                result = self._shared[self.factory] = resolve_factory(self.factory)()
+        return result
+
+    def __repr__(self):
+        return f"LazyReturnValue({self.factory!r})"
@@ -0,0 +1,237 @@
+"""Injected latency and failures of mocked keywords."""
+import asyncio
+import inspect
+import random
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+# Mock Keyword options configuring a FaultPlan
+FAULT_OPTIONS = ('latency', 'failure_rate', 'fail_first', 'failure', 'seed')
+
+# Latency distributions, with their number of parameters and their sampler
+_DISTRIBUTIONS = {
+    'uniform': (2, lambda rng, low, high: rng.uniform(low, high)),
+    'normal': (2, lambda rng, mean, stdev: rng.gauss(mean, stdev)),
+    'exponential': (1, lambda rng, mean: rng.expovariate(1 / mean)),
+}
+
+
+class InjectedFailure(RuntimeError):
+    """Failure raised by a mocked keyword with injected failures."""
+
+
+class FaultPlan:  # pylint: disable=too-many-instance-attributes
+    """Latency and failures injected into the calls of a mocked keyword.
+
+    Every call waits the fixed latency, or a latency drawn from a
+    distribution, and the first ``fail_first`` calls fail, then every call
+    fails with probability ``failure_rate``. Latencies and failures are
+    drawn in call order from a random generator seeded with ``seed``, so a
+    run with the same seed and the same calls injects the same faults.
+    """
+
+    __slots__ = (
+        'latency', 'failure_rate', 'fail_first', 'failure', 'seed', 'failures',
+        '_sample', '_random', '_calls', '_lock'
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self, latency: Any = None, failure_rate: float = None, fail_first: int = None,
+        failure: Any = None, seed: int = None
+    ):
+        """Initialize the fault plan.
+
+        Args:
+            latency: Seconds every call waits, or a distribution they are
+                drawn from: ``uniform:LOW,HIGH``, ``normal:MEAN,STDEV`` or
+                ``exponential:MEAN``
+            failure_rate: Probability, from 0 to 1, that a call fails
+            fail_first: Number of first calls that fail
+            failure: Exception, exception class or message of the failures
+                (defaults to ``InjectedFailure``)
+            seed: Seed of the random generator (random by default)
+
+        Raises:
+            ValueError: If any of the options is invalid
+        """
+        self._sample = _latency_sampler(latency)
+        if failure_rate is not None and (
+            isinstance(failure_rate, bool) or not isinstance(failure_rate, (int, float))
+            or not 0 <= failure_rate <= 1
+        ):
+            raise ValueError(f"failure_rate must be between 0 and 1, got {failure_rate!r}")
+        if fail_first is not None and (
+            isinstance(fail_first, bool) or not isinstance(fail_first, int) or fail_first < 0
+        ):
+            raise ValueError(f"fail_first must be a non-negative integer, got {fail_first!r}")
+        if failure is not None and not isinstance(failure, (str, BaseException)) and not (
+            isinstance(failure, type) and issubclass(failure, BaseException)
+        ):
+            raise ValueError(
+                f"failure must be an exception, an exception class or a message, got {failure!r}"
+            )
+        if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int)):
+            raise ValueError(f"seed must be an integer, got {seed!r}")
+        self.latency = latency
+        self.failure_rate = failure_rate or 0
+        self.fail_first = fail_first or 0
+        self.failure = failure
+        # Reported in failures, so a run without a seed can be reproduced
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self._random = random.Random(self.seed)
+        self.failures = 0
+        self._calls = 0
+        self._lock = threading.Lock()
+
+    def next_fault(self) -> Tuple[float, Optional[BaseException]]:
+        """Draw the latency and the failure of the next call.
+
+        Returns:
+            Seconds the call waits, and the exception it raises or None
+        """
+        with self._lock:
+            self._calls += 1
+            number = self._calls
+            latency = self._sample(self._random) if self._sample is not None else 0
+            failing = number <= self.fail_first or (
+                self.failure_rate and self._random.random() < self.failure_rate
+            )
+            if failing:
+                self.failures += 1
+        return latency, self._failure(number) if failing else None
+
+    def reset(self):
+        """Start over from the first call, drawing the same faults again."""
+        with self._lock:
+            self._random.seed(self.seed)
+            self.failures = 0
+            self._calls = 0
+
+    def _failure(self, number):
+        message = f"Injected failure of call {number} (seed {self.seed})"
+        failure = self.failure
+        if failure is None:
+            return InjectedFailure(message)
+        if isinstance(failure, str):
+            return InjectedFailure(failure)
+        if isinstance(failure, type):
+            return failure(message)
+        return failure
+
+    def __repr__(self):
+        return (
+            f"FaultPlan(latency={self.latency!r}, failure_rate={self.failure_rate!r}, "
+            f"fail_first={self.fail_first!r}, seed={self.seed!r})"
+        )
+
+
+class FaultyMock:
+    """Callable installed in place of a keyword, injecting the faults of a plan.
+
+    Calls wait with ``time.sleep``, or ``asyncio.sleep`` for async
+    keywords, so a waiting call never spins and an async one lets other
+    coroutines run. Failing calls raise without reaching the wrapped mock,
+    so they consume no value of its side effect, but are still counted in
+    ``call_count``. Other attributes are read from the wrapped mock.
+    """
+
+    __slots__ = ('mock', 'plan', 'asynchronous')
+
+    def __init__(self, mock, plan: FaultPlan, asynchronous: bool = False):
+        self.mock = mock
+        self.plan = plan
+        self.asynchronous = asynchronous
+
+    def __call__(self, *args, **kwargs):
+        latency, failure = self.plan.next_fault()
+        if self.asynchronous:
+            result = self.mock(*args, **kwargs) if failure is None else None
+            return self._awaited(latency, failure, result)
+        if latency > 0:
+            time.sleep(latency)
+        if failure is not None:
+            raise failure
+        return self.mock(*args, **kwargs)
+
+    async def _awaited(self, latency, failure, result):
+        if latency > 0:
+            await asyncio.sleep(latency)
+        if failure is not None:
+            raise failure
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self.mock, name)
+
+    @property
+    def call_count(self) -> int:
+        """Number of calls, failing calls included."""
+        return self.mock.call_count + self.plan.failures
+
+    @property
+    def called(self) -> bool:
+        """Whether the keyword has been called at least once."""
+        return self.call_count > 0
+
+    def reset_mock(self):
+        """Forget all recorded calls and start the fault plan over."""
+        self.plan.reset()
+        self.mock.reset_mock()
+
+
+def fault_plan(options: Dict[str, Any]) -> Optional[FaultPlan]:
+    """Return the fault plan configured by the ``FAULT_OPTIONS`` of ``options``.
+
+    Returns:
+        A ``FaultPlan``, or None if no fault is configured
+
+    Raises:
+        ValueError: If any of the options is invalid
+    """
+    given = {
+        option: options[option] for option in FAULT_OPTIONS
+        if options.get(option) is not None and options.get(option) != ''
+    }
+    if not any(option in given for option in ('latency', 'failure_rate', 'fail_first')):
+        if given:
+            raise ValueError(
+                f"{' and '.join(sorted(given))} need latency, failure_rate or fail_first"
+            )
+        return None
+    return FaultPlan(**given)
+
+
+def _latency_sampler(latency):
+    if latency is None or latency == '':
+        return None
+    if isinstance(latency, str) and ':' in latency:
+        return _distribution_sampler(latency)
+    try:
+        seconds = float(latency)
+    except (TypeError, ValueError):
+        seconds = -1.0
+    if isinstance(latency, bool) or not seconds >= 0:
+        raise ValueError(f"latency must be a non-negative number of seconds, got {latency!r}")
+    return lambda rng: seconds
+
+
+def _distribution_sampler(latency):
+    name, _, params = latency.partition(':')
+    name = name.strip().lower()
+    try:
+        size, sample = _DISTRIBUTIONS[name]
+        values = [float(value) for value in params.split(',')]
+    except (KeyError, ValueError):
+        size, values = 0, None
+    if values is None or len(values) != size or min(values) < 0 or (
+        name == 'exponential' and values[0] == 0
+    ):
+        raise ValueError(
+            f"Unsupported latency {latency!r}, expected seconds or one of: "
+            f"uniform:LOW,HIGH, normal:MEAN,STDEV, exponential:MEAN"
+        )
+    # Negative draws of the normal distribution wait no time
+    return lambda rng: max(0.0, sample(rng, *values))
@@ -0,0 +1,133 @@
+"""Lazily loaded file payloads used as mock return values."""
+import csv
+import json
+import mmap
+import os
+import threading
+from collections import OrderedDict
+
+# Payload formats by file extension
+FILE_FORMATS = {
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.csv': 'csv',
+    '.bin': 'bytes',
+}
+DEFAULT_CACHE_SIZE = 256 * 1024 * 1024
+
+
+class PayloadCache:
+    """Size-bounded LRU cache of parsed file payloads.
+
+    Entries are keyed by path, format and modification time, so a changed
+    file is loaded again. The size of an entry is the size of its file.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_SIZE):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Total file size of the cached payloads in bytes."""
+        return self._size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, path: str, file_format: str):
+        """Return the payload of a file, loading it on a cache miss."""
+        stat = os.stat(path)
+        key = (path, file_format, stat.st_mtime_ns)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+        payload = _LOADERS[file_format](path)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = (payload, stat.st_size)
+                self._size += stat.st_size
+                self._evict()
+        return payload
+
+    def resize(self, max_bytes: int):
+        """Change the cache size limit, evicting payloads if needed."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """Drop all cached payloads."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _evict(self):
+        # The newest entry is kept even if it alone exceeds the limit
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size -= size
+
+
+# Shared by all mocks, tests and library instances
+PAYLOAD_CACHE = PayloadCache()
+
+
+class FilePayload:
+    """Side effect returning the payload of a file, loaded on the first call.
+
+    JSON Lines files are returned as a list of parsed lines and CSV files
+    as a list of row tuples. Files in the ``bytes`` format are memory-mapped
+    and returned as a read-only ``memoryview`` without copying.
+    """
+
+    __slots__ = ('path', 'file_format')
+
+    def __init__(self, path: str, file_format: str = None):
+        self.path = os.path.abspath(path)
+        if not os.path.isfile(self.path):
+            raise FileNotFoundError(f"Return value file not found: {self.path}")
+        if file_format is None:
+            extension = os.path.splitext(self.path)[1].lower()
+            file_format = FILE_FORMATS.get(extension, 'bytes')
+        file_format = file_format.lower()
+        if file_format not in _LOADERS:
+            raise ValueError(
+                f"Unsupported file format '{file_format}', "
+                f"expected one of: {', '.join(_LOADERS)}"
+            )
+        self.file_format = file_format
+
+    def __call__(self, *args, **kwargs):
+        return PAYLOAD_CACHE.get(self.path, self.file_format)
+
+    def __repr__(self):
+        return f"FilePayload({self.path!r}, {self.file_format!r})"
+
+
+def _load_jsonl(path):
+    with open(path, encoding='utf-8') as file:
+        return [json.loads(line) for line in file if line.strip()]
+
+
+def _load_csv(path):
+    with open(path, encoding='utf-8', newline='') as file:
+        return [tuple(row) for row in csv.reader(file)]
+
+
+def _load_bytes(path):
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return memoryview(b'')
+        # The mapping stays valid after the file is closed
+        return memoryview(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+_LOADERS = {
+    'jsonl': _load_jsonl,
+    'csv': _load_csv,
+    'bytes': _load_bytes,
+}
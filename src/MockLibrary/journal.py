@@ -0,0 +1,300 @@
+"""Per-process journal of mocked keyword calls and merging of journals.
+
+Every process writes its own JSON Lines file, so parallel runs, for example
+with pabot, need no coordination. Two kinds of records are written:
+
+- ``{"mock": keyword, "lib": library}`` when a keyword is mocked
+- ``{"kw": keyword, "lib": library, "args": hash, "ts": timestamp,
+  "test": test, "ns": duration}`` for every call of a mocked keyword
+
+The journals of a run can be merged into one summary from the command line::
+
+    python -m MockLibrary.journal journals/ --output summary.json --expect "query>=3"
+"""
+import atexit
+import glob
+import hashlib
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List
+
+from .naming import normalize_keyword_name
+
+# Journals by directory, one per process
+_JOURNALS = {}
+_JOURNALS_LOCK = threading.Lock()
+_BUFFER_SIZE = 64 * 1024
+
+
+def get_journal(directory: str) -> 'CallJournal':
+    """Return the journal of this process writing into ``directory``.
+
+    All libraries journaling into the same directory share one file.
+    """
+    directory = os.path.abspath(directory)
+    with _JOURNALS_LOCK:
+        journal = _JOURNALS.get(directory)
+        if journal is None or journal.closed:
+            journal = _JOURNALS[directory] = CallJournal(directory)
+        return journal
+
+
+def args_hash(args: tuple, kwargs: dict) -> str:
+    """Hash call arguments independently of the order of named arguments."""
+    normalized = repr((args, sorted(kwargs.items())))
+    return hashlib.blake2b(normalized.encode('utf-8'), digest_size=8).hexdigest()
+
+
+class CallJournal:
+    """Buffered writer of mock and call records of one process.
+
+    Also a Robot Framework listener, so that calls are recorded with the
+    full name of the running test.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, directory: str):
+        """Open the journal file of this process in ``directory``.
+
+        Args:
+            directory: Directory of the journal files, created if needed
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(
+            directory, f"mock-journal-{socket.gethostname()}-{os.getpid()}.jsonl"
+        )
+        self._file = open(self.path, 'a', encoding='utf-8', buffering=_BUFFER_SIZE)  # pylint: disable=consider-using-with
+        self._lock = threading.Lock()
+        self._test = None
+        atexit.register(self.close)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the journal file has been closed."""
+        return self._file.closed
+
+    def wrap(self, library: str, keyword_name: str, mock: Any) -> 'JournaledMock':
+        """Record that ``keyword_name`` is mocked and journal the calls of ``mock``."""
+        self._write({'mock': keyword_name, 'lib': library})
+        return JournaledMock(mock, self, library, keyword_name)
+
+    def record(self, library: str, keyword_name: str, args: tuple, kwargs: dict,  # pylint: disable=too-many-arguments
+               duration_ns: int):
+        """Record one call of a mocked keyword."""
+        self._write({
+            'kw': keyword_name, 'lib': library, 'args': args_hash(args, kwargs),
+            'ts': time.time(), 'test': self._test, 'ns': duration_ns,
+        })
+
+    def flush(self):
+        """Write buffered records to the journal file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+
+    def close(self):
+        """Flush and close the journal file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def start_test(self, _data, result):
+        """Remember the running test for the call records."""
+        self._test = result.full_name
+
+    def end_test(self, _data, _result):
+        """Forget the finished test."""
+        self._test = None
+
+    def end_suite(self, _data, _result):
+        """Flush the records of the finished suite."""
+        self.flush()
+
+    def _write(self, record):
+        line = json.dumps(record, separators=(',', ':'), default=str) + '\n'
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line)
+
+
+class JournaledMock:
+    """Callable recording every call of the wrapped mock in a journal.
+
+    Other attributes, such as ``call_count``, are read from the wrapped mock.
+    """
+
+    __slots__ = ('mock', '_journal', '_library', '_keyword_name')
+
+    def __init__(self, mock: Any, journal: CallJournal, library: str, keyword_name: str):
+        self.mock = mock
+        self._journal = journal
+        self._library = library
+        self._keyword_name = keyword_name
+
+    def __call__(self, *args, **kwargs):
+        start = time.perf_counter_ns()
+        try:
+            return self.mock(*args, **kwargs)
+        finally:
+            self._journal.record(
+                self._library, self._keyword_name, args, kwargs,
+                time.perf_counter_ns() - start
+            )
+
+    def __getattr__(self, name):
+        return getattr(self.mock, name)
+
+
+def merge_journals(paths: Iterable[str]) -> Dict[str, Any]:
+    """Merge journal files into one summary.
+
+    Args:
+        paths: Journal files, or directories containing ``mock-journal-*.jsonl`` files
+
+    Returns:
+        Dictionary with the number of merged ``journals`` and a ``keywords``
+        dictionary keyed by ``library.keyword``, each with the ``calls``,
+        distinct ``tests`` and ``arguments``, ``total_ns`` and ``processes``
+        of the keyword. Keywords that were mocked but never called are
+        listed in ``unused``.
+    """
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, 'mock-journal-*.jsonl'))))
+        else:
+            files.append(path)
+    keywords = {}
+    for index, file_path in enumerate(files):
+        with open(file_path, encoding='utf-8') as file:
+            for line in file:
+                if line.strip():
+                    _merge_record(keywords, json.loads(line), index)
+    summary = {
+        name: {
+            'calls': stats['calls'],
+            'tests': len(stats['tests']),
+            'arguments': len(stats['arguments']),
+            'total_ns': stats['total_ns'],
+            'processes': len(stats['processes']),
+        }
+        for name, stats in sorted(keywords.items())
+    }
+    return {
+        'journals': len(files),
+        'keywords': summary,
+        'unused': [name for name, stats in summary.items() if not stats['calls']],
+    }
+
+
+def check_expectations(summary: Dict[str, Any], expectations: Iterable[str]) -> List[str]:
+    """Check call count expectations against a merged summary.
+
+    Args:
+        summary: Summary returned by ``merge_journals``
+        expectations: Expectations like ``query>=3``, ``DateTime.Convert Time==1``
+            or ``execute_sql<10``. Keywords are matched with or without the
+            library name, ignoring case, spaces and underscores.
+
+    Returns:
+        Messages of the expectations that were not met
+    """
+    failures = []
+    for expectation in expectations:
+        for operator, compare in _OPERATORS:
+            if operator in expectation:
+                name, expected = expectation.split(operator, 1)
+                break
+        else:
+            failures.append(f"Invalid expectation '{expectation}'")
+            continue
+        try:
+            expected = int(expected)
+        except ValueError:
+            failures.append(f"Invalid expectation '{expectation}', expected a call count")
+            continue
+        calls = _count_calls(summary, name.strip())
+        if not compare(calls, expected):
+            failures.append(f"Expected '{name.strip()}' {operator} {expected} calls, got {calls}")
+    return failures
+
+
+_OPERATORS = (
+    ('>=', lambda calls, expected: calls >= expected),
+    ('<=', lambda calls, expected: calls <= expected),
+    ('==', lambda calls, expected: calls == expected),
+    ('>', lambda calls, expected: calls > expected),
+    ('<', lambda calls, expected: calls < expected),
+)
+
+
+def _summary_key(record, name_field):
+    return f"{record.get('lib')}.{normalize_keyword_name(record[name_field])}"
+
+
+def _merge_record(keywords, record, process):
+    if 'mock' in record:
+        keywords.setdefault(_summary_key(record, 'mock'), _new_stats())
+        return
+    stats = keywords.setdefault(_summary_key(record, 'kw'), _new_stats())
+    stats['calls'] += 1
+    stats['tests'].add(record.get('test'))
+    stats['arguments'].add(record.get('args'))
+    stats['total_ns'] += record.get('ns', 0)
+    stats['processes'].add(process)
+
+
+def _new_stats():
+    return {'calls': 0, 'tests': set(), 'arguments': set(), 'total_ns': 0, 'processes': set()}
+
+
+def _count_calls(summary, name):
+    wanted = normalize_keyword_name(name)
+    return sum(
+        stats['calls'] for key, stats in summary['keywords'].items()
+        if normalize_keyword_name(key) == wanted
+        or normalize_keyword_name(key.rsplit('.', 1)[-1]) == wanted
+    )
+
+
+def main(argv: List[str] = None) -> int:
+    """Merge journal files and check call count expectations."""
+    import argparse  # pylint: disable=import-outside-toplevel
+    parser = argparse.ArgumentParser(
+        prog='python -m MockLibrary.journal',
+        description='Merge mock call journals of parallel runs into one summary.'
+    )
+    parser.add_argument('paths', nargs='+', help='journal files or directories')
+    parser.add_argument('--output', help='write the summary as JSON to this file')
+    parser.add_argument(
+        '--expect', action='append', default=[],
+        help="call count expectation like 'query>=3', can be given many times"
+    )
+    parser.add_argument(
+        '--fail-on-unused', action='store_true',
+        help='fail if a mocked keyword was never called'
+    )
+    args = parser.parse_args(argv)
+
+    summary = merge_journals(args.paths)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, indent=2)
+    else:
+        print(json.dumps(summary, indent=2))
+
+    failures = check_expectations(summary, args.expect)
+    if args.fail_on_unused:
+        failures.extend(f"Mocked keyword '{name}' was never called" for name in summary['unused'])
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
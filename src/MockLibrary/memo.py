@@ -0,0 +1,99 @@
+"""Memoizing pass-through of keywords to their original implementation."""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict
+
+from .responses import freeze
+
+_NO_RESULT = object()
+
+
+def get_memo_info(mock: Any, keyword_name: str) -> Dict[str, Any]:
+    """Return the info of the memo cache a keyword mock passes its calls through.
+
+    Raises:
+        AssertionError: If the keyword is not memoized
+    """
+    side_effect = getattr(mock, 'side_effect', None)
+    # Timed side effects wrap the memo cache
+    side_effect = getattr(side_effect, 'side_effect', side_effect)
+    if not isinstance(side_effect, MemoCache):
+        raise AssertionError(f"Keyword '{keyword_name}' is not cached")
+    return side_effect.info()
+
+
+class MemoCache:
+    """Side effect returning memoized results of the original keyword.
+
+    Results are kept per argument combination in an LRU cache of at most
+    ``max_size`` entries, expiring ``ttl`` seconds after they were computed.
+    The original only runs on a miss. Calls with unhashable arguments and
+    calls raising an exception are not memoized.
+    """
+
+    __slots__ = ('_original', 'max_size', 'ttl', 'hits', 'misses', '_entries', '_lock')
+
+    def __init__(self, original: Callable, max_size: int = 128, ttl: float = None):
+        """Initialize the memo cache.
+
+        Args:
+            original: Original implementation of the keyword
+            max_size: Maximum number of memoized argument combinations
+            ttl: Seconds a result is returned for, None to keep it until evicted
+
+        Raises:
+            ValueError: If ``max_size`` is not positive
+        """
+        if max_size < 1:
+            raise ValueError(f"Cache size must be a positive integer, got {max_size}")
+        self._original = original
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        try:
+            key = (freeze(args), freeze(kwargs))
+            hash(key)
+        except TypeError:
+            with self._lock:
+                self.misses += 1
+            return self._original(*args, **kwargs)
+
+        now = time.monotonic()
+        with self._lock:
+            result, expires = self._entries.get(key, (_NO_RESULT, None))
+            if result is not _NO_RESULT and (expires is None or expires > now):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+
+        result = self._original(*args, **kwargs)
+        with self._lock:
+            self._entries[key] = (result, None if self.ttl is None else now + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self):
+        """Forget all memoized results and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> Dict[str, Any]:
+        """Return the hit and miss counts, the number of memoized results and the limits."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+            }
@@ -0,0 +1,243 @@
+"""Loading and validation of mock tables used by the Mock Keywords keyword."""
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, List, Union
+
+from .factories import check_factory
+from .faults import FAULT_OPTIONS, fault_plan
+from .recorder import RETENTION_MODES, create_mock
+from .responses import ResponseTable
+from .sequences import EXHAUSTION_MODES
+
+# Options a single mock specification may contain
+SPEC_OPTIONS = (
+    'return_value', 'side_effect', 'retention', 'history', 'return_value_file', 'file_format',
+    'sequence', 'exhaustion', 'responses', 'return_value_factory', 'share_return_value',
+    *FAULT_OPTIONS
+)
+
+# Options a row of a response table may contain
+ROW_OPTIONS = ('args', 'kwargs', 'return_value')
+
+
+def load_mock_table(mocks: Union[Dict[str, Any], str]) -> Dict[str, dict]:
+    """Load and validate a table of keyword name to mock specification.
+
+    Args:
+        mocks: Dictionary, or path to a JSON or YAML file containing one,
+            mapping keyword names to dictionaries with any of the
+            ``Mock Keyword`` options listed in ``SPEC_OPTIONS``
+
+    Returns:
+        Dictionary mapping keyword names to validated specifications
+
+    Raises:
+        FileNotFoundError: If the mock table file does not exist
+        ValueError: If the table or any specification in it is malformed
+    """
+    if isinstance(mocks, (str, os.PathLike)):
+        mocks = _read_table_file(os.fspath(mocks))
+    if not isinstance(mocks, dict):
+        raise ValueError(
+            f"Mock table must be a dictionary, got {type(mocks).__name__}"
+        )
+    # Specifications are copied, response tables are loaded into the copies
+    mocks = {
+        keyword_name: dict(spec) if isinstance(spec, dict) else spec
+        for keyword_name, spec in mocks.items()
+    }
+    errors = []
+    for keyword_name, spec in mocks.items():
+        errors.extend(_validate_spec(keyword_name, spec))
+    if errors:
+        raise ValueError("Invalid mock table:\n" + "\n".join(errors))
+    return mocks
+
+
+def load_responses(responses: Union[List[dict], Dict[Any, Any], str]) -> List[dict]:
+    """Load and validate the rows of a response table.
+
+    Args:
+        responses: List of rows with the keys ``args`` (positional
+            arguments), ``kwargs`` (named arguments) and ``return_value``,
+            a dictionary mapping the only argument of a call to its return
+            value, or path to a JSON or YAML file containing either
+
+    Returns:
+        List of rows for ``ResponseTable``
+
+    Raises:
+        FileNotFoundError: If the response table file does not exist
+        ValueError: If the table or any row in it is malformed
+    """
+    if isinstance(responses, (str, os.PathLike)):
+        responses = _read_table_file(os.fspath(responses))
+    if isinstance(responses, dict):
+        return [
+            {'args': [value], 'return_value': response}
+            for value, response in responses.items()
+        ]
+    if not isinstance(responses, (list, tuple)):
+        raise ValueError(
+            f"Response table must be a list or a dictionary, got {type(responses).__name__}"
+        )
+    errors = []
+    for number, row in enumerate(responses, start=1):
+        errors.extend(_validate_row(number, row))
+    if errors:
+        raise ValueError("Invalid response table:\n" + "\n".join(errors))
+    return list(responses)
+
+
+def create_mocks(
+    table: Dict[str, dict], retention: str, history: int, shared_results: dict = None
+) -> Dict[str, Any]:
+    """Create the mocks of a validated mock table.
+
+    Args:
+        table: Table returned by ``load_mock_table``
+        retention: Retention mode for specifications that do not set one
+        history: History size for specifications that do not set one
+        shared_results: Factory results shared by specifications with
+            ``share_return_value``
+
+    Returns:
+        Dictionary mapping keyword names to their mocks, without the faults
+        of the specifications, which are injected when the mocks are installed
+    """
+    created = {}
+    for keyword_name, spec in table.items():
+        spec = {
+            **{option: value for option, value in spec.items() if option not in FAULT_OPTIONS},
+            'retention': spec.get('retention') or retention,
+            'history': spec.get('history') or history,
+        }
+        if spec.pop('share_return_value', False):
+            spec['shared_results'] = shared_results
+        responses = spec.pop('responses', None)
+        if responses is not None:
+            # Calls no row matches return the return value
+            spec['side_effect'] = ResponseTable(responses, spec.pop('return_value', None))
+        created[keyword_name] = create_mock(**spec)
+    return created
+
+
+def resolve_keywords(
+    keyword_names: Iterable[str], resolve: Callable[[str], Any], location: Any
+) -> Dict[str, Any]:
+    """Resolve all keyword names, failing once for all names that are not found.
+
+    Args:
+        keyword_names: Keyword names to resolve
+        resolve: Callable resolving one name, raising AttributeError if not found
+        location: Library or resource reported in the error message
+
+    Returns:
+        Dictionary mapping keyword names to what ``resolve`` returned
+
+    Raises:
+        AttributeError: If any of the keywords is not found
+    """
+    resolved = {}
+    missing = []
+    for keyword_name in keyword_names:
+        try:
+            resolved[keyword_name] = resolve(keyword_name)
+        except AttributeError:
+            missing.append(keyword_name)
+    if missing:
+        raise AttributeError(
+            f"Keywords {', '.join(repr(name) for name in missing)} not found in {location}"
+        )
+    return resolved
+
+
+def _read_table_file(path: str):
+    abs_path = os.path.abspath(path)
+    if not os.path.isfile(abs_path):
+        raise FileNotFoundError(f"Mock table file not found: {abs_path}")
+    extension = os.path.splitext(abs_path)[1].lower()
+    with open(abs_path, encoding='utf-8') as file:
+        if extension in ('.yaml', '.yml'):
+            try:
+                import yaml  # pylint: disable=import-outside-toplevel
+            except ImportError as err:
+                raise ValueError(
+                    f"Reading {abs_path} requires PyYAML. "
+                    f"Install it with 'pip install robotframework-mock[yaml]'."
+                ) from err
+            return yaml.safe_load(file)
+        if extension == '.json':
+            return json.load(file)
+    raise ValueError(f"Unsupported mock table file type '{extension}': {abs_path}")
+
+
+def _validate_spec(keyword_name, spec):  # pylint: disable=too-many-branches
+    if not isinstance(keyword_name, str) or not keyword_name.strip():
+        return [f"- Keyword name must be a non-empty string, got {keyword_name!r}"]
+    if not isinstance(spec, dict):
+        return [f"- '{keyword_name}': specification must be a dictionary, got {spec!r}"]
+    errors = [
+        f"- '{keyword_name}': unknown option '{option}'"
+        for option in spec if option not in SPEC_OPTIONS
+    ]
+    side_effect = spec.get('side_effect')
+    if isinstance(side_effect, (str, bytes, dict)):
+        errors.append(
+            f"- '{keyword_name}': side_effect must be a callable, an exception "
+            f"or a list of values"
+        )
+    sources = [
+        option for option in (
+            'side_effect', 'return_value_file', 'sequence', 'responses', 'return_value_factory'
+        ) if spec.get(option) is not None
+    ]
+    if len(sources) > 1:
+        errors.append(f"- '{keyword_name}': use only one of {', '.join(sources)}")
+    responses = spec.get('responses')
+    if responses is not None:
+        try:
+            spec['responses'] = load_responses(responses)
+        except (OSError, ValueError) as err:
+            errors.append(f"- '{keyword_name}': {err}".replace("\n", "\n  "))
+    factory = spec.get('return_value_factory')
+    if factory is not None:
+        try:
+            check_factory(factory)
+        except ValueError as err:
+            errors.append(f"- '{keyword_name}': {err}")
+    try:
+        fault_plan(spec)
+    except ValueError as err:
+        errors.append(f"- '{keyword_name}': {err}")
+    if not isinstance(spec.get('share_return_value', False), bool):
+        errors.append(f"- '{keyword_name}': share_return_value must be true or false")
+    exhaustion = spec.get('exhaustion')
+    if exhaustion is not None and str(exhaustion).lower() not in EXHAUSTION_MODES:
+        errors.append(f"- '{keyword_name}': unsupported exhaustion mode '{exhaustion}'")
+    retention = spec.get('retention')
+    if retention is not None and str(retention).lower() not in RETENTION_MODES:
+        errors.append(f"- '{keyword_name}': unsupported retention mode '{retention}'")
+    history = spec.get('history')
+    if history is not None and (isinstance(history, bool) or not isinstance(history, int)
+                                or history < 1):
+        errors.append(f"- '{keyword_name}': history must be a positive integer")
+    return errors
+
+
+def _validate_row(number, row):
+    if not isinstance(row, dict):
+        return [f"- row {number}: must be a dictionary, got {row!r}"]
+    errors = [
+        f"- row {number}: unknown option '{option}'"
+        for option in row if option not in ROW_OPTIONS
+    ]
+    args = row.get('args')
+    if args is not None and not isinstance(args, (list, tuple)):
+        errors.append(f"- row {number}: args must be a list, got {args!r}")
+    kwargs = row.get('kwargs')
+    if kwargs is not None and not (
+        isinstance(kwargs, dict) and all(isinstance(name, str) for name in kwargs)
+    ):
+        errors.append(f"- row {number}: kwargs must be a dictionary with string keys")
+    return errors
@@ -0,0 +1,21 @@
+"""Keyword name normalization shared by MockLibrary and MockResource."""
+from functools import lru_cache
+
+from robot.utils import normalize
+
+
+@lru_cache(maxsize=4096)
+def normalize_keyword_name(keyword_name: str) -> str:
+    """Normalize a keyword name the way Robot Framework matches keywords.
+
+    Case, spaces and underscores are ignored, so ``My Keyword``,
+    ``my keyword`` and ``my_keyword`` all normalize to ``mykeyword``.
+    Results are memoized in a bounded cache.
+
+    Args:
+        keyword_name: Keyword name to normalize
+
+    Returns:
+        The normalized keyword name
+    """
+    return normalize(keyword_name, ignore='_')
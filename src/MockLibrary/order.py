@@ -0,0 +1,179 @@
+"""Process-wide order of mocked keyword calls, shared by all libraries.
+
+Every call of a mocked keyword gets the next sequence number of one
+append-only journal. Calls are stored as interned keyword ids in an
+``array``, and every keyword has a sorted array of the sequence numbers of
+its calls, so ordering checks bisect these indexes instead of scanning all
+calls.
+
+Keywords are looked up by name, like ``Connect``, or qualified with their
+library or resource file name, like ``DatabaseLibrary.Connect``. Only the
+mocks of libraries imported with ``record_order`` record their calls.
+"""
+import os
+import threading
+from array import array
+from bisect import bisect_right
+from functools import partial
+from typing import Callable, List
+
+from .naming import normalize_keyword_name
+
+# Calls listed in a failure message, at most
+_SHOWN_CALLS = 20
+
+
+class CallOrder:
+    """Append-only journal of the calls of all mocked keywords of the process.
+
+    ``MockScopes`` clears the journal when a suite or a test starts, so
+    verification only sees the calls of the running suite setup or test,
+    and ``Reset Mocks`` clears it too.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Keyword ids by normalized qualified name, and their display names
+        self._ids = {}
+        self._names = []
+        # Positions of the calls of every keyword id, and of every name,
+        # qualified or not, any of them is known by
+        self._calls = array('I')
+        self._id_positions = []
+        self._positions = {}
+
+    def __len__(self):
+        return len(self._calls)
+
+    def register(self, owner: str, keyword_name: str) -> int:
+        """Return the id of ``keyword_name`` of ``owner``, interning it if needed.
+
+        Args:
+            owner: Name of the library or resource file of the keyword
+            keyword_name: Name of the keyword
+        """
+        name = normalize_keyword_name(keyword_name)
+        qualified = f"{normalize_keyword_name(owner)}.{name}"
+        with self._lock:
+            keyword_id = self._ids.get(qualified)
+            if keyword_id is None:
+                keyword_id = self._ids[qualified] = len(self._names)
+                self._names.append(f"{owner}.{keyword_name}")
+                self._id_positions.append((
+                    self._positions.setdefault(qualified, array('Q')),
+                    self._positions.setdefault(name, array('Q')),
+                ))
+            return keyword_id
+
+    def recorder(self, owner: str, keyword_name: str) -> Callable[[], None]:
+        """Return a callable appending a call of ``keyword_name`` of ``owner``."""
+        return partial(self.record, self.register(owner, keyword_name))
+
+    def record(self, keyword_id: int):
+        """Append a call of the keyword with id ``keyword_id``."""
+        qualified, name = self._id_positions[keyword_id]
+        with self._lock:
+            position = len(self._calls)
+            self._calls.append(keyword_id)
+            qualified.append(position)
+            name.append(position)
+
+    def clear(self):
+        """Forget all calls, keeping the interned keywords."""
+        with self._lock:
+            del self._calls[:]
+            for positions in self._positions.values():
+                del positions[:]
+
+    def verify_order(self, keyword_names: List[str]):
+        """Verify the keywords were called in the given order.
+
+        Other calls may come in between, and a keyword may be listed more
+        than once. Each keyword is looked up with one bisection of its
+        calls, after the call matched for the previous keyword.
+
+        Raises:
+            AssertionError: If the keywords were not called in this order
+        """
+        position = -1
+        with self._lock:
+            for index, keyword_name in enumerate(keyword_names):
+                positions = self._get_positions(keyword_name)
+                following = bisect_right(positions, position)
+                if following == len(positions):
+                    if not positions:
+                        raise AssertionError(f"Keyword '{keyword_name}' was not called")
+                    raise AssertionError(
+                        f"Keyword '{keyword_name}' was not called after "
+                        f"'{keyword_names[index - 1]}'. Calls: {self._describe(keyword_names)}"
+                    )
+                position = positions[following]
+
+    def verify_not_called_between(self, keyword_name: str, start: str, end: str):
+        """Verify a keyword was not called between calls of ``start`` and ``end``.
+
+        Every call of ``start`` is paired with the first call of ``end``
+        after it. Calls of ``start`` before that call of ``end`` belong to
+        the same window, so each window costs two bisections.
+
+        Raises:
+            AssertionError: If the keyword was called in a window, or no call
+                of ``start`` is followed by a call of ``end``
+        """
+        with self._lock:
+            calls = self._get_positions(keyword_name)
+            starts = self._get_positions(start)
+            ends = self._get_positions(end)
+            windows = 0
+            position = -1
+            while True:
+                next_start = bisect_right(starts, position)
+                if next_start == len(starts):
+                    break
+                next_end = bisect_right(ends, starts[next_start])
+                if next_end == len(ends):
+                    break
+                windows += 1
+                window_start, position = starts[next_start], ends[next_end]
+                call = bisect_right(calls, window_start)
+                if call < len(calls) and calls[call] < position:
+                    raise AssertionError(
+                        f"Keyword '{keyword_name}' was called between '{start}' and '{end}'. "
+                        f"Calls: {self._describe([start, keyword_name, end])}"
+                    )
+            if not windows:
+                raise AssertionError(f"Keyword '{start}' was not followed by '{end}'")
+
+    def _get_positions(self, keyword_name):
+        positions = self._positions.get(normalize_keyword_name(keyword_name))
+        return positions if positions is not None else array('Q')
+
+    def _describe(self, keyword_names):
+        # The first calls of the given keywords, in the order they were made
+        merged = sorted({
+            position for keyword_name in keyword_names
+            for position in self._get_positions(keyword_name)[:_SHOWN_CALLS]
+        })[:_SHOWN_CALLS]
+        return ', '.join(self._names[self._calls[position]] for position in merged)
+
+
+def get_call_order(recorded: bool) -> CallOrder:
+    """Return the call order of the process, for a library recording it or not.
+
+    Raises:
+        RuntimeError: If the library does not record the order of its calls
+    """
+    if not recorded:
+        raise RuntimeError(
+            "Call order is not recorded. Import the library with record_order=True."
+        )
+    return CALL_ORDER
+
+
+def resource_owner(source: str) -> str:
+    """Return the name qualifying keywords of a resource file, like Robot Framework does."""
+    return os.path.splitext(os.path.basename(source))[0] if source else ''
+
+
+# The call order of this process, shared by all MockLibrary and MockResource instances
+CALL_ORDER = CallOrder()
@@ -0,0 +1,277 @@
+"""Lightweight call recorders for mocked keywords."""
+import asyncio
+import inspect
+import sys
+import threading
+from collections import deque
+from typing import Any, Callable
+
+from .factories import LazyReturnValue
+from .fixtures import FilePayload
+from .sequences import SequenceSource
+
+# Retention modes accepted by create_mock, 'mock' keeps using unittest.mock.Mock
+RETENTION_MODES = ('mock', 'count', 'last', 'full')
+
+
+class CallRecorder:
+    """Callable stand-in for a keyword that records its calls compactly.
+
+    Supports the same ``return_value`` and ``side_effect`` semantics as
+    ``unittest.mock.Mock``, but keeps only as much call history as the
+    retention mode asks for:
+
+    - ``count``: only the number of calls
+    - ``last``: the arguments of the last ``history`` calls in a ring buffer
+    - ``full``: the arguments of every call
+    """
+
+    __slots__ = ('return_value', 'side_effect', 'call_count', '_calls', '_effects')
+
+    def __init__(
+        self, return_value: Any = None, side_effect: Any = None,
+        retention: str = 'count', history: int = 10
+    ):
+        self.return_value = return_value
+        self.side_effect = side_effect
+        self.call_count = 0
+        if retention == 'count':
+            self._calls = None
+        elif retention == 'last':
+            self._calls = deque(maxlen=int(history))
+        elif retention == 'full':
+            self._calls = []
+        else:
+            raise ValueError(f"Unsupported retention mode for CallRecorder: {retention}")
+        # Like Mock, iterables are consumed one item per call
+        self._effects = (
+            iter(side_effect)
+            if side_effect is not None and not callable(side_effect)
+            and not _is_exception(side_effect)
+            else None
+        )
+
+    def __call__(self, *args, **kwargs):
+        self.call_count += 1
+        if self._calls is not None:
+            self._calls.append((args, kwargs))
+        effect = self.side_effect
+        if effect is None:
+            return self.return_value
+        if _is_exception(effect):
+            raise effect
+        if self._effects is not None:
+            result = next(self._effects)
+            if _is_exception(result):
+                raise result
+        else:
+            result = effect(*args, **kwargs)
+        return self.return_value if _is_default(result) else result
+
+    @property
+    def called(self) -> bool:
+        """Whether the recorder has been called at least once."""
+        return self.call_count > 0
+
+    @property
+    def call_args_list(self) -> list:
+        """Retained calls as ``(args, kwargs)`` tuples, oldest first."""
+        return list(self._calls) if self._calls is not None else []
+
+    @property
+    def call_args(self):
+        """The last retained call as an ``(args, kwargs)`` tuple, or None."""
+        return self._calls[-1] if self._calls else None
+
+    def reset_mock(self):
+        """Forget all recorded calls."""
+        self.call_count = 0
+        if self._calls is not None:
+            self._calls.clear()
+
+
+class CallCounter:
+    """Call counter with one cell per thread, merged when it is read.
+
+    Each thread only ever increments its own cell, so counting needs no
+    lock. The lock is only taken when a thread counts its first call.
+    """
+
+    __slots__ = ('_cells', '_local', '_lock')
+
+    def __init__(self):
+        self._cells = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def increment(self):
+        """Count one call made by the current thread."""
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._local.cell = [0]
+            with self._lock:
+                self._cells.append(cell)
+        cell[0] += 1
+
+    @property
+    def value(self) -> int:
+        """Number of calls made by all threads."""
+        with self._lock:
+            return sum(cell[0] for cell in self._cells)
+
+    def reset(self):
+        """Set the count of every thread back to zero."""
+        with self._lock:
+            for cell in self._cells:
+                cell[0] = 0
+
+
+class CountingMock:
+    """Callable installed in place of a keyword, counting calls per thread.
+
+    Calls are counted with a ``CallCounter`` before they are delegated to
+    the wrapped mock, so ``call_count`` is exact even when the keyword is
+    run from several threads at once. ``record``, if given, is called
+    without arguments on every call, for example to append the call to a
+    ``CallOrder``. Other attributes are read from the wrapped mock.
+    """
+
+    __slots__ = ('mock', '_counter', '_record')
+
+    def __init__(self, mock, record: Callable[[], None] = None):
+        self.mock = mock
+        self._counter = CallCounter()
+        self._record = record
+
+    def __call__(self, *args, **kwargs):
+        self._counter.increment()
+        if self._record is not None:
+            self._record()
+        return self.mock(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.mock, name)
+
+    @property
+    def call_count(self) -> int:
+        """Number of calls made by all threads."""
+        return self._counter.value
+
+    @property
+    def called(self) -> bool:
+        """Whether the keyword has been called at least once."""
+        return self._counter.value > 0
+
+    def reset_mock(self):
+        """Forget all recorded calls."""
+        self._counter.reset()
+        self.mock.reset_mock()
+
+
+class AwaitableMock:
+    """Callable installed in place of a coroutine keyword, returning an awaitable.
+
+    The call is recorded by the wrapped mock when the keyword is called.
+    The returned coroutine waits ``delay`` seconds with ``asyncio.sleep``,
+    so other coroutines keep running meanwhile, and awaits the result if
+    the side effect is a coroutine function. Other attributes are read from
+    the wrapped mock.
+    """
+
+    __slots__ = ('mock', 'delay')
+
+    def __init__(self, mock, delay: float = None):
+        self.mock = mock
+        self.delay = delay
+
+    def __call__(self, *args, **kwargs):
+        return self._result(self.mock(*args, **kwargs))
+
+    def __getattr__(self, name):
+        return getattr(self.mock, name)
+
+    async def _result(self, result):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+
+def _is_exception(value) -> bool:
+    return isinstance(value, BaseException) or (
+        isinstance(value, type) and issubclass(value, BaseException)
+    )
+
+
+def _is_default(result):
+    # Only a side effect that imported unittest.mock can return its DEFAULT
+    mock = sys.modules.get('unittest.mock')
+    return mock is not None and result is mock.DEFAULT
+
+
+def create_mock(  # pylint: disable=too-many-arguments
+    return_value: Any = None, side_effect: Callable = None, *,
+    retention: str = 'mock', history: int = 10,
+    return_value_file: str = None, file_format: str = None,
+    sequence: Any = None, exhaustion: str = 'raise',
+    return_value_factory: Any = None, shared_results: dict = None
+):
+    """Create the callable that replaces a mocked keyword.
+
+    Args:
+        return_value: Value to return when the keyword is called
+        side_effect: Callable, exception or iterable as with ``unittest.mock.Mock``
+        retention: One of ``mock`` (a full ``unittest.mock.Mock``), ``count``,
+            ``last`` or ``full``
+        history: Number of calls kept with the ``last`` retention mode
+        return_value_file: File whose payload is returned instead of
+            ``return_value``, loaded on the first call
+        file_format: Format of ``return_value_file`` or a ``sequence`` file:
+            ``jsonl``, ``csv`` or ``bytes`` (defaults to the file extension)
+        sequence: Generator factory, or JSON Lines or CSV file, whose values
+            are returned one per call without loading them all in memory
+        exhaustion: What an exhausted ``sequence`` does: ``raise``,
+            ``repeat_last`` or ``cycle``
+        return_value_factory: Callable, or ``module:function`` reference,
+            building the return value on the first call
+        shared_results: Results of ``return_value_factory`` shared with
+            other mocks, by factory (optional, by default per mock)
+
+    Returns:
+        A ``Mock`` or a ``CallRecorder``
+
+    Raises:
+        ValueError: If the retention mode, file format or exhaustion mode is
+            not supported, more than one of ``side_effect``,
+            ``return_value_file``, ``sequence`` and ``return_value_factory``
+            are given, or the factory is not a callable or a reference
+        FileNotFoundError: If ``return_value_file`` or a ``sequence`` file
+            does not exist
+    """
+    given = [
+        name for name, value in (
+            ('side_effect', side_effect), ('return_value_file', return_value_file),
+            ('sequence', sequence), ('return_value_factory', return_value_factory),
+        ) if value is not None and value != ''
+    ]
+    if len(given) > 1:
+        raise ValueError(f"Use only one of {', '.join(given)}")
+    if return_value_file:
+        side_effect = FilePayload(return_value_file, file_format)
+    elif sequence is not None:
+        side_effect = SequenceSource(sequence, exhaustion, file_format)
+    elif return_value_factory:
+        side_effect = LazyReturnValue(return_value_factory, shared_results)
+    retention = (retention or 'mock').lower()
+    if retention not in RETENTION_MODES:
+        raise ValueError(
+            f"Unsupported retention mode '{retention}', "
+            f"expected one of: {', '.join(RETENTION_MODES)}"
+        )
+    if retention == 'mock':
+        # unittest.mock is only imported once a keyword is mocked with it
+        from unittest.mock import Mock  # pylint: disable=import-outside-toplevel
+        return Mock(return_value=return_value, side_effect=side_effect)
+    return CallRecorder(return_value, side_effect, retention, history)
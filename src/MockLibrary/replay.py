@@ -0,0 +1,293 @@
+"""On-disk cache of real keyword results for recording and replaying them.
+
+A cache directory contains pickled results in segment files and a compact
+JSON index, ``index.json``, mapping the key of every result to its segment,
+offset, size and recording time::
+
+    {"version": 1, "entries": {"<key>": ["<segment>", offset, size, timestamp]}}
+
+Keys hash the library, the normalized keyword name and the canonicalized
+arguments of a call. Results are unpickled when replayed, so only replay
+caches you trust.
+"""
+import atexit
+import hashlib
+import json
+import os
+import socket
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+from .naming import normalize_keyword_name
+
+INDEX_FILE = 'index.json'
+INDEX_VERSION = 1
+
+# What replaying a call that was not recorded does
+MISS_POLICIES = ('fail', 'call')
+
+# Caches by directory, one per process
+_CACHES = {}
+_CACHES_LOCK = threading.Lock()
+
+# Recorded results buffered before they are written in one segment
+_BULK_SIZE = 1000
+
+
+def get_cache(directory: str) -> 'ReplayCache':
+    """Return the cache of this process stored in ``directory``.
+
+    All keywords recording into or replaying from the same directory share
+    one cache.
+    """
+    directory = os.path.abspath(directory)
+    with _CACHES_LOCK:
+        cache = _CACHES.get(directory)
+        if cache is None:
+            cache = _CACHES[directory] = ReplayCache(directory)
+        return cache
+
+
+def cache_key(library: str, keyword_name: str, args: tuple, kwargs: dict) -> str:
+    """Return the key of a keyword call, independent of the order of named arguments."""
+    canonical = json.dumps(
+        [library, normalize_keyword_name(keyword_name), list(args), kwargs],
+        sort_keys=True, separators=(',', ':'), default=repr
+    )
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ReplayCache:  # pylint: disable=too-many-instance-attributes
+    """Recorded keyword results stored in a directory.
+
+    Recorded results are kept in memory and written in bulk, one segment
+    file per write, when many are pending and when the process exits. Every
+    write merges the entries into the index on disk, evicts entries that are
+    too old or exceed the size limit and compacts the segments once more
+    than half of their bytes belong to evicted entries.
+    """
+
+    def __init__(self, directory: str):
+        """Open the cache in ``directory``, creating the directory if needed.
+
+        Args:
+            directory: Directory of the index and segment files
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_size = None
+        self.max_age = None
+        self._index_path = os.path.join(directory, INDEX_FILE)
+        self._entries = self._read_index()
+        self._pending = {}
+        self._segments = {}
+        self._lock = threading.RLock()
+        atexit.register(self.flush)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries.keys() | self._pending.keys())
+
+    def set_limits(self, max_size: int = None, max_age: float = None):
+        """Set the eviction limits applied when results are written.
+
+        Args:
+            max_size: Maximum total size of the pickled results in bytes
+            max_age: Maximum age of a result in seconds
+        """
+        with self._lock:
+            self.max_size = max_size
+            self.max_age = max_age
+
+    def get(self, key: str, max_age: float = None) -> Tuple[bool, Any]:
+        """Return whether ``key`` was recorded, and its result.
+
+        Args:
+            key: Key returned by ``cache_key``
+            max_age: Results recorded more than ``max_age`` seconds ago are
+                treated as not recorded
+        """
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is not None:
+                data, timestamp = pending
+            else:
+                entry = self._entries.get(key)
+                if entry is None:
+                    return False, None
+                segment, offset, size, timestamp = entry
+                data = self._read(segment, offset, size)
+        if max_age is not None and time.time() - timestamp > max_age:
+            return False, None
+        import pickle  # pylint: disable=import-outside-toplevel
+        return True, pickle.loads(data)
+
+    def put(self, key: str, result: Any) -> bool:
+        """Record the result of a call, returning False if it cannot be pickled."""
+        import pickle  # pylint: disable=import-outside-toplevel
+        try:
+            data = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        with self._lock:
+            self._pending[key] = (data, time.time())
+            if len(self._pending) >= _BULK_SIZE:
+                self.flush()
+        return True
+
+    def flush(self):
+        """Write the pending results and the index, evicting and compacting if needed."""
+        with self._lock:
+            if not self._pending and self.max_size is None and self.max_age is None:
+                return
+            if not os.path.isdir(self.directory):
+                # Removed since, for example a temporary directory
+                self._pending = {}
+                return
+            # The index on disk also has the entries written by other processes
+            entries = self._read_index()
+            if self._pending:
+                entries.update(self._write_segment(self._pending))
+                self._pending = {}
+            segments = {entry[0] for entry in entries.values()}
+            _evict(entries, self.max_size, self.max_age)
+            if _garbage_size(self.directory, entries) > sum(entry[2] for entry in entries.values()):
+                entries = self._compact(entries)
+            self._entries = entries
+            self._write_index()
+            # Only segments known to the index are removed, not the ones
+            # other processes are about to add to it
+            self._remove_segments(segments - {entry[0] for entry in entries.values()})
+
+    def _write_segment(self, results):
+        name = f"segment-{socket.gethostname()}-{os.getpid()}-{time.time_ns()}.pickle"
+        entries = {}
+        chunks = []
+        offset = 0
+        for key, (data, timestamp) in results.items():
+            entries[key] = [name, offset, len(data), timestamp]
+            chunks.append(data)
+            offset += len(data)
+        with open(os.path.join(self.directory, name), 'wb') as file:
+            file.write(b''.join(chunks))
+        return entries
+
+    def _compact(self, entries):
+        live = {
+            key: (self._read(*entry[:3]), entry[3]) for key, entry in entries.items()
+        }
+        return self._write_segment(live)
+
+    def _read(self, segment, offset, size):
+        file = self._segments.get(segment)
+        if file is None:
+            file = self._segments[segment] = open(  # pylint: disable=consider-using-with
+                os.path.join(self.directory, segment), 'rb'
+            )
+        file.seek(offset)
+        return file.read(size)
+
+    def _read_index(self):
+        if not os.path.isfile(self._index_path):
+            return {}
+        with open(self._index_path, encoding='utf-8') as file:
+            index = json.load(file)
+        if index.get('version') != INDEX_VERSION:
+            raise ValueError(f"Unsupported replay cache index version in {self._index_path}")
+        return index['entries']
+
+    def _write_index(self):
+        temporary = f"{self._index_path}.{os.getpid()}.tmp"
+        with open(temporary, 'w', encoding='utf-8') as file:
+            json.dump(
+                {'version': INDEX_VERSION, 'entries': self._entries}, file, separators=(',', ':')
+            )
+        os.replace(temporary, self._index_path)
+
+    def _remove_segments(self, segments):
+        for name in segments:
+            file = self._segments.pop(name, None)
+            if file is not None:
+                file.close()
+            path = os.path.join(self.directory, name)
+            if os.path.isfile(path):
+                os.remove(path)
+
+
+class RecordingCall:  # pylint: disable=too-few-public-methods
+    """Side effect calling the real keyword and recording its result."""
+
+    __slots__ = ('_original', '_cache', '_library', '_keyword_name')
+
+    def __init__(self, original: Callable, cache: ReplayCache, library: str, keyword_name: str):
+        self._original = original
+        self._cache = cache
+        self._library = library
+        self._keyword_name = keyword_name
+
+    def __call__(self, *args, **kwargs):
+        result = self._original(*args, **kwargs)
+        self._cache.put(cache_key(self._library, self._keyword_name, args, kwargs), result)
+        return result
+
+
+class ReplayingCall:  # pylint: disable=too-few-public-methods
+    """Side effect returning recorded results instead of calling the real keyword."""
+
+    __slots__ = ('_original', '_cache', '_library', '_keyword_name', '_on_miss', '_max_age')
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self, original: Callable, cache: ReplayCache, library: str, keyword_name: str, *,
+        on_miss: str = 'fail', max_age: float = None
+    ):
+        on_miss = (on_miss or 'fail').lower()
+        if on_miss not in MISS_POLICIES:
+            raise ValueError(
+                f"Unsupported miss policy '{on_miss}', "
+                f"expected one of: {', '.join(MISS_POLICIES)}"
+            )
+        self._original = original
+        self._cache = cache
+        self._library = library
+        self._keyword_name = keyword_name
+        self._on_miss = on_miss
+        self._max_age = max_age
+
+    def __call__(self, *args, **kwargs):
+        key = cache_key(self._library, self._keyword_name, args, kwargs)
+        found, result = self._cache.get(key, self._max_age)
+        if found:
+            return result
+        if self._on_miss == 'call':
+            return self._original(*args, **kwargs)
+        raise AssertionError(
+            f"No recorded result for keyword '{self._keyword_name}' "
+            f"with arguments {args!r} and {kwargs!r}"
+        )
+
+
+def _evict(entries: Dict[str, list], max_size: int, max_age: float):
+    # Remove entries older than max_age, then the oldest ones above max_size
+    if max_age is not None:
+        oldest = time.time() - max_age
+        for key in [key for key, entry in entries.items() if entry[3] < oldest]:
+            del entries[key]
+    if max_size is not None:
+        size = sum(entry[2] for entry in entries.values())
+        for key in sorted(entries, key=lambda key: entries[key][3]):
+            if size <= max_size:
+                break
+            size -= entries.pop(key)[2]
+
+
+def _garbage_size(directory, entries):
+    # Bytes of the referenced segment files not belonging to any entry
+    used = {}
+    for segment, _, size, _ in entries.values():
+        used[segment] = used.get(segment, 0) + size
+    return sum(
+        os.path.getsize(path) - size for path, size in (
+            (os.path.join(directory, segment), size) for segment, size in used.items()
+        ) if os.path.isfile(path)
+    )
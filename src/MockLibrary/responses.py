@@ -0,0 +1,101 @@
+"""Response tables returning a mocked keyword's value by its arguments."""
+import sys
+from typing import Any, List
+
+# Argument value in a response table row that matches any value
+WILDCARD = '*'
+
+_NO_RESPONSE = object()
+
+
+class ResponseTable:
+    """Side effect returning the response of the row matching the call arguments.
+
+    Rows are indexed by their argument values when the table is created,
+    so a call is answered with one dictionary lookup per wildcard pattern,
+    however many rows the table has. Rows without wildcards win over rows
+    with wildcards, rows with fewer wildcards over rows with more, and
+    earlier rows over later ones. Calls no row matches return ``default``.
+    """
+
+    __slots__ = ('default', '_shapes')
+
+    def __init__(self, rows: List[dict], default: Any = None):
+        self.default = default
+        # Calls are matched against the patterns of their shape, the number
+        # of positional and the names of named arguments, most specific first
+        self._shapes = {}
+        patterns = _index_rows(rows)
+        for (shape, wildcards), index in sorted(patterns.items(), key=lambda item: len(item[0][1])):
+            concrete = None
+            if wildcards:
+                concrete = tuple(
+                    position for position in range(shape[0] + len(shape[1]))
+                    if position not in wildcards
+                )
+            self._shapes.setdefault(shape, []).append((concrete, index))
+
+    def __call__(self, *args, **kwargs):
+        names = tuple(sorted(kwargs))
+        patterns = self._shapes.get((len(args), names))
+        if patterns:
+            try:
+                values = tuple(freeze(value) for value in args) + tuple(
+                    freeze(kwargs[name]) for name in names
+                )
+                for concrete, index in patterns:
+                    key = values if concrete is None else tuple(values[i] for i in concrete)
+                    response = index.get(key, _NO_RESPONSE)
+                    if response is not _NO_RESPONSE:
+                        return response
+            except TypeError:
+                # Unhashable arguments cannot match any row
+                pass
+        return self.default
+
+    def __len__(self):
+        return sum(len(index) for patterns in self._shapes.values() for _, index in patterns)
+
+    def __repr__(self):
+        return f"ResponseTable({len(self)} rows, default={self.default!r})"
+
+
+def _index_rows(rows):
+    # Index the responses by shape and wildcard positions, then by the
+    # values of the other arguments
+    patterns = {}
+    for number, row in enumerate(rows, start=1):
+        args = tuple(row.get('args') or ())
+        kwargs = row.get('kwargs') or {}
+        names = tuple(sorted(kwargs))
+        values = args + tuple(kwargs[name] for name in names)
+        wildcards = tuple(index for index, value in enumerate(values) if _is_wildcard(value))
+        key = tuple(
+            freeze(value) for index, value in enumerate(values) if index not in wildcards
+        )
+        try:
+            patterns.setdefault(((len(args), names), wildcards), {}).setdefault(
+                key, row.get('return_value')
+            )
+        except TypeError as err:
+            raise ValueError(f"Arguments of response table row {number} are not hashable") from err
+    return patterns
+
+
+def _is_wildcard(value):
+    if isinstance(value, str):
+        return value == WILDCARD
+    # unittest.mock.ANY can only be given once unittest.mock has been imported
+    mock = sys.modules.get('unittest.mock')
+    return mock is not None and value is mock.ANY
+
+
+def freeze(value: Any) -> Any:
+    """Return a hashable value comparing equal for equal lists, dictionaries and sets."""
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return frozenset((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
@@ -0,0 +1,81 @@
+"""Listener scoping mocks to the suite or test that created them."""
+from typing import Any, Callable, Dict, List
+
+from .order import CALL_ORDER
+
+
+class MockScopes:
+    """Robot Framework listener keeping suite and test level mocks apart.
+
+    Mocks created outside tests, for example in Suite Setup, form a base
+    layer that stays active for the whole suite. Mocks created in a test
+    are an overlay on top of it. Every suite and test has a frame that
+    remembers what each keyword it touched was mocked with before, and
+    only those keywords are restored when the suite or test ends. Base
+    layer mocks are neither re-created nor re-patched between tests, but
+    their call history, and the call order shared by all libraries, is
+    cleared when a test starts so that verification only sees the calls
+    of the running test.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, mocks: Dict[str, Any], restore: Callable[[str, Any], None]):
+        """Initialize the listener.
+
+        Args:
+            mocks: Active mocks of the library, keyed by normalized keyword name
+            restore: Callable restoring a keyword to the given mock, or to its
+                original implementation when the mock is None
+        """
+        self._mocks = mocks
+        self._restore = restore
+        self._frames = []
+        self._restoring = False
+
+    def record(self, name: str, previous: Any):
+        """Remember how ``name`` was mocked before the current scope changed it."""
+        if self._frames and not self._restoring:
+            self._frames[-1].setdefault(name, previous)
+
+    def clear(self):
+        """Forget all recorded changes, used when all mocks are reset."""
+        for frame in self._frames:
+            frame.clear()
+
+    def start_suite(self, _data, _result):
+        """Open a frame for mocks created in the suite."""
+        CALL_ORDER.clear()
+        self._frames.append({})
+
+    def end_suite(self, _data, _result):
+        """Restore keywords mocked in the suite."""
+        self._close_frame()
+
+    def start_test(self, _data, _result):
+        """Open a frame for mocks created in the test."""
+        for mock in self._mocks.values():
+            if mock.call_count:
+                mock.reset_mock()
+        CALL_ORDER.clear()
+        self._frames.append({})
+
+    def end_test(self, _data, _result):
+        """Restore keywords mocked in the test."""
+        self._close_frame()
+
+    def _close_frame(self):
+        if not self._frames:
+            return
+        frame = self._frames.pop()
+        self._restoring = True
+        try:
+            for name, previous in frame.items():
+                self._restore(name, previous)
+        finally:
+            self._restoring = False
+
+
+def library_listeners(*listeners: Any) -> List[Any]:
+    """Return the listeners a library registers, leaving out disabled ones."""
+    return [listener for listener in listeners if listener is not None]
@@ -0,0 +1,96 @@
+"""Lazily consumed sequences of mock return values."""
+import csv
+import json
+import os
+import threading
+from typing import Callable, Iterator, Union
+
+from .fixtures import FILE_FORMATS
+
+# What a sequence does when it runs out of values
+EXHAUSTION_MODES = ('raise', 'repeat_last', 'cycle')
+
+
+class SequenceSource:
+    """Side effect returning the next value of a lazily consumed sequence.
+
+    The sequence is either a generator factory, a callable returning a new
+    iterator, or a JSON Lines or CSV file read one line per call. Only the
+    current position and the last value are kept in memory, however long
+    the sequence is. When the sequence is exhausted it either raises
+    ``StopIteration``, keeps returning the last value or starts over.
+    """
+
+    __slots__ = ('_factory', 'exhaustion', '_iterator', '_last', '_lock')
+
+    _NO_VALUE = object()
+
+    def __init__(
+        self, source: Union[Callable[[], Iterator], str], exhaustion: str = 'raise',
+        file_format: str = None
+    ):
+        exhaustion = (exhaustion or 'raise').lower()
+        if exhaustion not in EXHAUSTION_MODES:
+            raise ValueError(
+                f"Unsupported exhaustion mode '{exhaustion}', "
+                f"expected one of: {', '.join(EXHAUSTION_MODES)}"
+            )
+        self.exhaustion = exhaustion
+        self._factory = source if callable(source) else _file_factory(source, file_format)
+        self._iterator = None
+        self._last = self._NO_VALUE
+        self._lock = threading.Lock()
+
+    def __call__(self, *args, **kwargs):
+        with self._lock:
+            if self._iterator is None:
+                self._iterator = iter(self._factory())
+            try:
+                self._last = next(self._iterator)
+                return self._last
+            except StopIteration:
+                return self._exhausted()
+
+    def _exhausted(self):
+        if self.exhaustion == 'repeat_last' and self._last is not self._NO_VALUE:
+            return self._last
+        if self.exhaustion == 'cycle':
+            self._iterator = iter(self._factory())
+            try:
+                self._last = next(self._iterator)
+                return self._last
+            except StopIteration:
+                pass
+        raise StopIteration("Mocked keyword has no more values in its sequence")
+
+    def __repr__(self):
+        return f"SequenceSource({self._factory!r}, {self.exhaustion!r})"
+
+
+def _file_factory(path, file_format):
+    abs_path = os.path.abspath(path)
+    if not os.path.isfile(abs_path):
+        raise FileNotFoundError(f"Sequence file not found: {abs_path}")
+    if file_format is None:
+        file_format = FILE_FORMATS.get(os.path.splitext(abs_path)[1].lower())
+    file_format = (file_format or '').lower()
+    if file_format == 'jsonl':
+        return lambda: _read_jsonl(abs_path)
+    if file_format == 'csv':
+        return lambda: _read_csv(abs_path)
+    raise ValueError(
+        f"Unsupported sequence file format '{file_format}', expected one of: jsonl, csv"
+    )
+
+
+def _read_jsonl(path):
+    with open(path, encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _read_csv(path):
+    with open(path, encoding='utf-8', newline='') as file:
+        for row in csv.reader(file):
+            yield tuple(row)
@@ -0,0 +1,170 @@
+"""Snapshot files of the mocks of a MockLibrary or MockResource instance.
+
+A snapshot is a pickled dictionary::
+
+    {"version": 1, "kind": "library", "target": "<library class or resource file>",
+     "keywords": {"<keyword name>": {"location": "<method name or resource path>",
+                                     "spec": {<Mock Keywords options>}, "delay": None}}}
+
+Specifications are the ``Mock Keywords`` options the mocks were created
+from, already validated and with response tables already indexed, so
+loading a snapshot creates the mocks without reading, validating or
+indexing a mock table again. The location of every keyword is
+compared with the one it resolves to when the snapshot is loaded, so a
+snapshot saved before a keyword moved fails instead of mocking the wrong
+implementation. Snapshots are unpickled when loaded, so only load
+snapshots you trust.
+"""
+import os
+from typing import Any, Callable, Dict
+
+# Version of the snapshot format, snapshots of other versions are rejected
+SNAPSHOT_VERSION = 1
+
+# Mock Keyword options that are not stored when they have their default value
+_DEFAULTS = {'exhaustion': 'raise', 'share_return_value': False}
+
+
+def mock_spec(**options: Any) -> Dict[str, Any]:
+    """Return the ``Mock Keywords`` specification of a mock created with ``options``.
+
+    Options that are None or have their default value are left out, and
+    file names are made absolute, so the snapshot does not depend on the
+    working directory.
+    """
+    spec = {
+        option: value for option, value in options.items()
+        if value is not None and value != '' and _DEFAULTS.get(option) != value
+    }
+    for option in ('return_value_file', 'sequence'):
+        if isinstance(spec.get(option), (str, os.PathLike)):
+            spec[option] = os.path.abspath(spec[option])
+    return spec
+
+
+def compiled_spec(spec: Dict[str, Any], mock: Any) -> Dict[str, Any]:
+    """Return ``spec`` with its response table replaced by the indexed table of ``mock``.
+
+    The table is pickled with its index, so loading the snapshot does not
+    index the rows again.
+    """
+    if spec.get('responses') is None:
+        return spec
+    spec = {
+        option: value for option, value in spec.items()
+        if option not in ('responses', 'return_value')
+    }
+    spec['side_effect'] = mock.side_effect
+    return spec
+
+
+def snapshot_keywords(
+    mocks: Dict[str, Any], specs: Dict[Any, tuple], locate: Callable[[str], Any]
+) -> Dict[str, dict]:
+    """Return the snapshot entries of the active mocks of a library.
+
+    Args:
+        mocks: Active mocks by normalized keyword name
+        specs: Keyword name, specification and delay of the mocks created
+            from values, by mock
+        locate: Returns the location of a normalized keyword name
+
+    Raises:
+        ValueError: If a mock was not created from values
+    """
+    keywords = {}
+    unsaved = []
+    for name, mock in mocks.items():
+        saved = specs.get(mock)
+        if saved is None:
+            unsaved.append(name)
+            continue
+        keyword_name, spec, delay = saved
+        keywords[keyword_name] = {'location': locate(name), 'spec': spec, 'delay': delay}
+    if unsaved:
+        raise ValueError(
+            f"Mocks of keywords {', '.join(repr(name) for name in unsaved)} were not "
+            f"created from values and cannot be saved"
+        )
+    return keywords
+
+
+def save_snapshot(path: str, kind: str, target: str, keywords: Dict[str, dict]) -> str:
+    """Write a snapshot file, replacing an existing one atomically.
+
+    Args:
+        path: File to write
+        kind: ``library`` or ``resource``
+        target: Library class or resource file the keywords belong to
+        keywords: Keyword names mapped to their ``location``, ``spec`` and ``delay``
+
+    Returns:
+        Absolute path of the written file
+
+    Raises:
+        ValueError: If a specification cannot be pickled
+    """
+    import pickle  # pylint: disable=import-outside-toplevel
+    snapshot = {
+        'version': SNAPSHOT_VERSION, 'kind': kind, 'target': target, 'keywords': keywords,
+    }
+    try:
+        data = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as err:
+        raise ValueError(f"Mock state cannot be saved: {err}") from err
+    abs_path = os.path.abspath(path)
+    directory = os.path.dirname(abs_path)
+    os.makedirs(directory, exist_ok=True)
+    temporary = f"{abs_path}.{os.getpid()}.tmp"
+    with open(temporary, 'wb') as file:
+        file.write(data)
+    os.replace(temporary, abs_path)
+    return abs_path
+
+
+def load_snapshot(path: str, kind: str, target: str) -> Dict[str, dict]:
+    """Read a snapshot file and return its keywords.
+
+    Raises:
+        FileNotFoundError: If the snapshot file does not exist
+        ValueError: If the file is not a snapshot of this version, or was
+            saved for another kind of library or another target
+    """
+    abs_path = os.path.abspath(path)
+    if not os.path.isfile(abs_path):
+        raise FileNotFoundError(f"Mock state file not found: {abs_path}")
+    import pickle  # pylint: disable=import-outside-toplevel
+    with open(abs_path, 'rb') as file:
+        try:
+            snapshot = pickle.load(file)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as err:
+            raise ValueError(f"Invalid mock state file {abs_path}: {err}") from err
+    if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported mock state file {abs_path}")
+    if snapshot['kind'] != kind or snapshot['target'] != target:
+        raise ValueError(
+            f"Mock state file {abs_path} was saved for {snapshot['kind']} "
+            f"{snapshot['target']}, not for {kind} {target}"
+        )
+    return snapshot['keywords']
+
+
+def check_locations(keywords: Dict[str, dict], locations: Dict[str, Any], path: str):
+    """Verify every keyword of a snapshot resolves to the location it was saved with.
+
+    Args:
+        keywords: Keywords returned by ``load_snapshot``
+        locations: Keyword names mapped to the location they resolve to now
+        path: Snapshot file reported in the error message
+
+    Raises:
+        ValueError: If any keyword resolves to another location
+    """
+    stale = [
+        f"- '{keyword_name}': saved for {entry['location']}, "
+        f"resolves to {locations[keyword_name]}"
+        for keyword_name, entry in keywords.items()
+        if entry['location'] != locations[keyword_name]
+    ]
+    if stale:
+        raise ValueError(f"Mock state file {os.path.abspath(path)} is stale:\n" + "\n".join(stale))
@@ -0,0 +1,77 @@
+"""Spies recording the calls of keywords that keep running their original implementation."""
+import inspect
+from collections import deque
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List
+
+
+def get_spy_calls(mock: Any, keyword_name: str) -> List[Dict[str, Any]]:
+    """Return the calls recorded by the spy a keyword mock passes its calls through.
+
+    Raises:
+        AssertionError: If the keyword is not spied
+    """
+    side_effect = getattr(mock, 'side_effect', None)
+    # Timed side effects wrap the spy
+    side_effect = getattr(side_effect, 'side_effect', side_effect)
+    if not isinstance(side_effect, KeywordSpy):
+        raise AssertionError(f"Keyword '{keyword_name}' is not spied")
+    return side_effect.calls()
+
+
+class KeywordSpy:
+    """Side effect running the original keyword and recording each call.
+
+    The last ``history`` calls are kept in a ring buffer, with the argument
+    tuple and dictionary the keyword was called with, not copies of them,
+    and the time the original took. Calls raising an exception are recorded
+    too. The result of an async keyword is awaited before its call is
+    recorded.
+    """
+
+    __slots__ = ('_original', '_calls')
+
+    def __init__(self, original: Callable, history: int = 10):
+        """Initialize the spy.
+
+        Args:
+            original: Original implementation of the keyword
+            history: Number of calls to keep
+
+        Raises:
+            ValueError: If ``history`` is not positive
+        """
+        history = int(history)
+        if history < 1:
+            raise ValueError(f"Spy history must be a positive integer, got {history}")
+        self._original = original
+        self._calls = deque(maxlen=history)
+
+    def __call__(self, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            result = self._original(*args, **kwargs)
+        except BaseException:
+            self._calls.append((args, kwargs, perf_counter_ns() - start))
+            raise
+        if inspect.isawaitable(result):
+            return self._awaited(result, args, kwargs, start)
+        self._calls.append((args, kwargs, perf_counter_ns() - start))
+        return result
+
+    async def _awaited(self, result, args, kwargs, start):
+        try:
+            return await result
+        finally:
+            self._calls.append((args, kwargs, perf_counter_ns() - start))
+
+    def calls(self) -> List[Dict[str, Any]]:
+        """Return the recorded calls, oldest first.
+
+        Returns:
+            List of dictionaries with ``args``, ``kwargs`` and ``duration_ns``
+        """
+        return [
+            {'args': list(args), 'kwargs': kwargs, 'duration_ns': duration_ns}
+            for args, kwargs, duration_ns in list(self._calls)
+        ]
@@ -0,0 +1,280 @@
+"""Latency statistics of mocked keyword calls."""
+import json
+import os
+import threading
+from time import perf_counter_ns
+from typing import Any, Dict, Union
+
+from robot.libraries.BuiltIn import BuiltIn
+
+from .naming import normalize_keyword_name
+
+# Reports by file path, shared by all libraries writing into the same file
+_REPORTS = {}
+_REPORTS_LOCK = threading.Lock()
+
+
+def _bucket(value: int) -> int:
+    # Log-linear buckets: values below 8 are exact, larger values keep their
+    # top four bits, which bounds the relative error to 12.5%
+    if value < 8:
+        return max(value, 0)
+    exponent = value.bit_length() - 1
+    return (exponent - 2) * 8 + ((value >> (exponent - 3)) & 7)
+
+
+def _bucket_value(index: int) -> int:
+    # Middle of the range covered by a bucket
+    if index < 8:
+        return index
+    exponent, mantissa = divmod(index, 8)
+    width = 1 << exponent - 1
+    return ((8 + mantissa) << exponent - 1) + width // 2
+
+
+def create_statistics(library: str, statistics: Union[bool, str]) -> 'MockStatistics':
+    """Create the statistics of a library from its ``statistics`` import argument.
+
+    Returns None if statistics are disabled. A string is the name of the
+    report file.
+    """
+    if not statistics:
+        return None
+    return MockStatistics(library, statistics if isinstance(statistics, str) else None)
+
+
+def get_statistics(statistics: 'MockStatistics', keyword_name: str = None) -> Dict[str, Any]:
+    """Return the summary of a library's statistics for the Get Mock Statistics keyword.
+
+    Raises:
+        RuntimeError: If statistics are disabled
+    """
+    if statistics is None:
+        raise RuntimeError(
+            "Mock statistics are not collected. Import the library with statistics=True."
+        )
+    return statistics.summary(keyword_name)
+
+
+class LatencyHistogram:
+    """Histogram of durations in nanoseconds with log-linear buckets."""
+
+    __slots__ = ('count', 'total_ns', 'max_ns', '_buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self._buckets = {}
+
+    def record(self, duration_ns: int):
+        """Add one duration to the histogram."""
+        self.count += 1
+        self.total_ns += duration_ns
+        self.max_ns = max(self.max_ns, duration_ns)
+        index = _bucket(duration_ns)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def merge(self, other: 'LatencyHistogram'):
+        """Add all durations of another histogram to this one."""
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+        for index, count in other._buckets.items():  # pylint: disable=protected-access
+            self._buckets[index] = self._buckets.get(index, 0) + count
+
+    def percentile(self, percent: float) -> int:
+        """Estimate the duration below which ``percent`` percent of the durations are."""
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(_bucket_value(index), self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> Dict[str, int]:
+        """Return the count, mean, p50, p99 and maximum of the durations."""
+        return {
+            'count': self.count,
+            'mean_ns': self.total_ns // self.count if self.count else 0,
+            'p50_ns': self.percentile(50),
+            'p99_ns': self.percentile(99),
+            'max_ns': self.max_ns,
+        }
+
+
+class KeywordStatistics:
+    """Latency, dispatch overhead and side effect time of one mocked keyword."""
+
+    __slots__ = ('name', 'latency', 'dispatch', 'side_effect')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latency = LatencyHistogram()
+        self.dispatch = LatencyHistogram()
+        self.side_effect = LatencyHistogram()
+
+    def record(self, total_ns: int, side_effect_ns: int):
+        """Add one call that took ``total_ns``, ``side_effect_ns`` of it in the side effect."""
+        self.latency.record(total_ns)
+        self.dispatch.record(max(total_ns - side_effect_ns, 0))
+        self.side_effect.record(side_effect_ns)
+
+    def merge(self, other: 'KeywordStatistics'):
+        """Add all calls of another statistics object to this one."""
+        self.latency.merge(other.latency)
+        self.dispatch.merge(other.dispatch)
+        self.side_effect.merge(other.side_effect)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the call count and the histogram summaries."""
+        return {
+            'calls': self.latency.count,
+            'latency': self.latency.summary(),
+            'dispatch': self.dispatch.summary(),
+            'side_effect': self.side_effect.summary(),
+        }
+
+
+class MockStatistics:
+    """Statistics of the mocked keywords of one library, per suite.
+
+    Also a Robot Framework listener. Every suite collects the calls made
+    while it runs, and adds them to its parent suite when it ends. With a
+    report file, the statistics of every finished suite are written to it.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 3
+
+    def __init__(self, library: str, report: str = None):
+        """Initialize the statistics.
+
+        Args:
+            library: Library or resource name used in the report
+            report: Optional JSON file the statistics of every suite are
+                written to, relative to the output directory
+        """
+        self._library = library
+        self._report = report
+        self._tables = [{}]
+        self._local = threading.local()
+
+    def timed(self, keyword_name: str, mock: Any, dispatch: Any = None) -> 'TimedMock':
+        """Time the side effect of ``mock`` and return a wrapper timing its calls.
+
+        Args:
+            keyword_name: Name of the mocked keyword
+            mock: Mock whose callable side effect is timed
+            dispatch: Callable the keyword is dispatched to, wrapping ``mock``
+                (defaults to ``mock`` itself)
+        """
+        side_effect = mock.side_effect
+        if callable(side_effect) and not isinstance(side_effect, type):
+            mock.side_effect = _TimedSideEffect(side_effect, self._local)
+        return TimedMock(mock if dispatch is None else dispatch, self, keyword_name)
+
+    def record(self, keyword_name: str, total_ns: int):
+        """Add one call of ``keyword_name`` that took ``total_ns`` nanoseconds."""
+        side_effect_ns = getattr(self._local, 'side_effect_ns', 0)
+        self._local.side_effect_ns = 0
+        table = self._tables[-1]
+        name = normalize_keyword_name(keyword_name)
+        stats = table.get(name)
+        if stats is None:
+            stats = table[name] = KeywordStatistics(keyword_name)
+        stats.record(total_ns, side_effect_ns)
+
+    def summary(self, keyword_name: str = None) -> Dict[str, Any]:
+        """Return the statistics of the running suite, for all keywords or one.
+
+        Raises:
+            AssertionError: If ``keyword_name`` has not been called
+        """
+        table = self._tables[-1]
+        if keyword_name is None:
+            return {stats.name: stats.summary() for stats in table.values()}
+        stats = table.get(normalize_keyword_name(keyword_name))
+        if stats is None:
+            raise AssertionError(f"No statistics for keyword '{keyword_name}'")
+        return stats.summary()
+
+    def start_suite(self, _data, _result):
+        """Collect the calls of the suite separately."""
+        self._tables.append({})
+
+    def end_suite(self, _data, result):
+        """Add the calls of the suite to its parent and report them."""
+        if len(self._tables) < 2:
+            return
+        table = self._tables.pop()
+        parent = self._tables[-1]
+        for name, stats in table.items():
+            if name in parent:
+                parent[name].merge(stats)
+            else:
+                parent[name] = stats
+        if self._report and table:
+            self._write_report(result.full_name, table)
+
+    def _write_report(self, suite_name, table):
+        path = self._report
+        if not os.path.isabs(path):
+            output_dir = BuiltIn().get_variable_value('${OUTPUT DIR}', os.getcwd())
+            path = os.path.join(output_dir, path)
+        with _REPORTS_LOCK:
+            report = _REPORTS.setdefault(path, {})
+            report.setdefault(suite_name, {})[self._library] = {
+                stats.name: stats.summary() for stats in table.values()
+            }
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(report, file, indent=2)
+
+
+class TimedMock:
+    """Callable timing every call of the wrapped mock.
+
+    Other attributes, such as ``call_count``, are read from the wrapped mock.
+    """
+
+    __slots__ = ('mock', '_statistics', '_keyword_name')
+
+    def __init__(self, mock: Any, statistics: MockStatistics, keyword_name: str):
+        self.mock = mock
+        self._statistics = statistics
+        self._keyword_name = keyword_name
+
+    def __call__(self, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return self.mock(*args, **kwargs)
+        finally:
+            self.record(perf_counter_ns() - start)
+
+    def __getattr__(self, name):
+        return getattr(self.mock, name)
+
+    def record(self, total_ns: int):
+        """Add one call timed by the caller, for example a keyword runner."""
+        self._statistics.record(self._keyword_name, total_ns)
+
+
+class _TimedSideEffect:  # pylint: disable=too-few-public-methods
+    """Side effect adding its run time to the pending side effect time of the thread."""
+
+    __slots__ = ('side_effect', '_local')
+
+    def __init__(self, side_effect, local):
+        self.side_effect = side_effect
+        self._local = local
+
+    def __call__(self, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return self.side_effect(*args, **kwargs)
+        finally:
+            self._local.side_effect_ns = (
+                getattr(self._local, 'side_effect_ns', 0) + perf_counter_ns() - start
+            )
@@ -1,15 +1,209 @@
 """Mock resource for Robot Framework keyword mocking in unit tests."""
 # pylint: disable=invalid-name
-from typing import Any, Callable
-from unittest.mock import Mock
+import inspect
+import threading
+from functools import partial
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Union
 
 from robot.api.deco import keyword
 from robot.libraries.BuiltIn import BuiltIn
-from robot.running import Return
-from robot.running.namespace import Namespace
+from robot.running import UserKeyword
+from robot.running.statusreporter import StatusReporter
+from robot.running.userkeywordrunner import UserKeywordRunner
+from robot.variables import VariableAssignment
 
+from MockLibrary.engine import ENGINE
+from MockLibrary.faults import FaultyMock, fault_plan
+from MockLibrary.journal import get_journal
+from MockLibrary.memo import MemoCache, get_memo_info
+from MockLibrary.mock_table import (
+    create_mocks, load_mock_table, load_responses, resolve_keywords
+)
+from MockLibrary.naming import normalize_keyword_name
+from MockLibrary.order import CALL_ORDER, get_call_order, resource_owner
+from MockLibrary.recorder import CountingMock, create_mock
+from MockLibrary.responses import ResponseTable
+from MockLibrary.scopes import MockScopes, library_listeners
+from MockLibrary.snapshot import (
+    check_locations, compiled_spec, load_snapshot, mock_spec, save_snapshot, snapshot_keywords
+)
+from MockLibrary.spy import KeywordSpy, get_spy_calls
+from MockLibrary.stats import TimedMock, create_statistics, get_statistics
 
-class MockResource:
+
+# Robot Framework 7.0 resolves the arguments of a keyword from the keyword and its
+# positional arguments, later versions from the keyword data
+_RESOLVES_FROM_DATA = list(
+    inspect.signature(UserKeywordRunner._resolve_arguments).parameters  # pylint: disable=protected-access
+)[1] == 'data'
+
+
+def _dispatch_key(kw):
+    return kw.source, normalize_keyword_name(kw.name)
+
+
+def _resolve_arguments(keyword_runner, data, kw, variables):
+    # Embedded argument runners add the arguments taken from the keyword name
+    if _RESOLVES_FROM_DATA:
+        return keyword_runner._resolve_arguments(data, kw, variables)  # pylint: disable=protected-access
+    return keyword_runner._resolve_arguments(kw, data.args, variables)  # pylint: disable=protected-access
+
+
+class _OriginalKeyword:  # pylint: disable=too-few-public-methods
+    """Runs the body of the resource keyword whose mock is running in this thread.
+
+    The original implementation of memoized resource keywords.
+    """
+
+    def __init__(self):
+        self.local = threading.local()
+
+    def __call__(self, *args, **kwargs):
+        return self.local.run()
+
+
+_ORIGINAL_KEYWORD = _OriginalKeyword()
+
+
+class _MockKeywordRunner:
+    """Runs a mocked resource keyword by returning its mock result directly.
+
+    The keyword result is configured and the arguments are resolved by the
+    original runner, so the log looks the same as for the real keyword and
+    the mock is called with the resolved argument values, named arguments
+    of positional parameters passed by position. The keyword body is never
+    bound, copied or executed. Timed mocks are timed from the
+    keyword lookup to the end of the run.
+    """
+
+    __slots__ = ('keyword', 'name', 'pre_run_messages', 'original', '_mock', '_timed', '_started')
+
+    def __init__(self, keyword_runner, mock):
+        self.keyword = keyword_runner.keyword
+        self.name = keyword_runner.name
+        self.pre_run_messages = keyword_runner.pre_run_messages
+        self.original = keyword_runner
+        if isinstance(mock, TimedMock):
+            self._started = perf_counter_ns()
+            self._timed = mock
+            self._mock = mock.mock
+        else:
+            self._started = self._timed = None
+            self._mock = mock
+
+    def run(self, data, result, context, run=True):
+        """Run the mock in place of the keyword body."""
+        if self._timed is None or not run:
+            return self._run(data, result, context, run)
+        try:
+            return self._run(data, result, context, run)
+        finally:
+            self._timed.record(perf_counter_ns() - self._started)
+
+    def _run(self, data, result, context, run):
+        kw = self.keyword
+        assignment = VariableAssignment(data.assign)
+        self.original._config_result(result, data, kw, assignment, context.variables)  # pylint: disable=protected-access
+        with StatusReporter(data, result, context, run, implementation=kw):
+            if not run:
+                return None
+            with assignment.assigner(context) as assigner:
+                positional, named = kw.args.map(*_resolve_arguments(
+                    self.original, data, kw, context.variables
+                ))
+                local = _ORIGINAL_KEYWORD.local
+                previous = getattr(local, 'run', None)
+                local.run = lambda: self.original._run(data, kw.bind(data), result, context)  # pylint: disable=protected-access
+                try:
+                    return_value = self._mock(*positional, **dict(named))
+                finally:
+                    local.run = previous
+                assigner.assign(return_value)
+                return return_value
+
+    def dry_run(self, data, result, context):
+        """Dry-run the original keyword."""
+        return self.original.dry_run(data, result, context)
+
+
+class _ResourceDispatcher:
+    """Interceptor serving mocked resource keywords from the mock engine.
+
+    Mocks are registered in the engine shared with MockLibrary, keyed by
+    ``(resource path, normalized keyword name)``. The
+    ``Namespace.get_runner`` patch is installed when the first resource
+    keyword is mocked and removed again when the last one is restored, so
+    keyword lookups are not affected while no mock is active, and a lookup
+    of a keyword that is not mocked costs one failed dictionary lookup.
+    When several instances mock the same keyword, the latest registration
+    wins.
+    """
+
+    def __init__(self):
+        self._table = ENGINE.table
+        self._keys = set()
+        self._original_get_runner = None
+        self._patched_get_runner = None
+
+    @property
+    def installed(self):
+        """Whether ``Namespace.get_runner`` is currently patched."""
+        return self._patched_get_runner is not None
+
+    def register(self, key, mock):
+        """Dispatch keyword lookups matching ``key`` to ``mock``."""
+        ENGINE.register(key, mock, partial(self._activate, key), partial(self._deactivate, key))
+
+    def unregister(self, key, mock):
+        """Remove ``mock`` from ``key``, falling back to earlier registrations."""
+        ENGINE.unregister(key, mock)
+
+    def _activate(self, key, _):
+        self._keys.add(key)
+        if not self.installed:
+            self._install()
+
+    def _deactivate(self, key):
+        self._keys.discard(key)
+        if not self._keys and self.installed:
+            self._uninstall()
+
+    def _install(self):
+        # Imported with the first mock, not when the library is imported
+        from robot.running.namespace import Namespace  # pylint: disable=import-outside-toplevel
+        original_get_runner = Namespace.get_runner
+        table = self._table
+
+        def patched_get_runner(self, keyword_name, recommend_on_failure=True):
+            keyword_runner = original_get_runner(self, keyword_name, recommend_on_failure)
+            kw = keyword_runner.keyword
+            if not isinstance(kw, UserKeyword):
+                return keyword_runner
+
+            mock = table.get(_dispatch_key(kw))
+            if mock:
+                return _MockKeywordRunner(keyword_runner, mock)
+            return keyword_runner
+
+        self._original_get_runner = original_get_runner
+        self._patched_get_runner = patched_get_runner
+        Namespace.get_runner = patched_get_runner
+
+    def _uninstall(self):
+        # Leave the patch in place if someone else has wrapped it since;
+        # with no resource keyword mocked it only forwards to the original.
+        from robot.running.namespace import Namespace  # pylint: disable=import-outside-toplevel
+        if Namespace.get_runner is self._patched_get_runner:
+            Namespace.get_runner = self._original_get_runner
+            self._original_get_runner = None
+            self._patched_get_runner = None
+
+
+_DISPATCHER = _ResourceDispatcher()
+
+
+class MockResource:  # pylint: disable=too-many-instance-attributes
     """Mock keywords from Robot Framework resource files for unit testing.
     
     Example:
@@ -19,42 +213,58 @@ class MockResource:
         | MockRes.Reset Mocks |
     """
 
-    def __init__(self, source):
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self, source, retention: str = 'mock', history: int = 10, *,
+        scope_mocks: bool = True, journal: str = None, statistics: Union[bool, str] = False,
+        record_order: bool = False
+    ):
+        """Initialize MockResource with a resource file to mock.
+
+        Args:
+            source: Resource file name or path the mocked keywords come from
+            retention: Default call history kept by mocks: ``mock`` (a full
+                unittest.mock.Mock), ``count``, ``last`` or ``full``
+            history: Default number of calls kept with ``last`` retention
+            scope_mocks: Restore keywords mocked in a test when the test ends
+                and keywords mocked in a suite when the suite ends. Mocks
+                created in Suite Setup stay active for all tests of the suite.
+            journal: Directory to write a journal of all mocked keyword calls
+                into, one file per process. Journals of parallel runs can be
+                merged with ``python -m MockLibrary.journal``.
+            statistics: Time every call of a mocked keyword, see ``Get Mock
+                Statistics``. A file name also writes the statistics of every
+                suite to that JSON file in the output directory.
+            record_order: Record the order of the calls of mocked keywords,
+                see ``Verify Call Order``
+        """
         self._source = source
-        self._original_get_runner = Namespace.get_runner
+        self._journal = get_journal(journal) if journal else None
+        self._retention = retention
+        self._history = history
+        self._record_order = record_order
         self._original_items = {}
         self._mocks = {}
-        self._install_patch()
-
-    def _install_patch(self):
-        original_get_runner = self._original_get_runner
-        active_mocks = self._mocks
-        source = self._source
-
-        def patched_get_runner(self, keyword_name, recommend_on_failure):
-            keyword_runner = original_get_runner(self, keyword_name, recommend_on_failure)
-            resource_file = getattr(keyword_runner.keyword, "source", None)
-
-            if source not in str(resource_file):
-                return keyword_runner
-
-            mock = active_mocks.get(keyword_name)
-            if mock:
-                original_run = keyword_runner.run
-                def patched_run(data, result, context, run):
-                    mock_result = mock(data.args)
-                    keyword_runner.keyword.body._items = [Return(values=[mock_result])]  # pylint: disable=protected-access
-                    return original_run(data, result, context, run)
-                keyword_runner.run = patched_run
-
-            return keyword_runner
-
-        Namespace.get_runner = patched_get_runner
+        # Keyword name, options and delay of the mocks created from values
+        self._specs = {}
+        # Return values shared by mocks with share_return_value, by factory
+        self._factory_results = {}
+        self._scopes = MockScopes(self._mocks, self._restore_mock)
+        self._statistics = create_statistics(source, statistics)
+        self.ROBOT_LIBRARY_LISTENER = library_listeners(
+            self._scopes if scope_mocks else None, self._journal, self._statistics
+        )
 
     @keyword
-    def mock_keyword(
+    def mock_keyword(  # pylint: disable=too-many-arguments,too-many-locals
         self, keyword_name: str,
-        return_value: Any = None, side_effect: Callable = None
+        return_value: Any = None, side_effect: Callable = None, *,
+        retention: str = None, history: int = None,
+        return_value_file: str = None, file_format: str = None,
+        sequence: Any = None, exhaustion: str = 'raise', return_value_factory: Any = None,
+        share_return_value: bool = False, latency: Any = None, failure_rate: float = None,
+        fail_first: int = None, failure: Any = None, seed: int = None
     ):
         """Mock a keyword from the resource file.
         
@@ -62,34 +272,426 @@ class MockResource:
             keyword_name: Name of the keyword to mock
             return_value: Value to return when the keyword is called
             side_effect: Callable to execute instead of returning a value
+            retention: Call history to keep: ``mock``, ``count``, ``last``
+                or ``full`` (defaults to the library import argument)
+            history: Number of calls kept with ``last`` retention
+            return_value_file: File whose payload is returned instead of
+                ``return_value``. It is loaded on the first call and cached
+                in an LRU cache shared by all mocks.
+            file_format: Format of ``return_value_file`` or a ``sequence``
+                file: ``jsonl``, ``csv`` or ``bytes`` (defaults to the file
+                extension)
+            sequence: Generator factory, or JSON Lines or CSV file, whose
+                values are returned one per call. The file is read one line
+                per call, so memory use does not grow with its length.
+            exhaustion: What an exhausted ``sequence`` does: ``raise``
+                (default), ``repeat_last`` or ``cycle``
+            return_value_factory: Callable, or ``module:function``
+                reference to one, building the return value when the
+                keyword is called the first time. The result is returned
+                for every call of this mock.
+            share_return_value: Share the result of ``return_value_factory``
+                with all mocks using the same factory until ``Reset Mocks``,
+                so it is built once however many tests mock the keyword
+            latency: Seconds every call sleeps before returning or failing,
+                or a distribution they are drawn from:
+                ``uniform:LOW,HIGH``, ``normal:MEAN,STDEV`` or
+                ``exponential:MEAN``
+            failure_rate: Probability, from 0 to 1, that a call fails
+            fail_first: Number of first calls that fail, for example to
+                test ``Wait Until Keyword Succeeds``
+            failure: Exception, exception class or message of the injected
+                failures (defaults to ``InjectedFailure``)
+            seed: Seed of the random latencies and failures, so they are
+                the same in every run (random by default, reported in the
+                failure messages)
+
+        Raises:
+            ValueError: If a fault option is invalid
         
         Example:
             | MockRes.Mock Keyword | My Keyword | return_value=test_data |
+            | MockRes.Mock Keyword | My Keyword | return_value_file=${CURDIR}/data.csv |
+            | MockRes.Mock Keyword | Next Row | sequence=${CURDIR}/rows.csv | exhaustion=cycle |
+            | MockRes.Mock Keyword | Get Token | return_value_factory=fixtures:sign_token |
+            | MockRes.Mock Keyword | Login | failure_rate=0.2 | latency=normal:0.3,0.1 | seed=7 |
         """
+        faults = {
+            'latency': latency, 'failure_rate': failure_rate, 'fail_first': fail_first,
+            'failure': failure, 'seed': seed,
+        }
+        plan = fault_plan(faults)
+        keyword_runner = self._get_original_runner(keyword_name)
+        mock = create_mock(
+            return_value, side_effect,
+            sequence=sequence, exhaustion=exhaustion,
+            return_value_file=return_value_file, file_format=file_format,
+            retention=retention or self._retention, history=history or self._history,
+            return_value_factory=return_value_factory,
+            shared_results=self._factory_results if share_return_value else None
+        )
+        spec = mock_spec(
+            return_value=return_value, side_effect=side_effect,
+            sequence=sequence, exhaustion=exhaustion,
+            return_value_file=return_value_file, file_format=file_format,
+            retention=retention, history=history, return_value_factory=return_value_factory,
+            share_return_value=share_return_value, **faults
+        )
+        self._install_mock(
+            normalize_keyword_name(keyword_name), keyword_runner,
+            self._dispatch(keyword_name, keyword_runner, mock, plan), (keyword_name, spec, None)
+        )
+
+    @keyword
+    def mock_keyword_with_arguments(
+        self, keyword_name: str, responses: Union[List[Dict[str, Any]], Dict[Any, Any], str],
+        default: Any = None, *, retention: str = None, history: int = None
+    ):
+        """Mock a keyword from the resource file with a return value per argument.
+
+        Calls are matched by their resolved argument values, after variables
+        are replaced and arguments converted, in one dictionary lookup
+        however many rows the table has. An argument given as ``*`` matches
+        any value. Rows without wildcards are preferred, then rows with
+        fewer wildcards, then earlier rows.
+
+        Args:
+            keyword_name: Name of the keyword to mock
+            responses: List of rows with ``args`` (list of positional
+                arguments), ``kwargs`` (dictionary of named arguments) and
+                ``return_value``, a dictionary mapping the only argument of
+                a call to its return value, or path to a JSON or YAML file
+                containing either
+            default: Value returned for calls no row matches
+            retention: Call history to keep: ``mock``, ``count``, ``last``
+                or ``full`` (defaults to the library import argument)
+            history: Number of calls kept with ``last`` retention
+
+        Raises:
+            ValueError: If the response table is malformed
+
+        Example:
+            | MockRes.Mock Keyword With Arguments | Get Price | ${CURDIR}/prices.yaml |
+        """
+        keyword_runner = self._get_original_runner(keyword_name)
+        mock = create_mock(
+            side_effect=ResponseTable(load_responses(responses), default),
+            history=history or self._history, retention=retention or self._retention
+        )
+        spec = mock_spec(side_effect=mock.side_effect, retention=retention, history=history)
+        self._install_mock(
+            normalize_keyword_name(keyword_name), keyword_runner,
+            self._dispatch(keyword_name, keyword_runner, mock), (keyword_name, spec, None)
+        )
+
+    @keyword
+    def cache_keyword(
+        self, keyword_name: str, max_size: int = 128, ttl: float = None, *,
+        retention: str = None, history: int = None
+    ):
+        """Memoize a keyword from the resource file instead of replacing it.
+
+        The keyword body only runs for arguments without a memoized result.
+        Results are kept in an LRU cache of the keyword, which ``Reset
+        Mocks`` and the end of the test or suite that cached it clear.
+
+        Args:
+            keyword_name: Name of the keyword to memoize
+            max_size: Maximum number of memoized argument combinations
+            ttl: Seconds a result is returned for (optional, by default
+                until it is evicted)
+            retention: Call history to keep: ``mock``, ``count``, ``last``
+                or ``full`` (defaults to the library import argument)
+            history: Number of calls kept with ``last`` retention
+
+        Example:
+            | MockRes.Cache Keyword | Load Schema | max_size=10 |
+            | MockRes.Cache Keyword | Get Token | ttl=${300} |
+        """
+        keyword_runner = self._get_original_runner(keyword_name)
+        mock = create_mock(
+            side_effect=MemoCache(_ORIGINAL_KEYWORD, max_size, ttl),
+            history=history or self._history, retention=retention or self._retention
+        )
+        self._install_mock(
+            normalize_keyword_name(keyword_name), keyword_runner,
+            self._dispatch(keyword_name, keyword_runner, mock)
+        )
+
+    @keyword
+    def get_keyword_cache_info(self, keyword_name: str) -> Dict[str, Any]:
+        """Return the hits, misses and size of the cache of a memoized keyword.
+
+        Raises:
+            AssertionError: If the keyword is not memoized with ``Cache Keyword``
+
+        Example:
+            | ${info}= | MockRes.Get Keyword Cache Info | Load Schema |
+            | Should Be Equal As Integers | ${info}[misses] | 1 |
+        """
+        return get_memo_info(self._mocks.get(normalize_keyword_name(keyword_name)), keyword_name)
+
+    @keyword
+    def spy_keyword(
+        self, keyword_name: str, spy_history: int = 10, *,
+        retention: str = 'count', history: int = None
+    ):
+        """Record the calls of a keyword from the resource file while its body keeps running.
+
+        The arguments of the last ``spy_history`` calls are kept by reference,
+        together with the time the keyword body took, see ``Get Spy Calls``.
+
+        Args:
+            keyword_name: Name of the keyword to spy on
+            spy_history: Number of calls the spy keeps
+            retention: Call history kept by the mock wrapping the spy:
+                ``count`` (the default), ``mock``, ``last`` or ``full``
+            history: Number of calls kept by the mock with ``last``
+                retention (defaults to the library import argument)
+
+        Raises:
+            ValueError: If ``spy_history`` is not positive
+
+        Example:
+            | MockRes.Spy Keyword | Load Schema |
+            | MockRes.Verify Keyword Called | Load Schema | times=1 |
+        """
+        keyword_runner = self._get_original_runner(keyword_name)
+        mock = create_mock(
+            side_effect=KeywordSpy(_ORIGINAL_KEYWORD, spy_history),
+            retention=retention or self._retention, history=history or self._history
+        )
+        self._install_mock(
+            normalize_keyword_name(keyword_name), keyword_runner,
+            self._dispatch(keyword_name, keyword_runner, mock)
+        )
+
+    @keyword
+    def get_spy_calls(self, keyword_name: str) -> List[Dict[str, Any]]:
+        """Return the calls recorded by a spied keyword, oldest first.
+
+        Returns:
+            List of dictionaries with ``args``, ``kwargs`` and ``duration_ns``
+
+        Raises:
+            AssertionError: If the keyword is not spied with ``Spy Keyword``
+
+        Example:
+            | ${calls}= | MockRes.Get Spy Calls | Load Schema |
+            | Should Be Equal | ${calls}[0][args][0] | users |
+        """
+        return get_spy_calls(self._mocks.get(normalize_keyword_name(keyword_name)), keyword_name)
+
+    @keyword
+    def mock_keywords(self, mocks: Union[Dict[str, Any], str]):
+        """Mock many keywords from the resource file in one pass.
+
+        Keywords are looked up in one index of the resource file keywords
+        and all mocks are created before any of them is activated, so a
+        malformed table or an unknown keyword leaves the resource untouched.
+
+        Args:
+            mocks: Dictionary, or path to a JSON or YAML file containing one,
+                mapping keyword names to dictionaries of ``Mock Keyword``
+                options such as ``return_value`` and ``side_effect``
+
+        Raises:
+            ValueError: If the mock table is malformed
+            AttributeError: If any of the keywords is not found
+
+        Example:
+            | MockRes.Mock Keywords | ${CURDIR}/mocks.yaml |
+        """
+        table = load_mock_table(mocks)
+        self._install_table(table, self._resolve_table(table))
+
+    @keyword
+    def save_mock_state(self, path: str) -> str:
+        """Save the active mocks into a snapshot file for ``Load Mock State``.
+
+        The snapshot keeps the options the mocks were created with and the
+        resource file each keyword was found in. Only mocks created with
+        ``Mock Keyword``, ``Mock Keyword With Arguments`` or ``Mock
+        Keywords`` can be saved, with side effects that can be pickled.
+
+        Returns:
+            Absolute path of the snapshot file
+
+        Raises:
+            ValueError: If a mock cannot be saved
+
+        Example:
+            | MockRes.Save Mock State | ${OUTPUT DIR}/resource-mocks.snapshot |
+        """
+        keywords = snapshot_keywords(
+            self._mocks, self._specs, lambda name: str(self._original_items[name].keyword.source)
+        )
+        return save_snapshot(path, 'resource', self._source, keywords)
+
+    @keyword
+    def load_mock_state(self, path: str):
+        """Mock the keywords saved with ``Save Mock State`` in one pass.
+
+        Keywords are looked up in one index of the resource file keywords
+        and must still be found in the resource file they were saved from,
+        otherwise the snapshot is stale and no keyword is mocked. Snapshots
+        are unpickled, so only load snapshots you trust.
+
+        Raises:
+            FileNotFoundError: If the snapshot file does not exist
+            ValueError: If the snapshot was saved for another resource or is stale
+            AttributeError: If any of the keywords is not found
+
+        Example:
+            | MockRes.Load Mock State | ${OUTPUT DIR}/resource-mocks.snapshot |
+        """
+        keywords = load_snapshot(path, 'resource', self._source)
+        table = {keyword_name: entry['spec'] for keyword_name, entry in keywords.items()}
+        runners = self._resolve_table(table)
+        check_locations(
+            keywords,
+            {keyword_name: str(runner.keyword.source) for keyword_name, runner in runners.items()},
+            path
+        )
+        self._install_table(table, runners)
+
+    def _resolve_table(self, table):
+        keywords = self._get_resource_keywords()
+        return resolve_keywords(
+            table,
+            lambda keyword_name: self._get_original_runner(keyword_name, keywords),
+            self._source
+        )
+
+    def _install_table(self, table, runners):
+        created = create_mocks(table, self._retention, self._history, self._factory_results)
+        for keyword_name, mock in created.items():
+            # Compiled before dispatching, timed mocks wrap their side effect
+            spec = compiled_spec(table[keyword_name], mock)
+            self._install_mock(
+                normalize_keyword_name(keyword_name), runners[keyword_name],
+                self._dispatch(
+                    keyword_name, runners[keyword_name], mock, fault_plan(table[keyword_name])
+                ),
+                (keyword_name, spec, None)
+            )
+
+    def _get_original_runner(self, keyword_name, keywords=None):
+        kw = keywords.get(normalize_keyword_name(keyword_name)) if keywords else None
+        if kw is not None:
+            return kw.create_runner(kw.name)
+
         keyword_runner = BuiltIn()._namespace.get_runner(keyword_name, True)  # pylint: disable=protected-access
         resource_file = getattr(keyword_runner.keyword, "source", None)
 
         if self._source not in str(resource_file):
-            raise AttributeError("fKeyword '{keyword_name}' not found in {self._source}")
+            raise AttributeError(f"Keyword '{keyword_name}' not found in {self._source}")
+        if isinstance(keyword_runner, _MockKeywordRunner):
+            keyword_runner = keyword_runner.original
+        return keyword_runner
+
+    def _get_resource_keywords(self):
+        """Index the keywords of the mocked resource file by normalized name.
+
+        Keywords with embedded arguments are not indexed; they are found
+        with a regular keyword lookup instead.
+        """
+        kw_store = BuiltIn()._namespace._kw_store  # pylint: disable=protected-access
+        keywords = {}
+        for resource in (kw_store.suite_file, *kw_store.resources.values()):
+            if self._source in str(resource.source):
+                for kw in resource.keywords:
+                    if not kw.embedded:
+                        keywords.setdefault(normalize_keyword_name(kw.name), kw)
+        return keywords
+
+    def _dispatch(self, keyword_name, keyword_runner, mock, plan=None):
+        # Build the callable registered for the keyword
+        dispatch = mock if plan is None else FaultyMock(mock, plan)
+        if self._journal is not None:
+            dispatch = self._journal.wrap(self._source, keyword_name, dispatch)
+        if self._record_order:
+            kw = keyword_runner.keyword
+            dispatch = CountingMock(
+                dispatch, CALL_ORDER.recorder(resource_owner(kw.source), kw.name)
+            )
+        if self._statistics is not None:
+            dispatch = self._statistics.timed(keyword_name, mock, dispatch)
+        return dispatch
 
-        self._original_items[keyword_name] = keyword_runner.keyword.body._items  # pylint: disable=protected-access
-        mock = Mock(return_value=return_value, side_effect=side_effect)
-        self._mocks[keyword_name] = mock
+    def _install_mock(self, name, keyword_runner, mock, spec=None):
+        key = _dispatch_key(keyword_runner.keyword)
+        previous = self._mocks.get(name)
+        self._scopes.record(name, previous)
+        if spec is not None:
+            # What the mock was created from, for Save Mock State
+            self._specs[mock] = spec
+        if previous:
+            _DISPATCHER.unregister(key, previous)
+
+        self._original_items[name] = keyword_runner
+        self._mocks[name] = mock
+        _DISPATCHER.register(key, mock)
+
+    def _restore_mock(self, name, mock):
+        keyword_runner = self._original_items.get(name)
+        if keyword_runner is None:
+            return
+        # The mock in place is discarded, the scope that created it has ended
+        self._specs.pop(self._mocks.get(name), None)
+        if mock is not None:
+            self._install_mock(name, keyword_runner, mock)
+        elif name in self._mocks:
+            _DISPATCHER.unregister(_dispatch_key(keyword_runner.keyword), self._mocks.pop(name))
+            del self._original_items[name]
 
     @keyword
     def reset_mocks(self):
         """Reset all mocks to their original implementations.
         
-        Restores all mocked keywords to their original behavior.
+        Restores all mocked keywords to their original behavior. A library
+        imported with ``record_order`` also clears the call order, which is
+        shared by all libraries.
         
         Example:
             | MockRes.Reset Mocks |
         """
+        for name, keyword_runner in self._original_items.items():
+            _DISPATCHER.unregister(_dispatch_key(keyword_runner.keyword), self._mocks[name])
+        self._scopes.clear()
         self._mocks.clear()
-        for keyword_name, items in self._original_items.items():
-            keyword_runner = BuiltIn()._namespace.get_runner(keyword_name, True)  # pylint: disable=protected-access
-            keyword_runner.keyword.body._items = items  # pylint: disable=protected-access
+        self._specs.clear()
+        self._factory_results.clear()
         self._original_items.clear()
+        if self._record_order:
+            # The call order is shared, resetting clears it for every library
+            CALL_ORDER.clear()
+
+    @keyword
+    def get_mock_statistics(self, keyword_name: str = None) -> Dict[str, Any]:
+        """Return call latency statistics of the mocked keywords.
+
+        Calls are timed from the keyword lookup to the end of the keyword.
+        ``latency`` is the time of the whole call, ``side_effect`` the time
+        spent in a callable side effect and ``dispatch`` the rest, the
+        overhead of mocking.
+
+        Args:
+            keyword_name: Name of a mocked keyword (optional, if None the
+                statistics of all called keywords are returned)
+
+        Returns:
+            Statistics of one keyword, or a dictionary of them by keyword name
+
+        Raises:
+            RuntimeError: If the library was imported without ``statistics``
+            AssertionError: If ``keyword_name`` has not been called
+
+        Example:
+            | ${stats}= | MockRes.Get Mock Statistics | My Keyword |
+            | Log | ${stats}[latency][p50_ns] |
+        """
+        return get_statistics(self._statistics, keyword_name)
 
     @keyword
     def verify_keyword_called(self, keyword_name: str, times: int = None):
@@ -105,9 +707,56 @@ class MockResource:
         Example:
             | MockDB.Verify Keyword Called | Execute Sql | times=1 |
         """
-        if keyword_name not in self._mocks:
+        name = normalize_keyword_name(keyword_name)
+        if name not in self._mocks:
             raise AssertionError(f"Keyword '{keyword_name}' was not mocked")
 
-        mock = self._mocks[keyword_name]
+        mock = self._mocks[name]
         if times is not None and mock.call_count != times:
             raise AssertionError(f"Expected {times} calls, got {mock.call_count}")
+
+    @keyword
+    def verify_call_order(self, *keyword_names: str):
+        """Verify that mocked keywords were called in the given order.
+
+        The calls of all MockLibrary and MockResource mocks imported with
+        ``record_order`` share one journal, cleared when a suite or test
+        starts and by ``Reset Mocks``, so keywords of
+        different libraries and resource files can be checked together.
+        Other calls may come in between. Keywords can be qualified with
+        the name of their library or resource file.
+
+        Args:
+            keyword_names: Names of the keywords, in the expected order
+
+        Raises:
+            AssertionError: If the keywords were not called in this order
+            RuntimeError: If the library does not record the call order
+
+        Example:
+            | MockRes.Verify Call Order | Connect | Query | Disconnect |
+            | MockRes.Verify Call Order | DatabaseLibrary.Connect | db.Log Result |
+        """
+        get_call_order(self._record_order).verify_order(keyword_names)
+
+    @keyword
+    def verify_not_called_between(self, keyword_name: str, start: str, end: str):
+        """Verify that a mocked keyword was not called between two others.
+
+        Every call of ``start`` opens a window that the next call of ``end``
+        closes, and ``keyword_name`` must not be called in any of them.
+
+        Args:
+            keyword_name: Name of the keyword that must not be called
+            start: Name of the keyword opening a window
+            end: Name of the keyword closing a window
+
+        Raises:
+            AssertionError: If the keyword was called in a window, or
+                ``start`` was never followed by ``end``
+            RuntimeError: If the library does not record the call order
+
+        Example:
+            | MockRes.Verify Not Called Between | Commit | Begin | Rollback |
+        """
+        get_call_order(self._record_order).verify_not_called_between(keyword_name, start, end)
@@ -0,0 +1,21 @@
+# pylint: disable=invalid-name
+"""A Robot Framework library with async keywords."""
+import asyncio
+import time
+
+
+class AsyncLibrary:
+    """Library whose keywords are coroutine functions."""
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    async def fetch(self, url):
+        """Fetch a page after a second."""
+        await asyncio.sleep(1)
+        return f"page {url}"
+
+    async def fetch_all(self, count):
+        """Fetch ``count`` pages concurrently and return the pages and the seconds it took."""
+        start = time.perf_counter()
+        pages = await asyncio.gather(*(self.fetch(index) for index in range(int(count))))
+        return pages, time.perf_counter() - start
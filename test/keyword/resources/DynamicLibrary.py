@@ -9,10 +9,12 @@ class DynamicLibrary:
 
     def get_keyword_names(self):
         """Return list of keyword names this library provides."""
-        return ['dynamic_greeting']
+        return ['dynamic_greeting', 'dynamic_farewell']
 
     def run_keyword(self, name, args, **_kwargs):
         """Execute the named keyword with given arguments."""
         if name == 'dynamic_greeting':
             return f"hello {args[0]}"
+        if name == 'dynamic_farewell':
+            return f"bye {args[0]}"
         raise ValueError(f"Unknown keyword: {name}")
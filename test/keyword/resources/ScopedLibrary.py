@@ -0,0 +1,10 @@
+# pylint: disable=invalid-name
+"""A Robot Framework library created again for every test."""
+
+
+class ScopedLibrary:  # pylint: disable=too-few-public-methods
+    """Library with the default TEST scope."""
+
+    def greet(self, name):
+        """Return a greeting."""
+        return f"hello {name}"
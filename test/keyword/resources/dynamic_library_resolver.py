@@ -16,12 +16,12 @@ class DynamicLibraryResolver:  # pylint: disable=too-few-public-methods
         original_run_keyword = lib.run_keyword
 
         @wraps(original_run_keyword)
-        def patched_run_keyword(name, args, kwargs=None):
+        def patched_run_keyword(name, args, **kwargs):
             if name == method_name:
                 mock = getattr(lib, method_name, None)
                 if callable(mock):
                     return mock(name, args, kwargs)
-            return original_run_keyword(name, args, kwargs)
+            return original_run_keyword(name, args, **kwargs)
 
         lib.run_keyword = patched_run_keyword
         return original_run_keyword, method_name
@@ -0,0 +1,137 @@
+"""Unit tests for mocking keywords of dynamic and hybrid libraries."""
+import inspect
+import unittest
+from unittest.mock import Mock, patch
+from MockLibrary import MockLibrary
+from MockLibrary.dynamic import (
+    DynamicKeyword, RunKeywordDispatcher, get_keyword_names, remove_dynamic_mock,
+    set_dynamic_mock
+)
+
+
+class DynamicLibrary:
+    """Dynamic library whose run_keyword accepts named arguments."""
+
+    def __init__(self):
+        self.name_requests = 0
+
+    def get_keyword_names(self):
+        """Return the keyword names."""
+        self.name_requests += 1
+        return ['Get User', 'delete_user']
+
+    def run_keyword(self, name, args, kwargs):
+        """Run a keyword."""
+        return f"original {name} {list(args)} {kwargs}"
+
+
+class HybridLibrary:  # pylint: disable=too-few-public-methods
+    """Hybrid library whose keywords are created by __getattr__."""
+
+    def get_keyword_names(self):
+        """Return the keyword names."""
+        return ['getUser']
+
+    def __getattr__(self, name):
+        if name == 'getUser':
+            return lambda user_id: f"original {user_id}"
+        raise AttributeError(name)
+
+
+class TestRunKeywordDispatcher(unittest.TestCase):
+    """Tests for the run_keyword dispatch table."""
+
+    def test_one_dispatcher_for_all_mocks(self):
+        """Test mocks share one dispatcher and unmocked keywords run the original."""
+        lib = DynamicLibrary()
+        signature = inspect.signature(lib.run_keyword)
+        for index in range(10):
+            set_dynamic_mock(lib, f"keyword_{index}", Mock(return_value=index))
+        dispatcher = lib.run_keyword
+        self.assertIsInstance(dispatcher, RunKeywordDispatcher)
+        self.assertEqual(len(dispatcher.table), 10)
+        self.assertEqual(inspect.signature(dispatcher), signature)
+        self.assertEqual(lib.run_keyword("keyword_3", ["a"], {}), 3)
+        self.assertEqual(lib.run_keyword("Get User", ["a"], {}), "original Get User ['a'] {}")
+
+        for index in range(10):
+            remove_dynamic_mock(lib, f"keyword_{index}")
+        self.assertNotIn('run_keyword', vars(lib))
+
+    def test_instance_run_keyword_is_put_back(self):
+        """Test a run_keyword set on the instance is restored with the last mock."""
+        lib = DynamicLibrary()
+        run_keyword = Mock(return_value="instance")
+        lib.run_keyword = run_keyword
+        set_dynamic_mock(lib, "Get User", Mock(return_value="mocked"))
+        self.assertEqual(lib.run_keyword("Get User", [], {}), "mocked")
+        remove_dynamic_mock(lib, "Get User")
+        self.assertIs(lib.run_keyword, run_keyword)
+
+    def test_dynamic_keyword_passes_named_arguments(self):
+        """Test named arguments are passed separately only if run_keyword accepts them."""
+        calls = []
+
+        def with_named(name, args, kwargs):
+            calls.append((name, args, kwargs))
+
+        def without_named(name, args):
+            calls.append((name, args))
+
+        DynamicKeyword(with_named, "Kw")(1, key=2)
+        DynamicKeyword(without_named, "Kw")(1)
+        self.assertEqual(calls, [("Kw", [1], {"key": 2}), ("Kw", [1])])
+
+    def test_get_keyword_names(self):
+        """Test keyword names are mapped by their normalized names."""
+        self.assertEqual(get_keyword_names(DynamicLibrary())["deleteuser"], "delete_user")
+        self.assertIsNone(get_keyword_names(object()))
+
+
+class TestMockLibraryDynamic(unittest.TestCase):
+    """Tests for mocking dynamic and hybrid library keywords with MockLibrary."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.lib = DynamicLibrary()
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.lib)
+        self.patcher.start()
+        self.mock_lib = MockLibrary("Users")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.mock_lib.reset_mocks()
+        self.patcher.stop()
+
+    def test_mock_dynamic_keywords(self):
+        """Test dynamic keywords are mocked through run_keyword with their arguments."""
+        self.mock_lib.mock_keyword("get_user", side_effect=lambda user_id, active: user_id + active)
+        self.mock_lib.mock_keyword("Delete User", return_value="deleted")
+        self.assertEqual(self.lib.run_keyword("Get User", ["1"], {"active": "a"}), "1a")
+        self.assertEqual(self.lib.run_keyword("delete_user", ["1"], {}), "deleted")
+        self.mock_lib.verify_keyword_called("Get User", times=1)
+        self.assertEqual(self.lib.name_requests, 1)
+
+        self.mock_lib.reset_mocks()
+        self.assertNotIn('run_keyword', vars(self.lib))
+        self.assertEqual(self.lib.run_keyword("Get User", ["1"], {}), "original Get User ['1'] {}")
+
+    def test_cache_dynamic_keyword(self):
+        """Test the original of a dynamic keyword runs through the original run_keyword."""
+        self.mock_lib.cache_keyword("Get User")
+        self.assertEqual(self.lib.run_keyword("Get User", ["1"], {}), "original Get User ['1'] {}")
+        self.assertEqual(self.mock_lib.get_keyword_cache_info("Get User")["misses"], 1)
+
+    def test_mock_hybrid_keyword(self):
+        """Test hybrid keywords are looked up by the names the library lists."""
+        lib = HybridLibrary()
+        with patch('MockLibrary._get_library_instance', return_value=lib):
+            mock_lib = MockLibrary("Hybrid")
+            mock_lib.mock_keyword("Get User", return_value="mocked")
+        self.assertEqual(lib.getUser("1"), "mocked")  # pylint: disable=no-member
+        mock_lib.reset_mocks()
+        self.assertEqual(lib.getUser("1"), "original 1")  # pylint: disable=no-member
+
+
+if __name__ == '__main__':
+    unittest.main()
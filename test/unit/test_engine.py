@@ -0,0 +1,129 @@
+"""Unit tests for the mock engine shared by MockLibrary and MockResource."""
+import types
+import unittest
+from unittest.mock import Mock, patch
+from MockLibrary import MockLibrary
+from MockLibrary.engine import ENGINE, MockEngine, library_key
+from MockResource import MockResource, _DISPATCHER
+
+
+class SampleLibrary:  # pylint: disable=too-few-public-methods
+    """Sample library for testing."""
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    def connect(self):
+        """Return original value."""
+        return "connected"
+
+
+class TestMockEngine(unittest.TestCase):
+    """Tests for MockEngine class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.engine = MockEngine()
+        self.installed = []
+        self.restore = Mock()
+
+    def _register(self, mock, original=None):
+        self.engine.register("key", mock, self.installed.append, self.restore, original)
+
+    def test_latest_registration_wins(self):
+        """Test unregistering the active mock reinstalls the previous one."""
+        first, second = Mock(), Mock()
+        self._register(first, original="original")
+        self._register(second, original=first)
+        self.assertIs(self.engine.table["key"], second)
+        self.assertEqual(self.engine.original("key"), "original")
+
+        self.engine.unregister("key", second)
+        self.assertIs(self.engine.table["key"], first)
+        self.assertEqual(self.installed, [first, second, first])
+        self.restore.assert_not_called()
+
+    def test_first_restore_runs_with_last_mock(self):
+        """Test the original is restored once, whichever mock is unregistered last."""
+        first, second = Mock(), Mock()
+        self._register(first)
+        self.engine.register("key", second, self.installed.append, Mock())
+        self.engine.unregister("key", first)
+        self.assertIs(self.engine.table["key"], second)
+        self.assertEqual(self.installed, [first, second])
+
+        self.engine.unregister("key", second)
+        self.engine.unregister("key", second)
+        self.restore.assert_called_once_with()
+        self.assertNotIn("key", self.engine)
+        self.assertIsNone(self.engine.original("key"))
+
+
+class TestSharedEngine(unittest.TestCase):
+    """Tests for library and resource mocks sharing the engine."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.lib = SampleLibrary()
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.lib)
+        self.patcher.start()
+        self.first, self.second = MockLibrary("Sample"), MockLibrary("Sample")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.first.reset_mocks()
+        self.second.reset_mocks()
+        self.patcher.stop()
+
+    def test_instances_mocking_same_library(self):
+        """Test instances wrapping one library stack their mocks on the same keyword."""
+        self.first.mock_keyword("Connect", return_value="first")
+        self.second.mock_keyword("Connect", return_value="second")
+        self.assertEqual(self.lib.connect(), "second")
+        self.assertEqual(ENGINE.original(library_key(self.lib, "connect"))(), "connected")
+
+        self.first.reset_mocks()
+        self.assertEqual(self.lib.connect(), "second")
+        self.second.reset_mocks()
+        self.assertEqual(self.lib.connect(), "connected")
+        self.assertNotIn("connect", vars(self.lib))
+
+    def test_module_library_mocked_by_two_instances(self):
+        """Test the function of a module library survives mocks of two instances."""
+        def convert_time(value):
+            return value
+        module = types.ModuleType("sample_module")
+        module.convert_time = convert_time
+        with patch('MockLibrary._get_library_instance', return_value=module):
+            first, second = MockLibrary("Sample"), MockLibrary("Sample")
+            scopes = second._scopes  # pylint: disable=protected-access
+            first.mock_keyword("Convert Time", return_value="first")
+            scopes.start_test(None, None)
+            second.mock_keyword("Convert Time", return_value="second")
+            first.reset_mocks()
+            scopes.end_test(None, None)
+            scopes.start_test(None, None)
+            second.mock_keyword("Convert Time", return_value="second")
+            scopes.end_test(None, None)
+        self.assertIs(vars(module)["convert_time"], convert_time)
+
+    @patch('MockResource.BuiltIn')
+    def test_library_and_resource_keywords_in_one_table(self, mock_builtin):
+        """Test library and resource mocks are registered in the same table."""
+        keyword_runner = Mock()
+        keyword_runner.keyword.source = "db.resource"
+        keyword_runner.keyword.name = "Connect"
+        mock_builtin.return_value._namespace.get_runner.return_value = keyword_runner  # pylint: disable=protected-access
+        mock_resource = MockResource("db.resource")
+        mock_resource.mock_keyword("Connect", return_value="resource")
+        self.first.mock_keyword("Connect", return_value="library")
+
+        self.assertIn(("db.resource", "connect"), ENGINE)
+        self.assertIn(library_key(self.lib, "connect"), ENGINE)
+        self.first.reset_mocks()
+        self.assertTrue(_DISPATCHER.installed)
+        mock_resource.reset_mocks()
+        self.assertFalse(_DISPATCHER.installed)
+
+
+if __name__ == '__main__':
+    unittest.main()
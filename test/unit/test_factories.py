@@ -0,0 +1,119 @@
+"""Unit tests for return values built by factories."""
+import threading
+import unittest
+from collections import OrderedDict
+from unittest.mock import Mock, patch
+from MockLibrary import MockLibrary
+from MockLibrary.factories import LazyReturnValue, check_factory, resolve_factory
+
+
+class SampleLibrary:  # pylint: disable=too-few-public-methods
+    """Sample library for testing."""
+
+    def get_users(self):
+        """Return original value."""
+        return []
+
+
+class TestLazyReturnValue(unittest.TestCase):
+    """Tests for LazyReturnValue class."""
+
+    def test_factory_runs_once_on_first_call(self):
+        """Test the factory runs on the first call only, even from several threads."""
+        factory = Mock(side_effect=object)
+        lazy = LazyReturnValue(factory)
+        factory.assert_not_called()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(lazy())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        factory.assert_called_once_with()
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_unrelated_factories_run_concurrently(self):
+        """Test a factory waiting for another one and a factory calling another mock."""
+        started = threading.Event()
+        waiting = LazyReturnValue(lambda: started.wait(5))
+        thread = threading.Thread(target=waiting)
+        thread.start()
+        # The factory of the outer value is the inner lazy value itself
+        nested = LazyReturnValue(LazyReturnValue(lambda: started.set() or "inner"))
+        self.assertEqual(nested(), "inner")
+        thread.join()
+        self.assertTrue(waiting())
+
+    def test_shared_results(self):
+        """Test mocks sharing results build the result of a factory once."""
+        shared = {}
+        first = LazyReturnValue("collections:OrderedDict", shared)
+        second = LazyReturnValue("collections:OrderedDict", shared)
+        self.assertIs(first(), second())
+        self.assertIsNot(LazyReturnValue("collections:OrderedDict")(), first())
+
+    def test_references(self):
+        """Test references are checked without importing and resolved to attribute paths."""
+        check_factory("not_imported_module:build")
+        self.assertEqual(resolve_factory("collections:OrderedDict.fromkeys"), OrderedDict.fromkeys)
+        for factory in ("collections", "collections:", ":build", 42):
+            with self.assertRaisesRegex(ValueError, "'module:function' reference"):
+                LazyReturnValue(factory)
+
+
+class TestMockLibraryFactory(unittest.TestCase):
+    """Tests for return value factories of MockLibrary."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.lib = SampleLibrary()
+        self.factory = Mock(side_effect=lambda: ["alice", "bob"])
+        self.mock_lib = MockLibrary("Users")
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.lib)
+        self.patcher.start()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.mock_lib.reset_mocks()
+        self.patcher.stop()
+
+    def test_unused_mock_builds_nothing(self):
+        """Test the return value is built on the first call and memoized per mock."""
+        self.mock_lib.mock_keyword("Get Users", return_value_factory=self.factory)
+        self.factory.assert_not_called()
+        self.assertIs(self.lib.get_users(), self.lib.get_users())
+        self.mock_lib.mock_keyword("Get Users", return_value_factory=self.factory)
+        self.lib.get_users()
+        self.assertEqual(self.factory.call_count, 2)
+
+    def test_share_return_value_until_reset(self):
+        """Test a shared result outlives the test that built it until Reset Mocks."""
+        scopes = self.mock_lib._scopes  # pylint: disable=protected-access
+        users = []
+        for _ in range(2):
+            scopes.start_test(None, None)
+            self.mock_lib.mock_keyword(
+                "Get Users", return_value_factory=self.factory, share_return_value=True
+            )
+            users.append(self.lib.get_users())
+            scopes.end_test(None, None)
+        self.assertIs(users[0], users[1])
+        self.mock_lib.reset_mocks()
+        self.mock_lib.mock_keywords({
+            "Get Users": {"return_value_factory": self.factory, "share_return_value": True}
+        })
+        self.assertIsNot(self.lib.get_users(), users[0])
+        self.assertEqual(self.factory.call_count, 2)
+
+    def test_factory_is_a_return_value_source(self):
+        """Test a factory cannot be combined with another source of return values."""
+        with self.assertRaisesRegex(ValueError, "only one of side_effect, return_value_factory"):
+            self.mock_lib.mock_keyword(
+                "Get Users", side_effect=len, return_value_factory=self.factory
+            )
+        with self.assertRaisesRegex(ValueError, "share_return_value must be true or false"):
+            self.mock_lib.mock_keywords({"Get Users": {"share_return_value": "yes"}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""Unit tests for injected latency and failures."""
+import asyncio
+import unittest
+from unittest.mock import patch
+from MockLibrary import MockLibrary
+from MockLibrary.faults import FaultPlan, FaultyMock, InjectedFailure, fault_plan
+from MockLibrary.recorder import create_mock
+
+
+class SampleLibrary:
+    """Sample library for testing."""
+
+    def connect(self, host):
+        """Return original value."""
+        return f"connected to {host}"
+
+    async def fetch(self, url):
+        """Return original value."""
+        return f"page {url}"
+
+
+class TestFaultPlan(unittest.TestCase):
+    """Tests for FaultPlan class."""
+
+    def test_same_seed_same_faults(self):
+        """Test latencies and failures are reproduced by the seed."""
+        def faults(seed):
+            plan = FaultPlan(latency="uniform:0.1,0.5", failure_rate=0.5, seed=seed)
+            return [
+                (latency, failure is not None)
+                for latency, failure in (plan.next_fault() for _ in range(20))
+            ]
+        self.assertEqual(faults(42), faults(42))
+        self.assertNotEqual(faults(42), faults(43))
+        self.assertTrue(all(0.1 <= latency <= 0.5 for latency, _ in faults(42)))
+        self.assertEqual({failing for _, failing in faults(42)}, {True, False})
+
+    def test_fail_first(self):
+        """Test the first calls fail with the configured failure, then calls pass."""
+        plan = FaultPlan(fail_first=2, failure=ConnectionError, seed=1)
+        failures = [plan.next_fault()[1] for _ in range(3)]
+        self.assertIsInstance(failures[0], ConnectionError)
+        self.assertIn("call 2 (seed 1)", str(failures[1]))
+        self.assertIsNone(failures[2])
+        self.assertEqual(plan.failures, 2)
+        plan = FaultPlan(fail_first=1, failure="backend down")
+        self.assertEqual(str(plan.next_fault()[1]), "backend down")
+
+    def test_reset_draws_same_faults(self):
+        """Test a reset plan fails its first calls again and repeats its seeded draws."""
+        plan = FaultPlan(latency="exponential:0.2", failure_rate=0.3, fail_first=2, seed=9)
+
+        def draw():
+            return [(latency, str(failure)) for latency, failure in (
+                plan.next_fault() for _ in range(10)
+            )]
+        first = draw()
+        plan.reset()
+        self.assertEqual(plan.failures, 0)
+        self.assertEqual(draw(), first)
+        self.assertIn("call 2", first[1][1])
+
+    def test_latencies(self):
+        """Test fixed latencies and draws below zero wait no time."""
+        self.assertEqual(FaultPlan(latency="0.25").next_fault(), (0.25, None))
+        plan = FaultPlan(latency="normal:0,1", seed=3)
+        self.assertTrue(all(plan.next_fault()[0] >= 0 for _ in range(50)))
+
+    def test_invalid_options(self):
+        """Test invalid options are reported and options without a fault rejected."""
+        invalid = (
+            {"latency": -1}, {"latency": "gamma:1,2"}, {"latency": "uniform:1"},
+            {"failure_rate": 1.5}, {"fail_first": -1}, {"failure": 42}, {"seed": "abc"},
+            {"seed": 1},
+        )
+        for options in invalid:
+            with self.assertRaises(ValueError, msg=options):
+                fault_plan(options)
+        self.assertIsNone(fault_plan({"latency": None, "seed": None}))
+
+
+class TestFaultyMock(unittest.TestCase):
+    """Tests for FaultyMock class."""
+
+    def test_calls_sleep(self):
+        """Test calls sleep for their latency and failing calls do not reach the mock."""
+        mock = create_mock(side_effect=[1, 2], retention='count')
+        faulty = FaultyMock(mock, FaultPlan(latency=0.5, fail_first=1))
+        with patch('MockLibrary.faults.time.sleep') as sleep:
+            with self.assertRaises(InjectedFailure):
+                faulty()
+            self.assertEqual(faulty(), 1)
+        self.assertEqual(sleep.call_count, 2)
+        sleep.assert_called_with(0.5)
+        self.assertEqual((faulty.call_count, mock.call_count), (2, 1))
+        faulty.reset_mock()
+        with patch('MockLibrary.faults.time.sleep'), self.assertRaises(InjectedFailure):
+            faulty()
+
+    def test_async_calls_await_sleep(self):
+        """Test async calls wait with asyncio.sleep."""
+        faulty = FaultyMock(create_mock(return_value="page"), FaultPlan(latency=0.5), True)
+        with patch('MockLibrary.faults.asyncio.sleep') as sleep:
+            self.assertEqual(asyncio.run(faulty()), "page")
+        sleep.assert_any_await(0.5)
+
+
+class TestMockLibraryFaults(unittest.TestCase):
+    """Tests for the fault options of MockLibrary."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.lib = SampleLibrary()
+        self.mock_lib = MockLibrary("Network")
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.lib)
+        self.patcher.start()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.mock_lib.reset_mocks()
+        self.patcher.stop()
+
+    def test_mock_keyword_fails_first_calls(self):
+        """Test a keyword failing its first calls succeeds once retried, every call counted."""
+        self.mock_lib.mock_keyword("Connect", return_value="ok", fail_first=2, seed=5)
+        for _ in range(2):
+            with self.assertRaisesRegex(InjectedFailure, "seed 5"):
+                self.lib.connect("db")
+        self.assertEqual(self.lib.connect("db"), "ok")
+        self.mock_lib.verify_keyword_called("Connect", times=3)
+
+    def test_async_keyword_latency(self):
+        """Test latency of an async keyword is awaited."""
+        self.mock_lib.mock_keyword("Fetch", return_value="mocked", latency=0.01)
+        self.assertEqual(asyncio.run(self.lib.fetch("/")), "mocked")
+
+    def test_mock_table_faults(self):
+        """Test faults of a mock table are validated and injected."""
+        with self.assertRaisesRegex(ValueError, "'Connect': failure_rate must be between"):
+            self.mock_lib.mock_keywords({"Connect": {"failure_rate": 2}})
+        self.mock_lib.mock_keywords({
+            "Connect": {"return_value": "ok", "failure_rate": 1, "failure": "down"}
+        })
+        with self.assertRaisesRegex(InjectedFailure, "down"):
+            self.lib.connect("db")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""Unit tests for lazily loaded file payloads."""
+import mmap
+import os
+import tempfile
+import unittest
+from MockLibrary.fixtures import PAYLOAD_CACHE, FilePayload, PayloadCache
+from MockLibrary.recorder import create_mock
+
+
+class TestFilePayload(unittest.TestCase):
+    """Tests for FilePayload class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        PAYLOAD_CACHE.clear()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        PAYLOAD_CACHE.clear()
+        self.directory.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'wb') as file:
+            file.write(content)
+        return path
+
+    def test_jsonl_payload(self):
+        """Test a JSON Lines file is returned as a list of parsed lines."""
+        path = self._write("rows.jsonl", b'{"id": 1}\n\n["a", 2]\n')
+        self.assertEqual(FilePayload(path)(), [{"id": 1}, ["a", 2]])
+
+    def test_csv_payload(self):
+        """Test a CSV file is returned as a list of row tuples."""
+        path = self._write("rows.csv", b'1,alice\n2,bob\n')
+        self.assertEqual(FilePayload(path)(), [("1", "alice"), ("2", "bob")])
+
+    def test_bytes_payload_is_memory_mapped(self):
+        """Test a bytes payload is a read-only view of a memory map."""
+        path = self._write("blob.dat", b'\x00\x01payload')
+        payload = FilePayload(path)()
+        self.assertIsInstance(payload, memoryview)
+        self.assertIsInstance(payload.obj, mmap.mmap)
+        self.assertTrue(payload.readonly)
+        self.assertEqual(payload.tobytes(), b'\x00\x01payload')
+
+    def test_empty_bytes_payload(self):
+        """Test an empty file gives an empty payload."""
+        path = self._write("empty.bin", b'')
+        self.assertEqual(FilePayload(path)().tobytes(), b'')
+
+    def test_payload_is_loaded_on_first_call(self):
+        """Test nothing is loaded until the payload is first requested."""
+        path = self._write("rows.jsonl", b'1\n2\n')
+        payload = FilePayload(path)
+        self.assertEqual(len(PAYLOAD_CACHE), 0)
+        first = payload()
+        self.assertEqual(len(PAYLOAD_CACHE), 1)
+        self.assertIs(FilePayload(path, 'jsonl')(), first)
+
+    def test_changed_file_is_loaded_again(self):
+        """Test a modified file is not served from the cache."""
+        path = self._write("rows.jsonl", b'1\n')
+        payload = FilePayload(path)
+        self.assertEqual(payload(), [1])
+        self._write("rows.jsonl", b'1\n2\n')
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(payload(), [1, 2])
+
+    def test_nonexistent_file(self):
+        """Test a missing file raises FileNotFoundError when mocking."""
+        with self.assertRaises(FileNotFoundError):
+            FilePayload(os.path.join(self.directory.name, "missing.jsonl"))
+
+    def test_unsupported_format(self):
+        """Test an unsupported file format raises ValueError."""
+        path = self._write("rows.jsonl", b'1\n')
+        with self.assertRaises(ValueError):
+            FilePayload(path, 'xml')
+
+    def test_create_mock_with_return_value_file(self):
+        """Test mocks created with return_value_file return the payload."""
+        path = self._write("rows.csv", b'1,alice\n')
+        for retention in ('mock', 'count'):
+            mock = create_mock(return_value_file=path, retention=retention)
+            self.assertEqual(mock("SELECT 1"), [("1", "alice")])
+        with self.assertRaises(ValueError):
+            create_mock(side_effect=len, return_value_file=path)
+
+
+class TestPayloadCache(unittest.TestCase):
+    """Tests for PayloadCache class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.directory.cleanup()
+
+    def _write(self, name, size):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write("1\n" * (size // 2))
+        return path
+
+    def test_least_recently_used_payload_is_evicted(self):
+        """Test the cache stays within its size limit."""
+        cache = PayloadCache(max_bytes=250)
+        first, second, third = (self._write(f"{name}.jsonl", 100) for name in "abc")
+        cache.get(first, 'jsonl')
+        cache.get(second, 'jsonl')
+        cache.get(first, 'jsonl')
+        cache.get(third, 'jsonl')
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, 200)
+        cached_paths = {key[0] for key in cache._entries}  # pylint: disable=protected-access
+        self.assertEqual(cached_paths, {first, third})
+
+    def test_resize_evicts(self):
+        """Test shrinking the cache evicts payloads."""
+        cache = PayloadCache()
+        for name in "abc":
+            cache.get(self._write(f"{name}.jsonl", 100), 'jsonl')
+        cache.resize(100)
+        self.assertEqual(len(cache), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
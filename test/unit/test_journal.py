@@ -0,0 +1,156 @@
+"""Unit tests for the mock call journal."""
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest.mock import Mock, patch
+from MockLibrary import MockLibrary
+from MockLibrary.journal import (
+    CallJournal, args_hash, check_expectations, get_journal, main, merge_journals
+)
+
+
+class SampleLibrary:  # pylint: disable=too-few-public-methods
+    """Sample library for testing."""
+
+    def query(self, statement):
+        """Return original value."""
+        return f"original {statement}"
+
+
+def _read_records(path):
+    with open(path, encoding='utf-8') as file:
+        return [json.loads(line) for line in file]
+
+
+class TestCallJournal(unittest.TestCase):
+    """Tests for CallJournal class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.journal = CallJournal(self.tmpdir.name)
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.journal.close()
+        self.tmpdir.cleanup()
+
+    def test_records_mocks_and_calls(self):
+        """Test mocking and calling a keyword is journaled with the running test."""
+        mock = self.journal.wrap("DB", "Query", Mock(return_value="mocked"))
+        self.journal.start_test(None, Mock(full_name="Suite.Test"))
+        self.assertEqual(mock("SELECT 1", timeout=5), "mocked")
+        self.journal.end_test(None, None)
+        self.journal.flush()
+
+        mock_record, call_record = _read_records(self.journal.path)
+        self.assertEqual(mock_record, {"mock": "Query", "lib": "DB"})
+        self.assertEqual(call_record["kw"], "Query")
+        self.assertEqual(call_record["test"], "Suite.Test")
+        self.assertEqual(call_record["args"], args_hash(("SELECT 1",), {"timeout": 5}))
+        self.assertGreaterEqual(call_record["ns"], 0)
+        self.assertEqual(mock.call_count, 1)
+
+    def test_failing_calls_are_journaled(self):
+        """Test calls raising an exception are recorded too."""
+        mock = self.journal.wrap("DB", "Query", Mock(side_effect=ValueError("boom")))
+        with self.assertRaises(ValueError):
+            mock()
+        self.journal.close()
+        self.assertEqual(len(_read_records(self.journal.path)), 2)
+
+    def test_args_hash_ignores_named_argument_order(self):
+        """Test the argument hash does not depend on the order of named arguments."""
+        self.assertEqual(args_hash((1,), {"a": 1, "b": 2}), args_hash((1,), {"b": 2, "a": 1}))
+        self.assertNotEqual(args_hash((1,), {}), args_hash((2,), {}))
+
+    def test_get_journal_is_shared_per_directory(self):
+        """Test libraries journaling into one directory share one journal."""
+        journal = get_journal(self.tmpdir.name)
+        self.assertIs(get_journal(self.tmpdir.name), journal)
+        journal.close()
+        self.assertIsNot(get_journal(self.tmpdir.name), journal)
+        get_journal(self.tmpdir.name).close()
+
+
+class TestMergeJournals(unittest.TestCase):
+    """Tests for merging journals and checking expectations."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        for worker, calls in enumerate((2, 3)):
+            path = os.path.join(self.tmpdir.name, f"mock-journal-host-{worker}.jsonl")
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(json.dumps({"mock": "Query", "lib": "DB"}) + "\n")
+                file.write(json.dumps({"mock": "Execute Sql", "lib": "DB"}) + "\n")
+                for call in range(calls):
+                    file.write(json.dumps({
+                        "kw": "query", "lib": "DB", "args": str(call), "ts": 0,
+                        "test": f"Suite.Test {worker}", "ns": 10,
+                    }) + "\n")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.tmpdir.cleanup()
+
+    def test_merge_directory(self):
+        """Test worker journals are merged into one summary."""
+        summary = merge_journals([self.tmpdir.name])
+        self.assertEqual(summary["journals"], 2)
+        self.assertEqual(summary["keywords"]["DB.query"], {
+            "calls": 5, "tests": 2, "arguments": 3, "total_ns": 50, "processes": 2,
+        })
+        self.assertEqual(summary["unused"], ["DB.executesql"])
+
+    def test_check_expectations(self):
+        """Test call count expectations with and without library names."""
+        summary = merge_journals([self.tmpdir.name])
+        self.assertEqual(
+            check_expectations(summary, ["Query>=5", "DB.Query==5", "execute_sql<1"]), []
+        )
+        failures = check_expectations(summary, ["query>5", "query"])
+        self.assertEqual(failures, [
+            "Expected 'query' > 5 calls, got 5", "Invalid expectation 'query'"
+        ])
+
+    def test_main(self):
+        """Test the command line writes the summary and fails on unmet expectations."""
+        output = os.path.join(self.tmpdir.name, "summary.json")
+        self.assertEqual(main([self.tmpdir.name, "--output", output, "--expect", "query>=5"]), 0)
+        with open(output, encoding='utf-8') as file:
+            self.assertEqual(json.load(file)["keywords"]["DB.query"]["calls"], 5)
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()) as stderr:
+            self.assertEqual(main([self.tmpdir.name, "--fail-on-unused"]), 1)
+        self.assertIn("DB.executesql", stderr.getvalue())
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()) as stderr:
+            self.assertEqual(main([self.tmpdir.name, "--expect", "query>=two"]), 1)
+        self.assertIn("Invalid expectation 'query>=two', expected a call count", stderr.getvalue())
+
+
+class TestMockLibraryJournal(unittest.TestCase):
+    """Tests for journaling the calls of MockLibrary mocks."""
+
+    def test_calls_are_journaled(self):
+        """Test calls of a mocked keyword end up in the journal of the process."""
+        sample_lib = SampleLibrary()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch('MockLibrary._get_library_instance', return_value=sample_lib):
+                mock_lib = MockLibrary("DB", journal=tmpdir)
+                mock_lib.mock_keyword("Query", return_value="mocked")
+            journal = get_journal(tmpdir)
+            self.assertIn(journal, mock_lib.ROBOT_LIBRARY_LISTENER)
+            sample_lib.query("SELECT 1")
+            mock_lib.verify_keyword_called("Query", times=1)
+            mock_lib.reset_mocks()
+            journal.close()
+
+            summary = merge_journals([tmpdir])
+        self.assertEqual(summary["keywords"]["DB.query"]["calls"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Unit tests for memoized keywords."""
+import unittest
+from unittest.mock import Mock, patch
+from MockLibrary import MockLibrary
+from MockLibrary.memo import MemoCache, get_memo_info
+
+
+class SampleLibrary:  # pylint: disable=too-few-public-methods
+    """Sample library for testing."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def generate_token(self, user, scopes=()):
+        """Return a new token on every call."""
+        self.calls += 1
+        return f"{user}-{len(scopes)}-{self.calls}"
+
+
+class TestMemoCache(unittest.TestCase):
+    """Tests for MemoCache class."""
+
+    def test_original_runs_only_on_miss(self):
+        """Test results are memoized per argument combination."""
+        original = Mock(side_effect=lambda *args, **kwargs: len(args) + len(kwargs))
+        memo = MemoCache(original)
+        self.assertEqual([memo(1), memo(1), memo(1, key=[2]), memo(1, key=[2])], [1, 1, 2, 2])
+        self.assertEqual(original.call_count, 2)
+        self.assertEqual(memo.info(), {
+            "hits": 2, "misses": 2, "size": 2, "max_size": 128, "ttl": None,
+        })
+
+    def test_least_recently_used_is_evicted(self):
+        """Test the least recently used result is evicted above max_size."""
+        original = Mock(side_effect=lambda value: value)
+        memo = MemoCache(original, max_size=2)
+        memo("a")
+        memo("b")
+        memo("a")
+        memo("c")
+        memo("a")
+        self.assertEqual(original.call_count, 3)
+        memo("b")
+        self.assertEqual(original.call_count, 4)
+
+    def test_ttl(self):
+        """Test results expire ttl seconds after they were computed."""
+        original = Mock(return_value="token")
+        memo = MemoCache(original, ttl=60)
+        with patch('MockLibrary.memo.time.monotonic', return_value=0.0):
+            memo()
+        with patch('MockLibrary.memo.time.monotonic', return_value=59.0):
+            memo()
+        with patch('MockLibrary.memo.time.monotonic', return_value=61.0):
+            memo()
+        self.assertEqual(original.call_count, 2)
+
+    def test_unhashable_arguments_and_errors_are_not_memoized(self):
+        """Test calls with unhashable arguments or raising errors always run the original."""
+        original = Mock(side_effect=[ValueError("boom"), "ok", "ok", "ok"])
+        memo = MemoCache(original)
+        with self.assertRaises(ValueError):
+            memo("key")
+        self.assertEqual(memo("key"), "ok")
+        memo(bytearray(b"a"))
+        memo(bytearray(b"a"))
+        self.assertEqual(original.call_count, 4)
+        memo.clear()
+        self.assertEqual(memo.info()["size"], 0)
+
+    def test_invalid_max_size(self):
+        """Test a cache must hold at least one result."""
+        with self.assertRaises(ValueError):
+            MemoCache(len, max_size=0)
+
+
+class TestMockLibraryCache(unittest.TestCase):
+    """Tests for the Cache Keyword keyword of MockLibrary."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sample_lib = SampleLibrary()
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.sample_lib)
+        self.patcher.start()
+        self.mock_lib = MockLibrary("Auth", statistics=True)
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.patcher.stop()
+
+    def test_cache_keyword(self):
+        """Test the original keyword runs once per arguments until the mocks are reset."""
+        self.mock_lib.cache_keyword("Generate Token")
+        first = self.sample_lib.generate_token("alice")
+        self.assertEqual(self.sample_lib.generate_token("alice"), first)
+        self.sample_lib.generate_token("alice", scopes=["read"])
+        self.assertEqual(self.sample_lib.calls, 2)
+        self.mock_lib.verify_keyword_called("Generate Token", times=3)
+        info = self.mock_lib.get_keyword_cache_info("Generate Token")
+        self.assertEqual((info["hits"], info["misses"]), (1, 2))
+
+        self.mock_lib.reset_mocks()
+        self.assertNotEqual(self.sample_lib.generate_token("alice"), first)
+        with self.assertRaises(AssertionError):
+            self.mock_lib.get_keyword_cache_info("Generate Token")
+
+    def test_mocked_keyword_is_not_cached(self):
+        """Test cache info of a keyword mocked without Cache Keyword fails."""
+        mock = self.mock_lib.mock_keyword("Generate Token", return_value="token")
+        with self.assertRaises(AssertionError):
+            get_memo_info(mock, "Generate Token")
+        self.mock_lib.reset_mocks()
+
+
+if __name__ == '__main__':
+    unittest.main()
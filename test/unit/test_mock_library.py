@@ -1,14 +1,25 @@
 """Unit tests for MockLibrary."""
+import asyncio
+import inspect
 import os
+import shutil
+import sys
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 from robot.api.deco import keyword
-from MockLibrary import MockLibrary, _get_library_instance, _load_custom_resolver
+from MockLibrary import (
+    MockLibrary, _get_keyword_index, _get_library_instance, _load_custom_resolver
+)
+from MockLibrary.recorder import CallRecorder
 
 
 class SampleLibrary:
     """Sample library for testing."""
 
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
     def simple_keyword(self):
         """Return original value."""
         return "original"
@@ -23,6 +34,16 @@ class SampleLibrary:
         return "custom"
 
 
+class AsyncLibrary:  # pylint: disable=too-few-public-methods
+    """Sample library with an async keyword."""
+
+    ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+
+    async def fetch(self, url):
+        """Return original value."""
+        return f"original {url}"
+
+
 class TestGetLibraryInstance(unittest.TestCase):
     """Tests for _get_library_instance function."""
 
@@ -70,6 +91,21 @@ class TestMockLibrary(unittest.TestCase):
         result = self.sample_lib.simple_keyword()
         self.assertEqual(result, "mocked")
 
+    def test_mock_keyword_custom_name(self):
+        """Test mocking a keyword by its @keyword decorator custom name."""
+        self.mock_lib.mock_keyword("Custom Name", return_value="mocked")
+        result = self.sample_lib.custom_named_keyword()
+        self.assertEqual(result, "mocked")
+
+    def test_mock_custom_name_twice_keeps_original(self):
+        """Test mocking a custom named keyword twice still restores the original."""
+        self.mock_lib.mock_keyword("Custom Name", return_value="first")
+        self.mock_lib.mock_keyword("custom_name", return_value="second")
+        self.assertEqual(self.sample_lib.custom_named_keyword(), "second")
+        self.mock_lib.verify_keyword_called("CUSTOM NAME", times=1)
+        self.mock_lib.reset_mocks()
+        self.assertEqual(self.sample_lib.custom_named_keyword(), "custom")
+
     def test_mock_keyword_side_effect(self):
         """Test mocking a keyword with a side effect."""
         def side_effect(*_args, **_kwargs):
@@ -163,6 +199,274 @@ class TestMockLibrary(unittest.TestCase):
         self.mock_lib.verify_keyword_called("simple keyword", times=1)
 
 
+class TestMockLibraryRetention(unittest.TestCase):
+    """Tests for MockLibrary call history retention."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sample_lib = SampleLibrary()
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.sample_lib)
+        self.patcher.start()
+        self.mock_lib = MockLibrary("TestLib")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.mock_lib.reset_mocks()
+        self.patcher.stop()
+
+    def test_mock_keyword_with_retention(self):
+        """Test mocking a keyword with a bounded call history."""
+        mock = self.mock_lib.mock_keyword(
+            "another_keyword", return_value="mocked", retention="last", history=2
+        )
+        for arg in ("a", "b", "c"):
+            self.sample_lib.another_keyword(arg)
+        self.assertIsInstance(mock, CallRecorder)
+        self.assertEqual(mock.call_args_list, [(("b",), {}), (("c",), {})])
+        self.mock_lib.verify_keyword_called("another_keyword", times=3)
+
+    def test_retention_import_argument(self):
+        """Test the retention import argument is the default for all mocks."""
+        mock_lib = MockLibrary("TestLib", retention="count")
+        mock = mock_lib.mock_keyword("simple_keyword", return_value="mocked")
+        try:
+            self.assertIsInstance(mock, CallRecorder)
+            self.assertEqual(self.sample_lib.simple_keyword(), "mocked")
+            mock_lib.verify_keyword_called("simple_keyword", times=1)
+        finally:
+            mock_lib.reset_mocks()
+
+    def test_invalid_retention(self):
+        """Test an unsupported retention mode raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.mock_lib.mock_keyword("simple_keyword", retention="forever")
+
+
+class TestMockLibraryBulk(unittest.TestCase):
+    """Tests for mocking many keywords with MockLibrary.mock_keywords."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sample_lib = SampleLibrary()
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.sample_lib)
+        self.patcher.start()
+        self.mock_lib = MockLibrary("TestLib")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.mock_lib.reset_mocks()
+        self.patcher.stop()
+
+    def test_mock_keywords(self):
+        """Test mocking many keywords from a dictionary."""
+        mocks = self.mock_lib.mock_keywords({
+            "Simple Keyword": {"return_value": "mocked"},
+            "another_keyword": {"side_effect": ["first", "second"]},
+            "Custom Name": {"return_value": "custom mocked", "retention": "count"},
+        })
+        self.assertEqual(set(mocks), {"Simple Keyword", "another_keyword", "Custom Name"})
+        self.assertEqual(self.sample_lib.simple_keyword(), "mocked")
+        self.assertEqual(self.sample_lib.another_keyword("x"), "first")
+        self.assertEqual(self.sample_lib.another_keyword("y"), "second")
+        self.assertEqual(self.sample_lib.custom_named_keyword(), "custom mocked")
+        self.mock_lib.verify_keyword_called("Another Keyword", times=2)
+
+    def test_unknown_keyword_patches_nothing(self):
+        """Test an unknown keyword in the table leaves every keyword unpatched."""
+        with self.assertRaises(AttributeError) as ctx:
+            self.mock_lib.mock_keywords({
+                "Simple Keyword": {"return_value": "mocked"},
+                "Nonexistent Keyword": {"return_value": "mocked"},
+            })
+        self.assertIn("Nonexistent Keyword", str(ctx.exception))
+        self.assertEqual(self.sample_lib.simple_keyword(), "original")
+        self.assertEqual(len(self.mock_lib._mocks), 0)  # pylint: disable=protected-access
+
+    def test_malformed_table_patches_nothing(self):
+        """Test a malformed table leaves every keyword unpatched."""
+        with self.assertRaises(ValueError):
+            self.mock_lib.mock_keywords({
+                "Simple Keyword": {"return_value": "mocked"},
+                "Another Keyword": {"retention": "forever"},
+            })
+        self.assertEqual(self.sample_lib.simple_keyword(), "original")
+
+
+class TestMockLibraryScopes(unittest.TestCase):
+    """Tests for suite level base mocks and test level overlays."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sample_lib = SampleLibrary()
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.sample_lib)
+        self.patcher.start()
+        self.mock_lib = MockLibrary("TestLib")
+        self.listener = self.mock_lib._scopes  # pylint: disable=protected-access
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.mock_lib.reset_mocks()
+        self.patcher.stop()
+
+    def test_end_test_restores_base_layer(self):
+        """Test test level mocks are reverted to the suite level mocks at test end."""
+        self.listener.start_suite(None, None)
+        self.mock_lib.mock_keyword("Simple Keyword", return_value="base")
+        self.listener.start_test(None, None)
+        self.mock_lib.mock_keyword("Simple Keyword", return_value="overlay")
+        self.mock_lib.mock_keyword("Another Keyword", return_value="overlay")
+        self.assertEqual(self.sample_lib.simple_keyword(), "overlay")
+        self.listener.end_test(None, None)
+
+        self.assertEqual(self.sample_lib.simple_keyword(), "base")
+        self.assertEqual(self.sample_lib.another_keyword("x"), "original_x")
+        with self.assertRaises(AssertionError):
+            self.mock_lib.verify_keyword_called("Another Keyword")
+
+        self.listener.end_suite(None, None)
+        self.assertEqual(self.sample_lib.simple_keyword(), "original")
+
+    def test_base_layer_is_not_repatched_between_tests(self):
+        """Test keywords not touched by a test keep the same mock object."""
+        self.listener.start_suite(None, None)
+        base = self.mock_lib.mock_keyword("Simple Keyword", return_value="base")
+        for _ in range(3):
+            self.listener.start_test(None, None)
+            self.sample_lib.simple_keyword()
+            self.mock_lib.verify_keyword_called("Simple Keyword", times=1)
+            self.listener.end_test(None, None)
+        self.assertIs(self.sample_lib.simple_keyword.mock, base)
+
+    def test_scope_mocks_disabled(self):
+        """Test no listener is registered when scoping is disabled."""
+        mock_lib = MockLibrary("TestLib", scope_mocks=False)
+        self.assertEqual(mock_lib.ROBOT_LIBRARY_LISTENER, [])
+
+
+class TestMockLibraryInstancePatching(unittest.TestCase):
+    """Tests for patching only the wrapped library instance."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sample_lib = SampleLibrary()
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.sample_lib)
+        self.patcher.start()
+        self.mock_lib = MockLibrary("TestLib")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.mock_lib.reset_mocks()
+        self.patcher.stop()
+
+    def test_class_and_other_instances_are_untouched(self):
+        """Test another instance of the same class keeps its original methods."""
+        original_function = SampleLibrary.simple_keyword
+        other_lib = SampleLibrary()
+        self.mock_lib.mock_keyword("Simple Keyword", return_value="mocked")
+        self.assertEqual(self.sample_lib.simple_keyword(), "mocked")
+        self.assertEqual(other_lib.simple_keyword(), "original")
+        self.assertIs(SampleLibrary.simple_keyword, original_function)
+
+        self.mock_lib.reset_mocks()
+        self.assertNotIn("simple_keyword", vars(self.sample_lib))
+        self.assertEqual(self.sample_lib.simple_keyword(), "original")
+
+    def test_concurrent_calls_are_counted(self):
+        """Test calls from worker threads are merged when verifying."""
+        self.mock_lib.mock_keyword("Another Keyword", return_value="mocked", retention="count")
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self.sample_lib.another_keyword, range(2000)))
+        self.assertEqual(set(results), {"mocked"})
+        self.mock_lib.verify_keyword_called("Another Keyword", times=2000)
+
+    def test_instance_attribute_is_restored(self):
+        """Test keywords stored on the instance itself, like module functions, are put back."""
+        original_function = self.sample_lib.simple_keyword
+        self.sample_lib.simple_keyword = original_function
+        self.mock_lib.mock_keyword("Simple Keyword", return_value="mocked")
+        self.mock_lib.reset_mocks()
+        self.assertIs(vars(self.sample_lib)["simple_keyword"], original_function)
+
+    def test_instance_without_dict_is_patched_on_class(self):
+        """Test libraries using __slots__ fall back to patching their class."""
+        class SlotsLibrary:  # pylint: disable=too-few-public-methods
+            """Library without an instance dictionary."""
+            __slots__ = ()
+
+            def slots_keyword(self):
+                """Return original value."""
+                return "original"
+
+        lib = SlotsLibrary()
+        with patch('MockLibrary._get_library_instance', return_value=lib):
+            mock_lib = MockLibrary("SlotsLib")
+            mock_lib.mock_keyword("Slots Keyword", return_value="mocked")
+        self.assertEqual(lib.slots_keyword(), "mocked")
+        mock_lib.reset_mocks()
+        self.assertEqual(lib.slots_keyword(), "original")
+
+    def test_test_scoped_library_is_patched_on_class(self):
+        """Test libraries created again for every test are looked up and patched on their class."""
+        class ScopedLibrary(SampleLibrary):  # pylint: disable=too-few-public-methods
+            """Library with the default TEST scope."""
+            ROBOT_LIBRARY_SCOPE = 'TEST'
+
+            def another_keyword(self, arg):
+                """Return original value with arg."""
+                return f"scoped_{arg}"
+
+        with patch(
+            'MockLibrary._get_library_instance', side_effect=lambda name: ScopedLibrary()
+        ):
+            mock_lib = MockLibrary("ScopedLib")
+            mock_lib.mock_keyword("Simple Keyword", return_value="mocked")
+            mock_lib.mock_keyword("Another Keyword", return_value="mocked")
+        self.assertEqual(ScopedLibrary().simple_keyword(), "mocked")
+        self.assertEqual(ScopedLibrary().another_keyword(1), "mocked")
+        mock_lib.verify_keyword_called("Simple Keyword", times=1)
+        mock_lib.reset_mocks()
+        self.assertNotIn("simple_keyword", vars(ScopedLibrary))
+        self.assertEqual(ScopedLibrary().another_keyword(1), "scoped_1")
+        self.assertEqual(self.sample_lib.simple_keyword(), "original")
+
+
+class TestKeywordIndex(unittest.TestCase):
+    """Tests for the per-class keyword index."""
+
+    def test_index_contains_method_and_custom_names(self):
+        """Test the index maps normalized names to attribute names."""
+        index = _get_keyword_index(SampleLibrary())
+        self.assertEqual(index["simplekeyword"], "simple_keyword")
+        self.assertEqual(index["customname"], "custom_named_keyword")
+
+    def test_index_is_shared_by_instances(self):
+        """Test the index is built once per library class."""
+        self.assertIs(_get_keyword_index(SampleLibrary()), _get_keyword_index(SampleLibrary()))
+
+    def test_index_does_not_evaluate_properties(self):
+        """Test building the index does not trigger property side effects."""
+        evaluated = []
+
+        class LibraryWithProperty:  # pylint: disable=too-few-public-methods
+            """Library with a property that has side effects."""
+
+            @property
+            def connection(self):
+                """Record that the property was evaluated."""
+                evaluated.append(True)
+                return "connection"
+
+            @keyword(name="Open Connection")
+            def connect(self):
+                """Return original value."""
+                return "original"
+
+        index = _get_keyword_index(LibraryWithProperty())
+        self.assertEqual(index["openconnection"], "connect")
+        self.assertNotIn("connection", index)
+        self.assertEqual(evaluated, [])
+
+
 class TestLoadCustomResolver(unittest.TestCase):
     """Tests for _load_custom_resolver function."""
 
@@ -190,6 +494,33 @@ class TestLoadCustomResolver(unittest.TestCase):
         finally:
             os.remove(init_path)
 
+    def test_resolver_file_is_imported_once(self):
+        """Test a resolver file is imported once and modified files again."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'resolver.py')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('class Resolver:\n    resolve_original_method = None\n')
+            first, second = _load_custom_resolver(path), _load_custom_resolver(path)
+            self.assertIsNot(first, second)
+            self.assertIs(type(first), type(second))
+
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+            self.assertIsNot(type(_load_custom_resolver(path)), type(first))
+
+    def test_resolver_files_get_own_modules(self):
+        """Test resolvers from different files do not share a module name."""
+        sample_path = os.path.join(os.path.dirname(__file__), 'sample_custom_resolver.py')
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'sample_custom_resolver.py')
+            shutil.copyfile(sample_path, path)
+            modules = {
+                type(_load_custom_resolver(path)).__module__,
+                type(_load_custom_resolver(sample_path)).__module__,
+            }
+        self.assertEqual(len(modules), 2)
+        self.assertTrue(all(module in sys.modules for module in modules))
+
 
 class TestMockLibraryWithCustomResolver(unittest.TestCase):
     """Tests for MockLibrary with a custom resolver."""
@@ -247,5 +578,75 @@ class TestMockLibraryWithCustomResolver(unittest.TestCase):
         self.assertIs(calls[0], my_side_effect)
 
 
+
+class TestMockLibraryLazyBinding(unittest.TestCase):
+    """Tests for binding the wrapped library on first use."""
+
+    def test_library_is_looked_up_on_first_mock(self):
+        """Test the library is looked up once, when the first keyword is mocked."""
+        sample_lib = SampleLibrary()
+        with patch('MockLibrary._get_library_instance', return_value=sample_lib) as get_instance:
+            mock_lib = MockLibrary("TestLib")
+            get_instance.assert_not_called()
+            mock_lib.mock_keyword("simple_keyword", return_value="mocked")
+            mock_lib.mock_keyword("another_keyword", return_value="mocked")
+            get_instance.assert_called_once_with("TestLib")
+        self.assertEqual(sample_lib.simple_keyword(), "mocked")
+        mock_lib.reset_mocks()
+        self.assertEqual(sample_lib.simple_keyword(), "original")
+
+
+class TestMockLibraryAsync(unittest.TestCase):
+    """Tests for mocking async keywords."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.async_lib = AsyncLibrary()
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.async_lib)
+        self.patcher.start()
+        self.mock_lib = MockLibrary("AsyncLib")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.patcher.stop()
+
+    def test_mocked_async_keyword_returns_awaitable(self):
+        """Test a coroutine keyword is replaced with a mock returning an awaitable."""
+        self.mock_lib.mock_keyword("Fetch", return_value="mocked")
+        awaitable = self.async_lib.fetch("url")
+        self.assertTrue(inspect.isawaitable(awaitable))
+        self.assertEqual(asyncio.run(awaitable), "mocked")
+        self.mock_lib.verify_keyword_called("Fetch", times=1)
+
+        self.mock_lib.reset_mocks()
+        self.assertEqual(asyncio.run(self.async_lib.fetch("url")), "original url")
+
+    def test_async_side_effect_and_delay_keep_concurrency(self):
+        """Test async side effects are awaited and delays do not block other coroutines."""
+        async def side_effect(url):
+            return f"mocked {url}"
+
+        self.mock_lib.mock_keyword("Fetch", side_effect=side_effect, delay=0.1)
+
+        async def fetch_all():
+            start = asyncio.get_running_loop().time()
+            pages = await asyncio.gather(*(self.async_lib.fetch(index) for index in range(10)))
+            return pages, asyncio.get_running_loop().time() - start
+
+        pages, seconds = asyncio.run(fetch_all())
+        self.assertEqual(pages[3], "mocked 3")
+        self.assertLess(seconds, 0.5)
+        self.mock_lib.reset_mocks()
+
+    def test_delay_requires_async_keyword(self):
+        """Test a delay for a synchronous keyword raises ValueError and patches nothing."""
+        sample_lib = SampleLibrary()
+        with patch('MockLibrary._get_library_instance', return_value=sample_lib):
+            mock_lib = MockLibrary("TestLib")
+            with self.assertRaises(ValueError):
+                mock_lib.mock_keyword("simple_keyword", return_value="mocked", delay=1)
+        self.assertEqual(sample_lib.simple_keyword(), "original")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,7 +1,10 @@
 """Unit tests for MockResource."""
 import unittest
 from unittest.mock import Mock, patch
-from MockResource import MockResource
+from robot.running import ResourceFile, UserKeyword
+from robot.running.namespace import Namespace
+from MockLibrary.recorder import CallRecorder
+from MockResource import MockResource, _DISPATCHER, _MockKeywordRunner, _dispatch_key
 
 
 class TestMockResource(unittest.TestCase):
@@ -14,15 +17,13 @@ class TestMockResource(unittest.TestCase):
 
     def tearDown(self):
         """Clean up after tests."""
-        # Manually clear state without calling reset_mocks to avoid Robot context issues
-        self.mock_resource._mocks.clear()  # pylint: disable=protected-access
-        self.mock_resource._original_items.clear()  # pylint: disable=protected-access
+        self.mock_resource.reset_mocks()
 
     def test_init(self):
         """Test initialization stores source and sets up internal state."""
         mock_resource = MockResource("test.robot")
         self.assertEqual(mock_resource._source, "test.robot")  # pylint: disable=protected-access
-        self.assertIsNotNone(mock_resource._original_get_runner)  # pylint: disable=protected-access
+        self.assertFalse(_DISPATCHER.installed)
         self.assertEqual(len(mock_resource._original_items), 0)  # pylint: disable=protected-access
         self.assertEqual(len(mock_resource._mocks), 0)  # pylint: disable=protected-access
 
@@ -31,13 +32,67 @@ class TestMockResource(unittest.TestCase):
         """Test mocking a keyword successfully."""
         keyword_runner = Mock()
         keyword_runner.keyword.source = self.source
+        keyword_runner.keyword.name = "Test Keyword"
         keyword_runner.keyword.body._items = ["original_item"]  # pylint: disable=protected-access
         mock_builtin.return_value._namespace.get_runner.return_value = keyword_runner  # pylint: disable=protected-access
 
         self.mock_resource.mock_keyword("Test Keyword", return_value="mocked")
 
-        self.assertIn("Test Keyword", self.mock_resource._mocks)  # pylint: disable=protected-access
-        self.assertIn("Test Keyword", self.mock_resource._original_items)  # pylint: disable=protected-access
+        self.assertIn("testkeyword", self.mock_resource._mocks)  # pylint: disable=protected-access
+        self.assertIn("testkeyword", self.mock_resource._original_items)  # pylint: disable=protected-access
+
+    @patch('MockResource.BuiltIn')
+    def test_mock_keyword_with_retention(self, mock_builtin):
+        """Test mocking a keyword with counter-only retention."""
+        keyword_runner = Mock()
+        keyword_runner.keyword.source = self.source
+        keyword_runner.keyword.name = "Test Keyword"
+        mock_builtin.return_value._namespace.get_runner.return_value = keyword_runner  # pylint: disable=protected-access
+
+        self.mock_resource.mock_keyword("Test Keyword", return_value="mocked", retention="count")
+
+        mock = self.mock_resource._mocks["testkeyword"]  # pylint: disable=protected-access
+        self.assertIsInstance(mock, CallRecorder)
+        mock(("arg",))
+        self.mock_resource.verify_keyword_called("Test Keyword", times=1)
+
+    @patch('MockResource.BuiltIn')
+    def test_mock_keywords(self, mock_builtin):
+        """Test mocking many keywords using one index of the resource keywords."""
+        resource = ResourceFile(source=self.source)
+        keyword_one = resource.keywords.create("Keyword One")
+        resource.keywords.create("Keyword Two")
+        kw_store = mock_builtin.return_value._namespace._kw_store  # pylint: disable=protected-access
+        kw_store.resources.values.return_value = [resource]
+
+        self.mock_resource.mock_keywords({
+            "Keyword One": {"return_value": "mock1"},
+            "keyword_two": {"return_value": "mock2", "retention": "count"},
+        })
+
+        mock_builtin.return_value._namespace.get_runner.assert_not_called()  # pylint: disable=protected-access
+        self.assertEqual(set(self.mock_resource._mocks), {"keywordone", "keywordtwo"})  # pylint: disable=protected-access
+        self.assertIs(self.mock_resource._original_items["keywordone"].keyword,  # pylint: disable=protected-access
+                      keyword_one)
+        self.assertTrue(_DISPATCHER.installed)
+
+    @patch('MockResource.BuiltIn')
+    def test_mock_keywords_unknown_keyword_mocks_nothing(self, mock_builtin):
+        """Test an unknown keyword in the table leaves every keyword unmocked."""
+        resource = ResourceFile(source=self.source)
+        resource.keywords.create("Keyword One")
+        kw_store = mock_builtin.return_value._namespace._kw_store  # pylint: disable=protected-access
+        kw_store.resources.values.return_value = [resource]
+        mock_builtin.return_value._namespace.get_runner.return_value.keyword.source = "other.robot"  # pylint: disable=protected-access
+
+        with self.assertRaises(AttributeError) as ctx:
+            self.mock_resource.mock_keywords({
+                "Keyword One": {"return_value": "mock1"},
+                "Keyword Three": {"return_value": "mock3"},
+            })
+        self.assertIn("Keyword Three", str(ctx.exception))
+        self.assertEqual(len(self.mock_resource._mocks), 0)  # pylint: disable=protected-access
+        self.assertFalse(_DISPATCHER.installed)
 
     @patch('MockResource.BuiltIn')
     def test_mock_keyword_wrong_source(self, mock_builtin):
@@ -54,6 +109,7 @@ class TestMockResource(unittest.TestCase):
         """Test mocking a keyword with side effect."""
         keyword_runner = Mock()
         keyword_runner.keyword.source = self.source
+        keyword_runner.keyword.name = "Test Keyword"
         keyword_runner.keyword.body._items = ["original_item"]  # pylint: disable=protected-access
         mock_builtin.return_value._namespace.get_runner.return_value = keyword_runner  # pylint: disable=protected-access
 
@@ -62,23 +118,24 @@ class TestMockResource(unittest.TestCase):
 
         self.mock_resource.mock_keyword("Test Keyword", side_effect=side_effect)
 
-        mock = self.mock_resource._mocks["Test Keyword"]  # pylint: disable=protected-access
+        mock = self.mock_resource._mocks["testkeyword"]  # pylint: disable=protected-access
         self.assertEqual(mock.side_effect, side_effect)
 
     @patch('MockResource.BuiltIn')
     def test_reset_mocks(self, mock_builtin):
-        """Test resetting mocks clears state and restores original items."""
+        """Test resetting mocks clears state without looking keywords up again."""
         keyword_runner = Mock()
         keyword_runner.keyword.source = self.source
+        keyword_runner.keyword.name = "Test Keyword"
         keyword_runner.keyword.body._items = ["original_item"]  # pylint: disable=protected-access
         mock_builtin.return_value._namespace.get_runner.return_value = keyword_runner  # pylint: disable=protected-access
 
         self.mock_resource.mock_keyword("Test Keyword", return_value="mocked")
         self.assertEqual(len(self.mock_resource._mocks), 1)  # pylint: disable=protected-access
 
-        # Mock the get_runner call in reset_mocks
-        mock_builtin.return_value._namespace.get_runner.return_value = keyword_runner  # pylint: disable=protected-access
+        mock_builtin.return_value._namespace.get_runner.reset_mock()  # pylint: disable=protected-access
         self.mock_resource.reset_mocks()
+        mock_builtin.return_value._namespace.get_runner.assert_not_called()  # pylint: disable=protected-access
 
         self.assertEqual(len(self.mock_resource._mocks), 0)  # pylint: disable=protected-access
         self.assertEqual(len(self.mock_resource._original_items), 0)  # pylint: disable=protected-access
@@ -87,7 +144,7 @@ class TestMockResource(unittest.TestCase):
     def test_verify_keyword_called(self):
         """Test verifying a keyword was called."""
         mock = Mock()
-        self.mock_resource._mocks["Test Keyword"] = mock  # pylint: disable=protected-access
+        self.mock_resource._mocks["testkeyword"] = mock  # pylint: disable=protected-access
         mock()
 
         self.mock_resource.verify_keyword_called("Test Keyword")
@@ -95,7 +152,7 @@ class TestMockResource(unittest.TestCase):
     def test_verify_keyword_called_with_times(self):
         """Test verifying a keyword was called specific number of times."""
         mock = Mock()
-        self.mock_resource._mocks["Test Keyword"] = mock  # pylint: disable=protected-access
+        self.mock_resource._mocks["testkeyword"] = mock  # pylint: disable=protected-access
         mock()
         mock()
 
@@ -104,13 +161,28 @@ class TestMockResource(unittest.TestCase):
     def test_verify_keyword_called_wrong_times(self):
         """Test verifying with wrong call count raises AssertionError."""
         mock = Mock()
-        self.mock_resource._mocks["Test Keyword"] = mock  # pylint: disable=protected-access
+        self.mock_resource._mocks["testkeyword"] = mock  # pylint: disable=protected-access
         mock()
 
         with self.assertRaises(AssertionError) as ctx:
             self.mock_resource.verify_keyword_called("Test Keyword", times=2)
         self.assertIn("Expected 2 calls, got 1", str(ctx.exception))
 
+    @patch('MockResource.BuiltIn')
+    def test_keyword_name_variants_share_one_mock(self, mock_builtin):
+        """Test case, space and underscore variants of a name refer to the same mock."""
+        keyword_runner = Mock()
+        keyword_runner.keyword.source = self.source
+        keyword_runner.keyword.name = "Test Keyword"
+        mock_builtin.return_value._namespace.get_runner.return_value = keyword_runner  # pylint: disable=protected-access
+
+        self.mock_resource.mock_keyword("Test Keyword", return_value="first")
+        self.mock_resource.mock_keyword("test_keyword", return_value="second")
+        self.assertEqual(len(self.mock_resource._mocks), 1)  # pylint: disable=protected-access
+
+        self.mock_resource._mocks["testkeyword"]()  # pylint: disable=protected-access
+        self.mock_resource.verify_keyword_called("TEST KEYWORD", times=1)
+
     def test_verify_keyword_not_mocked(self):
         """Test verifying a non-mocked keyword raises AssertionError."""
         with self.assertRaises(AssertionError) as ctx:
@@ -120,7 +192,7 @@ class TestMockResource(unittest.TestCase):
     def test_verify_keyword_called_zero_times(self):
         """Test verifying a keyword was called zero times."""
         mock = Mock()
-        self.mock_resource._mocks["Test Keyword"] = mock  # pylint: disable=protected-access
+        self.mock_resource._mocks["testkeyword"] = mock  # pylint: disable=protected-access
 
         self.mock_resource.verify_keyword_called("Test Keyword", times=0)
 
@@ -129,10 +201,12 @@ class TestMockResource(unittest.TestCase):
         """Test mocking multiple keywords."""
         keyword_runner1 = Mock()
         keyword_runner1.keyword.source = self.source
+        keyword_runner1.keyword.name = "Keyword One"
         keyword_runner1.keyword.body._items = ["item1"]  # pylint: disable=protected-access
 
         keyword_runner2 = Mock()
         keyword_runner2.keyword.source = self.source
+        keyword_runner2.keyword.name = "Keyword Two"
         keyword_runner2.keyword.body._items = ["item2"]  # pylint: disable=protected-access
 
         mock_builtin.return_value._namespace.get_runner.side_effect = [  # pylint: disable=protected-access
@@ -143,8 +217,86 @@ class TestMockResource(unittest.TestCase):
         self.mock_resource.mock_keyword("Keyword Two", return_value="mock2")
 
         self.assertEqual(len(self.mock_resource._mocks), 2)  # pylint: disable=protected-access
-        self.assertIn("Keyword One", self.mock_resource._mocks)  # pylint: disable=protected-access
-        self.assertIn("Keyword Two", self.mock_resource._mocks)  # pylint: disable=protected-access
+        self.assertIn("keywordone", self.mock_resource._mocks)  # pylint: disable=protected-access
+        self.assertIn("keywordtwo", self.mock_resource._mocks)  # pylint: disable=protected-access
+
+    @patch('MockResource.BuiltIn')
+    def test_patch_installed_only_while_mocks_are_active(self, mock_builtin):
+        """Test get_runner is patched by the first mock and restored by the last reset."""
+        original_get_runner = Namespace.get_runner
+        keyword_runner = Mock()
+        keyword_runner.keyword.source = self.source
+        keyword_runner.keyword.name = "Test Keyword"
+        mock_builtin.return_value._namespace.get_runner.return_value = keyword_runner  # pylint: disable=protected-access
+        other_resource = MockResource(self.source)
+
+        self.mock_resource.mock_keyword("Test Keyword", return_value="mocked")
+        other_resource.mock_keyword("Test Keyword", return_value="other")
+        patched_get_runner = Namespace.get_runner
+        self.assertIsNot(patched_get_runner, original_get_runner)
+
+        other_resource.reset_mocks()
+        self.assertIs(Namespace.get_runner, patched_get_runner)
+        self.mock_resource.reset_mocks()
+        self.assertIs(Namespace.get_runner, original_get_runner)
+        self.assertFalse(_DISPATCHER.installed)
+
+    @patch('MockResource.BuiltIn')
+    def test_end_test_restores_base_layer(self, mock_builtin):
+        """Test test level mocks are reverted to the suite level mocks at test end."""
+        keyword_runner = Mock()
+        keyword_runner.keyword.source = self.source
+        keyword_runner.keyword.name = "Test Keyword"
+        other_runner = Mock()
+        other_runner.keyword.source = self.source
+        other_runner.keyword.name = "Other Keyword"
+        get_runner = mock_builtin.return_value._namespace.get_runner  # pylint: disable=protected-access
+        listener = self.mock_resource._scopes  # pylint: disable=protected-access
+
+        listener.start_suite(None, None)
+        get_runner.return_value = keyword_runner
+        self.mock_resource.mock_keyword("Test Keyword", return_value="base")
+        base = self.mock_resource._mocks["testkeyword"]  # pylint: disable=protected-access
+        listener.start_test(None, None)
+        self.mock_resource.mock_keyword("Test Keyword", return_value="overlay")
+        get_runner.return_value = other_runner
+        self.mock_resource.mock_keyword("Other Keyword", return_value="overlay")
+        listener.end_test(None, None)
+
+        self.assertIs(_DISPATCHER._table[_dispatch_key(keyword_runner.keyword)], base)  # pylint: disable=protected-access
+        self.assertNotIn(_dispatch_key(other_runner.keyword), _DISPATCHER._table)  # pylint: disable=protected-access
+        self.assertEqual(list(self.mock_resource._mocks), ["testkeyword"])  # pylint: disable=protected-access
+        listener.end_suite(None, None)
+        self.assertFalse(_DISPATCHER.installed)
+
+    @patch('MockResource.StatusReporter')
+    def test_mocked_keyword_runs_without_touching_body(self, _mock_reporter):
+        """Test a mocked keyword returns the mock result and leaves the body alone."""
+        user_keyword = UserKeyword("Test Keyword", args=["${arg}", "&{named}"])
+        user_keyword.body.create_keyword("Log", ["original"])
+        original_runner = Mock(keyword=user_keyword, pre_run_messages=())
+        original_runner.name = "Test Keyword"
+        original_runner._resolve_arguments.return_value = (["arg"], [("named", 1)])  # pylint: disable=protected-access
+        namespace = Mock()
+        namespace.get_runner.return_value = original_runner
+        key = _dispatch_key(user_keyword)
+        mock = Mock(return_value="mocked")
+
+        # Stand-in for the real lookup, which needs a running Robot namespace
+        with patch.object(Namespace, 'get_runner', lambda ns, name, recommend=True:
+                          ns.get_runner(name, recommend)):
+            _DISPATCHER.register(key, mock)
+            try:
+                runner = Namespace.get_runner(namespace, "Test Keyword")
+                result = runner.run(Mock(args=("arg",), assign=()), Mock(), Mock())
+            finally:
+                _DISPATCHER.unregister(key, mock)
+
+        self.assertIsInstance(runner, _MockKeywordRunner)
+        self.assertIs(runner.original, original_runner)
+        self.assertEqual(result, "mocked")
+        mock.assert_called_once_with("arg", named=1)
+        self.assertEqual([item["name"] for item in user_keyword.body.to_dicts()], ["Log"])
 
 
 if __name__ == '__main__':
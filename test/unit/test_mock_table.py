@@ -0,0 +1,130 @@
+"""Unit tests for mock table loading."""
+import json
+import os
+import tempfile
+import unittest
+from MockLibrary.mock_table import (
+    create_mocks, load_mock_table, load_responses, resolve_keywords
+)
+from MockLibrary.recorder import CallRecorder
+
+
+class TestLoadMockTable(unittest.TestCase):
+    """Tests for load_mock_table function."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.directory = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.directory.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+
+    def test_load_dictionary(self):
+        """Test a dictionary table is returned as is."""
+        table = {"Query": {"return_value": [1, 2]}, "Execute Sql": {}}
+        self.assertEqual(load_mock_table(table), table)
+
+    def test_load_json_file(self):
+        """Test loading a table from a JSON file."""
+        table = {"Query": {"return_value": [1, 2], "retention": "count"}}
+        path = self._write("mocks.json", json.dumps(table))
+        self.assertEqual(load_mock_table(path), table)
+
+    def test_load_yaml_file(self):
+        """Test loading a table from a YAML file."""
+        path = self._write("mocks.yaml", "Query:\n  side_effect: [first, second]\n")
+        self.assertEqual(load_mock_table(path), {"Query": {"side_effect": ["first", "second"]}})
+
+    def test_load_nonexistent_file(self):
+        """Test loading a non-existent file raises FileNotFoundError."""
+        with self.assertRaises(FileNotFoundError):
+            load_mock_table(os.path.join(self.directory.name, "missing.json"))
+
+    def test_load_unsupported_file_type(self):
+        """Test loading an unsupported file type raises ValueError."""
+        path = self._write("mocks.txt", "{}")
+        with self.assertRaises(ValueError):
+            load_mock_table(path)
+
+    def test_all_errors_are_reported(self):
+        """Test every malformed specification is reported at once."""
+        table = {
+            "Not A Dict": "value",
+            "Unknown Option": {"retun_value": 1},
+            "String Side Effect": {"side_effect": "abc"},
+            "Bad Retention": {"retention": "forever"},
+            "Bad History": {"history": 0},
+            "Two Sources": {"side_effect": [1], "sequence": "rows.jsonl"},
+            "Bad Exhaustion": {"sequence": "rows.jsonl", "exhaustion": "forever"},
+            "Bad Responses": {"responses": [{"args": "SELECT 1"}]},
+        }
+        with self.assertRaises(ValueError) as ctx:
+            load_mock_table(table)
+        for keyword_name in table:
+            self.assertIn(keyword_name, str(ctx.exception))
+
+    def test_table_must_be_a_dictionary(self):
+        """Test a table that is not a dictionary raises ValueError."""
+        with self.assertRaises(ValueError):
+            load_mock_table([("Query", {})])
+
+    def test_load_responses(self):
+        """Test response tables are read from files and dictionaries are single-argument rows."""
+        rows = [{"args": ["SELECT 1"], "return_value": [[1]]}]
+        path = self._write("responses.json", json.dumps(rows))
+        self.assertEqual(load_responses(path), rows)
+        self.assertEqual(load_responses({"1": "alice"}), [{"args": ["1"], "return_value": "alice"}])
+        table = {"Query": {"responses": path}}
+        self.assertEqual(load_mock_table(table)["Query"]["responses"], rows)
+        self.assertEqual(table["Query"]["responses"], path)
+
+    def test_invalid_responses(self):
+        """Test every malformed row of a response table is reported at once."""
+        with self.assertRaises(ValueError) as ctx:
+            load_responses([{"args": 1}, {"kwargs": {1: 2}}, {"retun_value": 1}, "row"])
+        for number in range(1, 5):
+            self.assertIn(f"row {number}", str(ctx.exception))
+        with self.assertRaises(ValueError):
+            load_responses(1)
+
+
+class TestCreateAndResolve(unittest.TestCase):
+    """Tests for create_mocks and resolve_keywords functions."""
+
+    def test_create_mocks_uses_defaults(self):
+        """Test specifications without options use the given defaults."""
+        mocks = create_mocks(
+            {"Query": {"return_value": 1}, "Get": {"retention": "mock"}}, "count", 10
+        )
+        self.assertIsInstance(mocks["Query"], CallRecorder)
+        self.assertEqual(mocks["Query"](), 1)
+        self.assertNotIsInstance(mocks["Get"], CallRecorder)
+
+    def test_create_mocks_with_responses(self):
+        """Test the return value is the default of a response table."""
+        table = load_mock_table({"Query": {"responses": {"a": 1}, "return_value": 0}})
+        mock = create_mocks(table, "mock", 10)["Query"]
+        self.assertEqual((mock("a"), mock("b")), (1, 0))
+
+    def test_resolve_keywords_reports_all_missing(self):
+        """Test every missing keyword is reported in one error."""
+        def resolve(keyword_name):
+            if keyword_name.startswith("Missing"):
+                raise AttributeError(keyword_name)
+            return keyword_name.lower()
+
+        self.assertEqual(resolve_keywords(["Query"], resolve, "Lib"), {"Query": "query"})
+        with self.assertRaises(AttributeError) as ctx:
+            resolve_keywords(["Query", "Missing One", "Missing Two"], resolve, "Lib")
+        self.assertIn("'Missing One', 'Missing Two'", str(ctx.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
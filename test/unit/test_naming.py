@@ -0,0 +1,24 @@
+"""Unit tests for keyword name normalization."""
+import unittest
+from MockLibrary.naming import normalize_keyword_name
+
+
+class TestNormalizeKeywordName(unittest.TestCase):
+    """Tests for normalize_keyword_name function."""
+
+    def test_case_spaces_and_underscores_are_ignored(self):
+        """Test name variants normalize to the same value."""
+        names = ["My Keyword", "my keyword", "my_keyword", "MyKeyword", "MY_KEY WORD"]
+        self.assertEqual({normalize_keyword_name(name) for name in names}, {"mykeyword"})
+
+    def test_results_are_memoized(self):
+        """Test normalized names are served from a bounded cache."""
+        normalize_keyword_name("Memoized Keyword")
+        hits = normalize_keyword_name.cache_info().hits
+        normalize_keyword_name("Memoized Keyword")
+        self.assertEqual(normalize_keyword_name.cache_info().hits, hits + 1)
+        self.assertIsNotNone(normalize_keyword_name.cache_info().maxsize)
+
+
+if __name__ == '__main__':
+    unittest.main()
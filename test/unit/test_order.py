@@ -0,0 +1,139 @@
+"""Unit tests for the call order shared by all mocks."""
+import unittest
+from unittest.mock import patch
+from MockLibrary import MockLibrary
+from MockLibrary.order import CALL_ORDER, CallOrder, resource_owner
+
+
+class SampleLibrary:
+    """Sample library for testing."""
+
+    def connect(self):
+        """Return original value."""
+        return "connected"
+
+    def query(self, statement):
+        """Return original value."""
+        return f"original {statement}"
+
+
+class TestCallOrder(unittest.TestCase):
+    """Tests for CallOrder class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.order = CallOrder()
+        self.calls = {
+            name: self.order.recorder(owner, name) for owner, name in (
+                ("DB", "Begin"), ("DB", "Commit"), ("DB", "Rollback"), ("Http", "Get"),
+            )
+        }
+
+    def _call(self, *names):
+        for name in names:
+            self.calls[name]()
+
+    def test_verify_order(self):
+        """Test keywords are found in order, with other calls in between."""
+        self._call("Begin", "Get", "Commit", "Begin", "Rollback")
+        self.assertEqual(len(self.order), 5)
+        self.order.verify_order(["Begin", "Commit", "Begin"])
+        self.order.verify_order(["db.begin", "HTTP.Get", "Rollback"])
+        with self.assertRaisesRegex(AssertionError, "'Commit' was not called after 'Rollback'"):
+            self.order.verify_order(["Rollback", "Commit"])
+        with self.assertRaisesRegex(AssertionError, "'Db.Get' was not called"):
+            self.order.verify_order(["Db.Get"])
+
+    def test_verify_not_called_between(self):
+        """Test every window from a start call to the next end call is checked."""
+        self._call("Begin", "Get", "Rollback", "Commit", "Begin", "Begin", "Rollback")
+        self.order.verify_not_called_between("Commit", "Begin", "Rollback")
+        with self.assertRaisesRegex(AssertionError, "'Get' was called between"):
+            self.order.verify_not_called_between("Get", "Begin", "Rollback")
+        with self.assertRaisesRegex(AssertionError, "'Commit' was not followed by 'Get'"):
+            self.order.verify_not_called_between("Begin", "Commit", "Get")
+
+    def test_clear(self):
+        """Test clearing forgets the calls but keeps the keywords."""
+        self._call("Begin", "Commit")
+        self.order.clear()
+        self.assertEqual(len(self.order), 0)
+        with self.assertRaises(AssertionError):
+            self.order.verify_order(["Begin"])
+        self._call("Commit")
+        self.order.verify_order(["Commit"])
+
+    def test_resource_owner(self):
+        """Test resource keywords are qualified with the resource file name."""
+        self.assertEqual(resource_owner("/suites/resources/db.resource"), "db")
+        self.assertEqual(resource_owner(None), "")
+
+
+class TestMockLibraryCallOrder(unittest.TestCase):
+    """Tests for the call order keywords of MockLibrary."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.db_lib, self.http_lib = SampleLibrary(), SampleLibrary()
+        self.patcher = patch(
+            'MockLibrary._get_library_instance',
+            side_effect=lambda name: self.db_lib if name == "DB" else self.http_lib
+        )
+        self.patcher.start()
+        self.mock_db = MockLibrary("DB", record_order=True)
+        self.mock_http = MockLibrary("Http", record_order=True)
+        CALL_ORDER.clear()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.mock_db.reset_mocks()
+        self.mock_http.reset_mocks()
+        self.patcher.stop()
+
+    def test_order_across_libraries(self):
+        """Test calls of mocks of different libraries are ordered together."""
+        self.mock_db.mock_keyword("Connect", return_value="mocked")
+        self.mock_http.mock_keyword("Query", return_value="mocked", retention="count")
+        self.db_lib.connect()
+        self.http_lib.query("GET /")
+        self.mock_http.verify_call_order("DB.Connect", "Http.Query")
+        with self.assertRaises(AssertionError):
+            self.mock_db.verify_call_order("Query", "Connect")
+        self.mock_db.verify_not_called_between("Connect", "Connect", "Query")
+
+    def test_test_start_clears_order(self):
+        """Test a test only sees the calls made since it started."""
+        self.mock_db.mock_keyword("Connect", return_value="mocked")
+        self.db_lib.connect()
+        self.mock_db._scopes.start_test(None, None)  # pylint: disable=protected-access
+        with self.assertRaises(AssertionError):
+            self.mock_db.verify_call_order("Connect")
+        self.mock_db._scopes.end_test(None, None)  # pylint: disable=protected-access
+
+    def test_reset_clears_order(self):
+        """Test Reset Mocks forgets the calls recorded so far."""
+        self.mock_db.mock_keyword("Connect", return_value="mocked")
+        self.db_lib.connect()
+        self.mock_http.reset_mocks()
+        self.assertEqual(len(CALL_ORDER), 0)
+
+    def test_order_not_recorded_by_default(self):
+        """Test calls are not recorded without record_order, and verifying them fails."""
+        mock_lib = MockLibrary("DB")
+        mock_lib.mock_keyword("Connect", return_value="mocked")
+        self.db_lib.connect()
+        self.assertEqual(len(CALL_ORDER), 0)
+        with self.assertRaisesRegex(RuntimeError, "record_order=True"):
+            mock_lib.verify_call_order("Connect")
+        mock_lib.reset_mocks()
+
+    def test_reset_without_record_order_keeps_order(self):
+        """Test Reset Mocks of a library not recording the order keeps the calls of others."""
+        self.mock_db.mock_keyword("Connect", return_value="mocked")
+        self.db_lib.connect()
+        MockLibrary("Http").reset_mocks()
+        self.mock_db.verify_call_order("Connect")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+"""Unit tests for call recorders."""
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import DEFAULT, Mock
+from MockLibrary.recorder import CallCounter, CallRecorder, CountingMock, create_mock
+
+
+class TestCallRecorder(unittest.TestCase):
+    """Tests for CallRecorder class."""
+
+    def test_return_value(self):
+        """Test the recorder returns its return value."""
+        recorder = CallRecorder(return_value="mocked")
+        self.assertEqual(recorder("arg"), "mocked")
+        self.assertEqual(recorder.call_count, 1)
+
+    def test_callable_side_effect(self):
+        """Test a callable side effect receives the call arguments."""
+        recorder = CallRecorder(side_effect=lambda arg, key=None: f"{arg}-{key}")
+        self.assertEqual(recorder("a", key="b"), "a-b")
+
+    def test_side_effect_returning_default(self):
+        """Test a side effect returning DEFAULT falls back to the return value."""
+        recorder = CallRecorder(return_value="default", side_effect=lambda: DEFAULT)
+        self.assertEqual(recorder(), "default")
+
+    def test_exception_side_effect(self):
+        """Test an exception side effect is raised."""
+        recorder = CallRecorder(side_effect=ValueError("boom"))
+        with self.assertRaises(ValueError):
+            recorder()
+        self.assertEqual(recorder.call_count, 1)
+
+    def test_iterable_side_effect(self):
+        """Test an iterable side effect is consumed one item per call."""
+        recorder = CallRecorder(side_effect=["first", KeyError, "third"])
+        self.assertEqual(recorder(), "first")
+        with self.assertRaises(KeyError):
+            recorder()
+        self.assertEqual(recorder(), "third")
+        with self.assertRaises(StopIteration):
+            recorder()
+
+    def test_count_retention_keeps_no_arguments(self):
+        """Test count retention only counts calls."""
+        recorder = CallRecorder(retention='count')
+        for index in range(100):
+            recorder(index)
+        self.assertEqual(recorder.call_count, 100)
+        self.assertEqual(recorder.call_args_list, [])
+        self.assertIsNone(recorder.call_args)
+
+    def test_last_retention_is_a_ring_buffer(self):
+        """Test last retention keeps only the newest calls."""
+        recorder = CallRecorder(retention='last', history=3)
+        for index in range(10):
+            recorder(index)
+        self.assertEqual(recorder.call_count, 10)
+        self.assertEqual(recorder.call_args_list, [((7,), {}), ((8,), {}), ((9,), {})])
+        self.assertEqual(recorder.call_args, ((9,), {}))
+
+    def test_full_retention_keeps_every_call(self):
+        """Test full retention keeps every call."""
+        recorder = CallRecorder(retention='full')
+        for index in range(10):
+            recorder(index, key=index)
+        self.assertEqual(len(recorder.call_args_list), 10)
+        self.assertEqual(recorder.call_args_list[0], ((0,), {'key': 0}))
+
+    def test_reset_mock(self):
+        """Test reset_mock forgets recorded calls."""
+        recorder = CallRecorder(retention='full')
+        recorder()
+        recorder.reset_mock()
+        self.assertEqual(recorder.call_count, 0)
+        self.assertFalse(recorder.called)
+        self.assertEqual(recorder.call_args_list, [])
+
+    def test_recorder_has_no_instance_dict(self):
+        """Test the recorder uses __slots__."""
+        self.assertFalse(hasattr(CallRecorder(), '__dict__'))
+
+
+class TestCreateMock(unittest.TestCase):
+    """Tests for create_mock function."""
+
+    def test_default_creates_mock(self):
+        """Test the default retention creates a unittest.mock.Mock."""
+        mock = create_mock(return_value="mocked")
+        self.assertIsInstance(mock, Mock)
+        self.assertEqual(mock(), "mocked")
+
+    def test_retention_creates_recorder(self):
+        """Test other retention modes create a CallRecorder."""
+        for retention in ('count', 'LAST', 'full'):
+            self.assertIsInstance(create_mock(retention=retention), CallRecorder)
+
+    def test_invalid_retention(self):
+        """Test an unsupported retention mode raises ValueError."""
+        with self.assertRaises(ValueError) as ctx:
+            create_mock(retention='forever')
+        self.assertIn("forever", str(ctx.exception))
+
+
+class TestCountingMock(unittest.TestCase):
+    """Tests for CallCounter and CountingMock classes."""
+
+    def test_counter_merges_threads(self):
+        """Test calls counted by many threads are all included in the value."""
+        counter = CallCounter()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for _ in range(8):
+                executor.submit(lambda: [counter.increment() for _ in range(1000)])
+        self.assertEqual(counter.value, 8000)
+        counter.reset()
+        self.assertEqual(counter.value, 0)
+
+    def test_counting_mock_delegates_to_mock(self):
+        """Test calls are counted and forwarded to the wrapped mock."""
+        mock = Mock(return_value="mocked")
+        counting_mock = CountingMock(mock)
+        self.assertEqual(counting_mock("arg", key="value"), "mocked")
+        self.assertEqual(counting_mock.call_count, 1)
+        self.assertTrue(counting_mock.called)
+        self.assertEqual(counting_mock.call_args, (("arg",), {"key": "value"}))
+
+    def test_counting_mock_reset(self):
+        """Test resetting clears both the counter and the wrapped mock."""
+        counting_mock = CountingMock(CallRecorder(retention="full"))
+        counting_mock()
+        counting_mock.reset_mock()
+        self.assertEqual(counting_mock.call_count, 0)
+        self.assertEqual(counting_mock.call_args_list, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
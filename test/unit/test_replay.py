@@ -0,0 +1,140 @@
+"""Unit tests for recording and replaying keyword results."""
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from MockLibrary import MockLibrary
+from MockLibrary.replay import INDEX_FILE, ReplayCache, ReplayingCall, cache_key
+
+
+class SampleLibrary:  # pylint: disable=too-few-public-methods
+    """Sample library for testing."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def query(self, statement, timeout=None):
+        """Return original value."""
+        self.calls += 1
+        return [(statement, timeout)]
+
+
+class TestReplayCache(unittest.TestCase):
+    """Tests for ReplayCache class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.tmpdir.cleanup()
+
+    def _segments(self):
+        return [name for name in os.listdir(self.tmpdir.name) if name.startswith("segment-")]
+
+    def test_results_are_written_in_bulk(self):
+        """Test pending results are written to one segment and read by a new cache."""
+        cache = ReplayCache(self.tmpdir.name)
+        for index in range(3):
+            self.assertTrue(cache.put(f"key{index}", {"rows": [index]}))
+        self.assertEqual(cache.get("key1"), (True, {"rows": [1]}))
+        self.assertEqual(self._segments(), [])
+        cache.flush()
+        self.assertEqual(len(self._segments()), 1)
+
+        with open(os.path.join(self.tmpdir.name, INDEX_FILE), encoding='utf-8') as file:
+            self.assertEqual(len(json.load(file)["entries"]), 3)
+        reopened = ReplayCache(self.tmpdir.name)
+        self.assertEqual(len(reopened), 3)
+        self.assertEqual(reopened.get("key2"), (True, {"rows": [2]}))
+        self.assertEqual(reopened.get("missing"), (False, None))
+
+    def test_unpicklable_results_are_not_recorded(self):
+        """Test results that cannot be pickled are skipped."""
+        cache = ReplayCache(self.tmpdir.name)
+        self.assertFalse(cache.put("lock", threading.Lock()))
+        self.assertEqual(len(cache), 0)
+
+    def test_max_age(self):
+        """Test old results are not replayed and evicted when written."""
+        cache = ReplayCache(self.tmpdir.name)
+        with patch('MockLibrary.replay.time.time', return_value=1000.0):
+            cache.put("old", "old result")
+            cache.flush()
+        self.assertEqual(cache.get("old", max_age=60), (False, None))
+        self.assertEqual(cache.get("old"), (True, "old result"))
+        cache.set_limits(max_age=60)
+        cache.put("new", "new result")
+        cache.flush()
+        self.assertEqual(cache.get("old"), (False, None))
+        self.assertEqual(len(self._segments()), 1)
+
+    def test_max_size_evicts_oldest_and_compacts(self):
+        """Test the oldest results are evicted above the size limit and segments compacted."""
+        cache = ReplayCache(self.tmpdir.name)
+        for index in range(4):
+            with patch('MockLibrary.replay.time.time', return_value=float(index)):
+                cache.put(f"key{index}", "x" * 100)
+                cache.flush()
+        self.assertEqual(len(self._segments()), 4)
+        cache.set_limits(max_size=250)
+        cache.flush()
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get("key0"), (False, None))
+        self.assertEqual(cache.get("key3"), (True, "x" * 100))
+        self.assertEqual(len(self._segments()), 2)
+
+    def test_cache_key_is_canonical(self):
+        """Test keys ignore the keyword name format and the order of named arguments."""
+        self.assertEqual(
+            cache_key("DB", "Execute Sql", ("a",), {"x": 1, "y": 2}),
+            cache_key("DB", "execute_sql", ["a"], {"y": 2, "x": 1})
+        )
+        self.assertNotEqual(cache_key("DB", "Query", (1,), {}), cache_key("DB", "Query", (2,), {}))
+
+    def test_invalid_miss_policy(self):
+        """Test an unknown miss policy raises ValueError."""
+        with self.assertRaises(ValueError):
+            ReplayingCall(len, ReplayCache(self.tmpdir.name), "DB", "Query", on_miss="ignore")
+
+
+class TestMockLibraryReplay(unittest.TestCase):
+    """Tests for the Record Keyword and Replay Keyword keywords of MockLibrary."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.sample_lib = SampleLibrary()
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.sample_lib)
+        self.patcher.start()
+        self.mock_lib = MockLibrary("DB")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.mock_lib.reset_mocks()
+        self.patcher.stop()
+        self.tmpdir.cleanup()
+
+    def test_record_and_replay(self):
+        """Test recorded results are replayed without calling the real keyword."""
+        self.mock_lib.record_keyword("Query", self.tmpdir.name)
+        recorded = self.sample_lib.query("SELECT 1", timeout=5)
+        self.assertEqual(self.sample_lib.calls, 1)
+        self.mock_lib.verify_keyword_called("Query", times=1)
+
+        self.mock_lib.replay_keyword("Query", self.tmpdir.name)
+        self.assertEqual(self.sample_lib.query("SELECT 1", timeout=5), recorded)
+        self.assertEqual(self.sample_lib.calls, 1)
+        with self.assertRaises(AssertionError):
+            self.sample_lib.query("SELECT 2")
+
+        self.mock_lib.replay_keyword("Query", self.tmpdir.name, on_miss="call")
+        self.assertEqual(self.sample_lib.query("SELECT 2"), [("SELECT 2", None)])
+        self.assertEqual(self.sample_lib.calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""Unit tests for response tables."""
+import unittest
+from unittest.mock import ANY, patch
+from MockLibrary import MockLibrary
+from MockLibrary.responses import ResponseTable
+
+
+class SampleLibrary:  # pylint: disable=too-few-public-methods
+    """Sample library for testing."""
+
+    def get_user(self, user_id):
+        """Return original value."""
+        return f"original {user_id}"
+
+
+class TestResponseTable(unittest.TestCase):
+    """Tests for ResponseTable class."""
+
+    def test_exact_match(self):
+        """Test calls return the response of the row with equal arguments."""
+        table = ResponseTable([
+            {"args": ["SELECT 1"], "return_value": [[1]]},
+            {"args": ["SELECT 2"], "kwargs": {"timeout": 5}, "return_value": [[2]]},
+        ])
+        self.assertEqual(table("SELECT 1"), [[1]])
+        self.assertEqual(table("SELECT 2", timeout=5), [[2]])
+        self.assertIsNone(table("SELECT 2"))
+        self.assertEqual(len(table), 2)
+
+    def test_wildcards_and_default(self):
+        """Test rows with fewer wildcards win and unmatched calls return the default."""
+        table = ResponseTable([
+            {"args": ["*", "*"], "return_value": "any"},
+            {"args": ["users", "*"], "return_value": "users"},
+            {"args": ["users", 1], "return_value": "alice"},
+            {"args": [ANY], "kwargs": {"limit": "*"}, "return_value": "limited"},
+        ], default="none")
+        self.assertEqual(table("users", 1), "alice")
+        self.assertEqual(table("users", 2), "users")
+        self.assertEqual(table("groups", 2), "any")
+        self.assertEqual(table("groups", limit=10), "limited")
+        self.assertEqual(table("groups"), "none")
+
+    def test_first_row_wins(self):
+        """Test the earlier of two rows with the same arguments is used."""
+        table = ResponseTable([
+            {"args": [1], "return_value": "first"},
+            {"args": [1], "return_value": "second"},
+        ])
+        self.assertEqual(table(1), "first")
+
+    def test_lists_and_dictionaries_compare_by_value(self):
+        """Test unhashable argument values are matched by their content."""
+        table = ResponseTable([
+            {"args": [[1, 2], {"name": "alice"}], "return_value": "match"},
+        ])
+        self.assertEqual(table((1, 2), {"name": "alice"}), "match")
+        self.assertIsNone(table([1, 2], {"name": "bob"}))
+        self.assertIsNone(table(bytearray(b"unhashable"), {}))
+
+    def test_unhashable_row(self):
+        """Test rows with arguments that cannot be indexed are rejected."""
+        with self.assertRaises(ValueError):
+            ResponseTable([{"args": [bytearray(b"unhashable")], "return_value": 1}])
+
+    def test_many_rows(self):
+        """Test a table with many rows answers every call."""
+        table = ResponseTable(
+            [{"args": [index, "*"], "return_value": index * 2} for index in range(10000)]
+        )
+        self.assertEqual([table(index, "x") for index in (0, 5000, 9999)], [0, 10000, 19998])
+
+
+class TestMockLibraryResponses(unittest.TestCase):
+    """Tests for the Mock Keyword With Arguments keyword of MockLibrary."""
+
+    def test_mock_keyword_with_arguments(self):
+        """Test mocking a keyword with a return value per argument."""
+        sample_lib = SampleLibrary()
+        with patch('MockLibrary._get_library_instance', return_value=sample_lib):
+            mock_lib = MockLibrary("Users")
+            mock_lib.mock_keyword_with_arguments("Get User", {"1": "alice"}, default="nobody")
+        self.assertEqual(sample_lib.get_user("1"), "alice")
+        self.assertEqual(sample_lib.get_user("2"), "nobody")
+        mock_lib.verify_keyword_called("Get User", times=2)
+        mock_lib.reset_mocks()
+        self.assertEqual(sample_lib.get_user("1"), "original 1")
+
+
+if __name__ == '__main__':
+    unittest.main()
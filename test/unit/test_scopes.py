@@ -0,0 +1,72 @@
+"""Unit tests for the mock scoping listener."""
+import unittest
+from unittest.mock import Mock
+from MockLibrary.scopes import MockScopes
+
+
+class TestMockScopes(unittest.TestCase):
+    """Tests for MockScopes listener."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mocks = {}
+        self.restore = Mock()
+        self.scopes = MockScopes(self.mocks, self.restore)
+
+    def test_record_outside_scope_is_ignored(self):
+        """Test changes made before any suite starts are not restored."""
+        self.scopes.record("keyword", None)
+        self.scopes.end_test(None, None)
+        self.restore.assert_not_called()
+
+    def test_end_test_restores_only_touched_keywords(self):
+        """Test only keywords changed in the test are restored, to their first state."""
+        base = Mock(call_count=0)
+        self.scopes.start_suite(None, None)
+        self.scopes.record("base", None)
+        self.scopes.start_test(None, None)
+        self.scopes.record("base", base)
+        self.scopes.record("base", Mock())
+        self.scopes.record("overlay", None)
+        self.scopes.end_test(None, None)
+        self.assertEqual(
+            self.restore.call_args_list, [(("base", base),), (("overlay", None),)]
+        )
+
+        self.restore.reset_mock()
+        self.scopes.end_suite(None, None)
+        self.restore.assert_called_once_with("base", None)
+
+    def test_changes_while_restoring_are_not_recorded(self):
+        """Test re-installing a base mock does not record into the enclosing scope."""
+        self.restore.side_effect = self.scopes.record
+        self.scopes.start_suite(None, None)
+        self.scopes.start_test(None, None)
+        self.scopes.record("keyword", Mock())
+        self.scopes.end_test(None, None)
+
+        self.restore.reset_mock()
+        self.scopes.end_suite(None, None)
+        self.restore.assert_not_called()
+
+    def test_start_test_clears_call_history_of_called_mocks(self):
+        """Test base mocks only count the calls of the running test."""
+        called, not_called = Mock(), Mock()
+        called()
+        not_called.reset_mock = Mock()
+        self.mocks.update(called=called, not_called=not_called)
+        self.scopes.start_test(None, None)
+        self.assertEqual(called.call_count, 0)
+        not_called.reset_mock.assert_not_called()
+
+    def test_clear_forgets_recorded_changes(self):
+        """Test nothing is restored after all mocks were reset."""
+        self.scopes.start_test(None, None)
+        self.scopes.record("keyword", None)
+        self.scopes.clear()
+        self.scopes.end_test(None, None)
+        self.restore.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
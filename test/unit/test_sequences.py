@@ -0,0 +1,99 @@
+"""Unit tests for lazily consumed sequences."""
+import os
+import tempfile
+import tracemalloc
+import unittest
+from MockLibrary.recorder import create_mock
+from MockLibrary.sequences import SequenceSource
+
+
+class TestSequenceSource(unittest.TestCase):
+    """Tests for SequenceSource class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tmpdir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.tmpdir.cleanup()
+
+    def _write(self, name, content):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(content)
+        return path
+
+    def test_generator_factory_raises_when_exhausted(self):
+        """Test values of a generator are returned one per call."""
+        source = SequenceSource(lambda: iter(range(2)))
+        self.assertEqual([source(), source()], [0, 1])
+        with self.assertRaises(StopIteration):
+            source()
+
+    def test_repeat_last(self):
+        """Test the last value is returned again once the sequence is exhausted."""
+        source = SequenceSource(lambda: iter("ab"), exhaustion="repeat_last")
+        self.assertEqual([source() for _ in range(4)], ["a", "b", "b", "b"])
+
+    def test_cycle(self):
+        """Test the sequence starts over once it is exhausted."""
+        source = SequenceSource(lambda: iter("ab"), exhaustion="cycle")
+        self.assertEqual([source() for _ in range(5)], ["a", "b", "a", "b", "a"])
+
+    def test_empty_sequence_raises(self):
+        """Test an empty sequence raises in every exhaustion mode."""
+        for exhaustion in ("raise", "repeat_last", "cycle"):
+            with self.assertRaises(StopIteration):
+                SequenceSource(lambda: iter(()), exhaustion=exhaustion)()
+
+    def test_jsonl_file_is_read_per_call(self):
+        """Test a JSON Lines file is parsed one line per call."""
+        path = self._write("pages.jsonl", '{"page": 1}\n\n{"page": 2}\n')
+        source = SequenceSource(path, exhaustion="cycle")
+        self.assertEqual([source()["page"] for _ in range(3)], [1, 2, 1])
+
+    def test_csv_file_is_read_per_call(self):
+        """Test a CSV file returns one row tuple per call."""
+        path = self._write("rows.txt", "1,alice\n2,bob\n")
+        source = SequenceSource(path, file_format="csv")
+        self.assertEqual(source(), ("1", "alice"))
+
+    def test_long_sequence_uses_constant_memory(self):
+        """Test consuming a long file does not keep its values in memory."""
+        path = self._write("rows.jsonl", "".join(f'{{"id": {i}}}\n' for i in range(20000)))
+        source = SequenceSource(path)
+        tracemalloc.start()
+        try:
+            for _ in range(1000):
+                source()
+            baseline = tracemalloc.get_traced_memory()[0]
+            for _ in range(19000):
+                source()
+            growth = tracemalloc.get_traced_memory()[0] - baseline
+        finally:
+            tracemalloc.stop()
+        self.assertLess(growth, 64 * 1024)
+
+    def test_invalid_arguments(self):
+        """Test unknown exhaustion modes, formats and missing files are rejected."""
+        path = self._write("rows.bin", "")
+        with self.assertRaises(ValueError):
+            SequenceSource(lambda: iter(()), exhaustion="forever")
+        with self.assertRaises(ValueError):
+            SequenceSource(path)
+        with self.assertRaises(FileNotFoundError):
+            SequenceSource(os.path.join(self.tmpdir.name, "missing.jsonl"))
+
+    def test_create_mock_with_sequence(self):
+        """Test mocks created with a sequence return its values and reject other sources."""
+        for retention in ("mock", "count"):
+            mock = create_mock(sequence=lambda: iter([1, 2]), retention=retention)
+            self.assertEqual([mock(), mock()], [1, 2])
+            self.assertEqual(mock.call_count, 2)
+        with self.assertRaises(ValueError):
+            create_mock(side_effect=len, sequence=lambda: iter(()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+"""Unit tests for saving and loading mock state snapshots."""
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+from MockLibrary import MockLibrary
+from MockLibrary.snapshot import check_locations, load_snapshot, mock_spec, save_snapshot
+
+
+class SampleLibrary:
+    """Sample library for testing."""
+
+    def get_user(self, user_id):
+        """Return original value."""
+        return f"user {user_id}"
+
+    def query(self, statement):
+        """Return original value."""
+        return f"rows of {statement}"
+
+
+class OtherLibrary(SampleLibrary):
+    """Sample library of another class."""
+
+
+class TestSnapshotFile(unittest.TestCase):
+    """Tests for snapshot file functions."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "mocks.snapshot")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        """Test keywords are read back for the kind and target they were saved for."""
+        keywords = {"Query": {"location": "query", "spec": {"return_value": [1]}, "delay": None}}
+        self.assertEqual(save_snapshot(self.path, "library", "db.Lib", keywords), self.path)
+        self.assertEqual(load_snapshot(self.path, "library", "db.Lib"), keywords)
+        with self.assertRaisesRegex(ValueError, "saved for library db.Lib, not for resource"):
+            load_snapshot(self.path, "resource", "db.Lib")
+        with self.assertRaises(FileNotFoundError):
+            load_snapshot(self.path + ".missing", "library", "db.Lib")
+
+    def test_unpicklable_spec(self):
+        """Test side effects that cannot be pickled are reported."""
+        keywords = {"Query": {"location": "query", "spec": {"side_effect": lambda: 1}}}
+        with self.assertRaisesRegex(ValueError, "cannot be saved"):
+            save_snapshot(self.path, "library", "db.Lib", keywords)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_mock_spec_and_locations(self):
+        """Test defaults are left out, files made absolute and moved keywords reported."""
+        spec = mock_spec(return_value=None, sequence="rows.jsonl", exhaustion="raise")
+        self.assertEqual(spec, {"sequence": os.path.abspath("rows.jsonl")})
+        keywords = {"Query": {"location": "query"}}
+        check_locations(keywords, {"Query": "query"}, self.path)
+        with self.assertRaisesRegex(ValueError, "'Query': saved for query, resolves to run_query"):
+            check_locations(keywords, {"Query": "run_query"}, self.path)
+
+
+class TestMockLibrarySnapshot(unittest.TestCase):
+    """Tests for the Save Mock State and Load Mock State keywords of MockLibrary."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "mocks.snapshot")
+        self.lib = SampleLibrary()
+        self.mock_lib = MockLibrary("DB")
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.lib)
+        self.patcher.start()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.mock_lib.reset_mocks()
+        self.patcher.stop()
+        shutil.rmtree(self.directory)
+
+    def _save(self):
+        self.mock_lib.mock_keyword("Get User", return_value="mocked")
+        self.mock_lib.mock_keyword_with_arguments("Query", {"users": [1, 2]}, default=[])
+        self.mock_lib.save_mock_state(self.path)
+        self.mock_lib.reset_mocks()
+
+    def test_save_and_load(self):
+        """Test loaded mocks behave like the saved ones."""
+        self._save()
+        created = self.mock_lib.load_mock_state(self.path)
+        self.assertEqual(sorted(created), ["Get User", "Query"])
+        self.assertEqual(self.lib.get_user(1), "mocked")
+        self.assertEqual((self.lib.query("users"), self.lib.query("other")), ([1, 2], []))
+        self.mock_lib.verify_keyword_called("Query", times=2)
+
+    def test_response_table_is_saved_indexed(self):
+        """Test response tables of a mock table are loaded without their rows."""
+        self.mock_lib.mock_keywords({"Query": {"responses": {"users": [1]}, "return_value": []}})
+        self.mock_lib.save_mock_state(self.path)
+        self.mock_lib.reset_mocks()
+        spec = load_snapshot(self.path, "library", f"{__name__}.SampleLibrary")["Query"]["spec"]
+        self.assertEqual(sorted(spec), ["side_effect"])
+        self.mock_lib.load_mock_state(self.path)
+        self.assertEqual((self.lib.query("users"), self.lib.query("other")), ([1], []))
+
+    def test_save_timed_mocks(self):
+        """Test mocks timed for statistics are saved, also again after loading them."""
+        mock_lib = MockLibrary("DB", statistics=True)
+        mock_lib.mock_keywords({"Query": {"responses": {"users": [1]}, "return_value": []}})
+        mock_lib.save_mock_state(self.path)
+        mock_lib.reset_mocks()
+        mock_lib.load_mock_state(self.path)
+        mock_lib.save_mock_state(self.path)
+        mock_lib.reset_mocks()
+        mock_lib.load_mock_state(self.path)
+        self.assertEqual((self.lib.query("users"), self.lib.query("other")), ([1], []))
+        mock_lib.reset_mocks()
+
+    def test_other_library_class(self):
+        """Test a snapshot is only loaded into a library of the class it was saved for."""
+        self._save()
+        lib = OtherLibrary()
+        with patch('MockLibrary._get_library_instance', return_value=lib):
+            with self.assertRaisesRegex(ValueError, "was saved for library"):
+                MockLibrary("DB").load_mock_state(self.path)
+        self.assertEqual(lib.get_user(1), "user 1")
+
+    def test_stale_snapshot_mocks_nothing(self):
+        """Test a keyword resolving to another method fails before anything is mocked."""
+        spec = {"spec": {"return_value": "mocked"}, "delay": None}
+        save_snapshot(self.path, "library", f"{__name__}.SampleLibrary", {
+            "Get User": {"location": "get_user", **spec},
+            "Query": {"location": "old_query", **spec},
+        })
+        with self.assertRaisesRegex(ValueError, "'Query': saved for old_query, resolves to query"):
+            self.mock_lib.load_mock_state(self.path)
+        self.assertEqual(self.lib.get_user(1), "user 1")
+
+    def test_mocks_not_created_from_values(self):
+        """Test cached keywords cannot be saved."""
+        self.mock_lib.cache_keyword("Get User")
+        with self.assertRaisesRegex(ValueError, "'getuser' were not created from values"):
+            self.mock_lib.save_mock_state(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
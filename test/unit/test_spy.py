@@ -0,0 +1,112 @@
+"""Unit tests for spied keywords."""
+import asyncio
+import unittest
+from unittest.mock import patch
+from MockLibrary import MockLibrary
+from MockLibrary.spy import KeywordSpy, get_spy_calls
+
+
+class SampleLibrary:
+    """Sample library for testing."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def execute_query(self, statement, params=None):
+        """Run the query and count it."""
+        self.calls += 1
+        if statement == "fail":
+            raise RuntimeError("query failed")
+        return f"{statement} {params}"
+
+    async def fetch(self, url):
+        """Return original value."""
+        return f"page {url}"
+
+
+class TestKeywordSpy(unittest.TestCase):
+    """Tests for KeywordSpy class."""
+
+    def test_calls_are_kept_by_reference(self):
+        """Test arguments are recorded without copies and only the last calls are kept."""
+        spy = KeywordSpy(lambda *args, **kwargs: len(args), history=2)
+        params = {"id": 1}
+        for index in range(3):
+            self.assertEqual(spy(index, params=params), 1)
+        calls = spy.calls()
+        self.assertEqual([call["args"] for call in calls], [[1], [2]])
+        self.assertIs(calls[-1]["kwargs"]["params"], params)
+        self.assertTrue(all(call["duration_ns"] >= 0 for call in calls))
+
+    def test_failing_and_async_calls_are_recorded(self):
+        """Test calls raising an exception and awaited calls are recorded too."""
+        lib = SampleLibrary()
+        spy = KeywordSpy(lib.execute_query)
+        with self.assertRaises(RuntimeError):
+            spy("fail")
+        async_spy = KeywordSpy(lib.fetch)
+        coroutine = async_spy("/")
+        self.assertEqual(async_spy.calls(), [])
+        self.assertEqual(asyncio.run(coroutine), "page /")
+        self.assertEqual([spy.calls()[0]["args"], async_spy.calls()[0]["args"]], [["fail"], ["/"]])
+
+    def test_history_must_be_positive(self):
+        """Test a spy must keep at least one call."""
+        with self.assertRaises(ValueError):
+            KeywordSpy(len, history=0)
+
+
+class TestMockLibrarySpy(unittest.TestCase):
+    """Tests for the Spy Keyword keyword of MockLibrary."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sample_lib = SampleLibrary()
+        self.mock_lib = MockLibrary("DB")
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.sample_lib)
+        self.patcher.start()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.mock_lib.reset_mocks()
+        self.patcher.stop()
+
+    def test_spy_keyword(self):
+        """Test the original keyword keeps running and its calls can be verified."""
+        self.mock_lib.spy_keyword("Execute Query", spy_history=5)
+        self.assertEqual(self.sample_lib.execute_query("SELECT 1", params=[1]), "SELECT 1 [1]")
+        self.assertEqual(self.sample_lib.calls, 1)
+        self.mock_lib.verify_keyword_called("Execute Query", times=1)
+        calls = self.mock_lib.get_spy_calls("Execute Query")
+        self.assertEqual((calls[0]["args"], calls[0]["kwargs"]), (["SELECT 1"], {"params": [1]}))
+
+        self.mock_lib.reset_mocks()
+        self.assertNotIn("execute_query", vars(self.sample_lib))
+        with self.assertRaises(AssertionError):
+            self.mock_lib.get_spy_calls("Execute Query")
+
+    def test_spy_async_keyword(self):
+        """Test a spied async keyword returns the awaited result of the original."""
+        self.mock_lib.spy_keyword("Fetch")
+        self.assertEqual(asyncio.run(self.sample_lib.fetch("/")), "page /")
+        self.assertEqual(len(self.mock_lib.get_spy_calls("Fetch")), 1)
+
+    def test_spy_and_mock_history_are_separate(self):
+        """Test the spy keeps spy_history calls and the mock its own history."""
+        mock = self.mock_lib.spy_keyword(
+            "Execute Query", spy_history=3, retention="last", history=1
+        )
+        for index in range(4):
+            self.sample_lib.execute_query(f"SELECT {index}")
+        self.assertEqual(len(self.mock_lib.get_spy_calls("Execute Query")), 3)
+        self.assertEqual(mock.call_args_list, [(("SELECT 3",), {})])
+
+    def test_mocked_keyword_is_not_spied(self):
+        """Test spy calls of a keyword mocked without Spy Keyword fails."""
+        mock = self.mock_lib.mock_keyword("Execute Query", return_value="rows")
+        with self.assertRaisesRegex(AssertionError, "'Execute Query' is not spied"):
+            get_spy_calls(mock, "Execute Query")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""Unit tests for mock call statistics."""
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock, patch
+from MockLibrary import MockLibrary
+from MockLibrary.stats import (
+    KeywordStatistics, LatencyHistogram, MockStatistics, TimedMock, create_statistics
+)
+
+
+class SampleLibrary:  # pylint: disable=too-few-public-methods
+    """Sample library for testing."""
+
+    def query(self, statement):
+        """Return original value."""
+        return f"original {statement}"
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    """Tests for LatencyHistogram class."""
+
+    def test_percentiles(self):
+        """Test percentiles are estimated within the bucket precision."""
+        histogram = LatencyHistogram()
+        for duration in range(1, 1001):
+            histogram.record(duration * 1000)
+        self.assertEqual(histogram.count, 1000)
+        self.assertEqual(histogram.max_ns, 1000000)
+        self.assertAlmostEqual(histogram.percentile(50), 500000, delta=500000 * 0.125)
+        self.assertAlmostEqual(histogram.percentile(99), 990000, delta=990000 * 0.125)
+        self.assertEqual(histogram.summary()["mean_ns"], 500500)
+
+    def test_small_values_are_exact(self):
+        """Test durations below eight nanoseconds have their own buckets."""
+        histogram = LatencyHistogram()
+        for duration in (0, 3, 7):
+            histogram.record(duration)
+        self.assertEqual(histogram.percentile(50), 3)
+
+    def test_empty_and_merge(self):
+        """Test an empty histogram and merging two histograms."""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        self.assertEqual(first.summary()["p99_ns"], 0)
+        first.record(100)
+        second.record(200)
+        first.merge(second)
+        self.assertEqual((first.count, first.total_ns, first.max_ns), (2, 300, 200))
+
+
+class TestMockStatistics(unittest.TestCase):
+    """Tests for MockStatistics class."""
+
+    def test_keyword_statistics_split_dispatch_and_side_effect(self):
+        """Test the dispatch overhead is the time outside the side effect."""
+        stats = KeywordStatistics("Query")
+        stats.record(1000, 600)
+        summary = stats.summary()
+        self.assertEqual(summary["calls"], 1)
+        self.assertEqual(summary["dispatch"]["max_ns"], 400)
+        self.assertEqual(summary["side_effect"]["max_ns"], 600)
+
+    def test_timed_mock_records_side_effect_time(self):
+        """Test a timed mock records its calls and the time of its side effect."""
+        statistics = MockStatistics("DB")
+        mock = Mock(side_effect=lambda: time.sleep(0.01))
+        timed = statistics.timed("Query", mock)
+        self.assertIsInstance(timed, TimedMock)
+        timed()
+        summary = statistics.summary("query")
+        self.assertEqual(summary["calls"], 1)
+        self.assertGreaterEqual(summary["side_effect"]["max_ns"], 10000000)
+        self.assertLess(summary["dispatch"]["max_ns"], summary["latency"]["max_ns"])
+        self.assertEqual(timed.call_count, 1)
+        with self.assertRaises(AssertionError):
+            statistics.summary("Execute Sql")
+
+    def test_suites_collect_separately_and_report(self):
+        """Test suite statistics are added to the parent suite and written to the report."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            report = os.path.join(tmpdir, "mock-statistics.json")
+            statistics = create_statistics("DB", report)
+            timed = statistics.timed("Query", Mock(return_value=None))
+            statistics.start_suite(None, None)
+            statistics.start_suite(None, None)
+            timed()
+            statistics.end_suite(None, Mock(full_name="Top.Child"))
+            timed()
+            self.assertEqual(statistics.summary("Query")["calls"], 2)
+            statistics.end_suite(None, Mock(full_name="Top"))
+
+            with open(report, encoding='utf-8') as file:
+                content = json.load(file)
+        self.assertEqual(content["Top.Child"]["DB"]["Query"]["calls"], 1)
+        self.assertEqual(content["Top"]["DB"]["Query"]["calls"], 2)
+
+    def test_create_statistics(self):
+        """Test statistics are disabled by default and a string names the report."""
+        self.assertIsNone(create_statistics("DB", False))
+        self.assertIsInstance(create_statistics("DB", True), MockStatistics)
+
+
+class TestMockLibraryStatistics(unittest.TestCase):
+    """Tests for the Get Mock Statistics keyword of MockLibrary."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sample_lib = SampleLibrary()
+        self.patcher = patch('MockLibrary._get_library_instance', return_value=self.sample_lib)
+        self.patcher.start()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.patcher.stop()
+
+    def test_get_mock_statistics(self):
+        """Test calls of mocked keywords are timed per keyword."""
+        mock_lib = MockLibrary("DB", statistics=True)
+        mock_lib.mock_keyword("Query", side_effect=lambda statement: statement)
+        for _ in range(3):
+            self.sample_lib.query("SELECT 1")
+        mock_lib.verify_keyword_called("Query", times=3)
+        self.assertEqual(mock_lib.get_mock_statistics()["Query"]["calls"], 3)
+        self.assertEqual(mock_lib.get_mock_statistics("query")["side_effect"]["count"], 3)
+        mock_lib.reset_mocks()
+
+    def test_statistics_disabled(self):
+        """Test the keyword fails when statistics are not collected."""
+        mock_lib = MockLibrary("DB")
+        mock_lib.mock_keyword("Query", return_value="mocked")
+        self.assertNotIsInstance(self.sample_lib.query, TimedMock)
+        with self.assertRaises(RuntimeError):
+            mock_lib.get_mock_statistics()
+        mock_lib.reset_mocks()
+
+
+if __name__ == '__main__':
+    unittest.main()